@@ -0,0 +1,241 @@
+# -*- coding: utf-8 -*-
+"""
+Created on 10/17/26
+
+Benchmark: Timing suite of the core entry points on SyntheticSystem hierarchies of increasing size and sweeps of increasing resolution. Every
+           case is timed as the best of a few repeats, the results are appended to a JSON history, and compared with a stored baseline: a case
+           slower than its baseline time by more than the threshold is reported as a regression. Run it as a script:
+
+               python Benchmark.py --sizes 100 1000 10000 --points 11 101 1001
+               python Benchmark.py --save-baseline          # make this run the reference
+               python Benchmark.py --sizes 1000000 --cases generate updateHierarchy variableSweep
+
+           and it exits with status 1 when there is a regression. Results are keyed "case/components" or "case/components/points", 2D cases
+           sweep about sqrt(points) values of each variable so that points is the number of evaluated points. The import cases time importing
+           the library in a fresh interpreter, without the interpreter startup. memoryPerComponent isn't a time but the bytes a generated system
+           keeps allocated (tracemalloc) divided by its number of components.
+
+Most Recent Update 10/17/26
+    - Created module
+
+Functions:
+    run()
+    record()
+    loadBaseline()
+    saveBaseline()
+    compare()
+    report()
+
+"""
+
+import gc
+import os
+import sys
+import json
+import time
+import argparse
+import platform
+import subprocess
+import tracemalloc
+import numpy as np
+import ComponentFunctions as CF
+import SyntheticSystem
+
+SIZES = (100, 1000, 10000, 100000)
+POINTS = (11, 101, 1001)
+LOOP_LIMIT = 2e6     # largest components * points timed with the loop method
+
+def _setPoints(variable, points):
+    variable.setSweep(np.linspace(0.05, 1.0, points))
+
+def _generate(system, variables, components, points, options):
+    SyntheticSystem.generate(components, seed = options["seed"], **options["shape"])
+
+def _updateHierarchy(system, variables, components, points, options):
+    CF.updateHierarchy(system)
+
+def _getTotalPower(system, variables, components, points, options):
+    # dirty pull after a change of one shared variable
+    for value in (0.25, 0.5):
+        variables[0].setValue(value)
+        system.getTotalPower()
+
+def _variableSweep(system, variables, components, points, options):
+    _setPoints(variables[0], points)
+    CF.variableSweep(system, variables[0])
+
+def _variableSweepLoop(system, variables, components, points, options):
+    _setPoints(variables[0], points)
+    CF.variableSweep(system, variables[0], "loop")
+
+def _variableSweep2D(system, variables, components, points, options):
+    side = max(2, int(round(points ** 0.5)))
+    _setPoints(variables[0], side)
+    _setPoints(variables[1], side)
+    CF.variableSweep2D(system, variables[0], variables[1])
+
+def _tuneVariable(system, variables, components, points, options):
+    _setPoints(variables[0], points)
+    CF.tuneVariable(system, system, variables[0], 3, "Relative")
+    variables[0].setValue(0.5)
+
+def _exchangeVariable(system, variables, components, points, options):
+    side = max(2, int(round(points ** 0.5)))
+    _setPoints(variables[0], side)
+    _setPoints(variables[1], side)
+    CF.exchangeVariable(system, variables[0], variables[1], system.getTotalPower(), 0.01 * system.getTotalPower())
+
+# name -> (function, uses points, runs at components and points)
+CASES = {
+    "generate": (_generate, False, None),
+    "updateHierarchy": (_updateHierarchy, False, None),
+    "getTotalPower": (_getTotalPower, False, None),
+    "variableSweep": (_variableSweep, True, None),
+    "variableSweepLoop": (_variableSweepLoop, True, lambda components, points: components * points <= LOOP_LIMIT),
+    "variableSweep2D": (_variableSweep2D, True, None),
+    "tuneVariable": (_tuneVariable, True, None),
+    "exchangeVariable": (_exchangeVariable, True, None),
+}
+
+# name -> statement timed in a fresh interpreter
+STARTUP = {
+    "importComponentFunctions": "import ComponentFunctions",
+    "importComponentPlots": "import ComponentPlots",
+}
+
+def _importTime(statement):
+    code = "import time; start = time.perf_counter(); " + statement + "; print(time.perf_counter() - start)"
+    out = subprocess.run([sys.executable, "-c", code], cwd = os.path.dirname(os.path.abspath(__file__)), capture_output = True, text = True, check = True)
+    return float(out.stdout)
+
+# name -> measurement of the system of a given size, in other units than seconds
+MEMORY = {
+    "memoryPerComponent": lambda components, seed, shape: _memory(lambda: SyntheticSystem.generate(components, seed = seed, **shape)) / components,
+}
+
+def _memory(function):
+    # bytes still allocated by what function returns
+    gc.collect()
+    tracemalloc.start()
+    try:
+        result = function()
+        gc.collect()
+        size = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    del result
+    return size
+
+def _best(function, repeats):
+    best = float("inf")
+    for r in range(repeats):
+        start = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+def run(sizes = SIZES, points = POINTS, cases = None, repeats = 3, seed = 0, **shape):
+    """
+    run: Return a dictionary of key -> best time in seconds (bytes for MEMORY) of every case (all of STARTUP, MEMORY and CASES by default) on a SyntheticSystem of every size in sizes,
+         and for the cases that sweep, every resolution in points. shape is passed on to SyntheticSystem.generate() (depth, fanOut, ...).
+    """
+    cases = list(STARTUP) + list(MEMORY) + list(CASES) if cases is None else cases
+    options = dict(seed = seed, shape = shape)
+    cache = CF.getResultCache()
+    CF.setResultCache(None)     # time the computation, not the result cache
+    results = {}
+    for name in cases:
+        if name in STARTUP:
+            results[name] = min(_importTime(STARTUP[name]) for r in range(repeats))
+    try:
+        for components in sizes:
+            for name in [name for name in cases if name in MEMORY]:
+                results[name + "/" + str(components)] = MEMORY[name](components, seed, shape)
+            system, variables = SyntheticSystem.generate(components, seed = seed, **shape)
+            for name in [name for name in cases if name in CASES]:
+                function, usesPoints, runs = CASES[name]
+                for n in (points if usesPoints else (None,)):
+                    if runs is not None and not runs(components, n):
+                        continue
+                    key = name + "/" + str(components) + ("/" + str(n) if usesPoints else "")
+                    results[key] = _best(lambda: function(system, variables, components, n, options), repeats)
+    finally:
+        CF.setResultCache(cache)
+    return results
+
+def record(results, path = "benchmark_history.json", label = None):
+    """
+    record: append results to the JSON history at path, with the time, label and versions of the run
+    """
+    history = []
+    if os.path.exists(path):
+        with open(path) as f:
+            history = json.load(f)
+    history.append(dict(time = time.strftime("%Y-%m-%dT%H:%M:%S"), label = label, python = platform.python_version(), numpy = np.__version__,
+                        machine = platform.machine(), results = results))
+    with open(path, "w") as f:
+        json.dump(history, f, indent = 1)
+
+def loadBaseline(path = "benchmark_baseline.json"):
+    if not os.path.exists(path):
+        return None
+    with open(path) as f:
+        return json.load(f)
+
+def saveBaseline(results, path = "benchmark_baseline.json"):
+    with open(path, "w") as f:
+        json.dump(results, f, indent = 1, sort_keys = True)
+
+def compare(results, baseline, threshold = 0.25, minDelta = 1e-3):
+    """
+    compare: list of (key, baseline time, time, ratio) of the cases more than threshold (a fraction) and minDelta seconds slower than baseline
+    """
+    regressions = []
+    for key, seconds in results.items():
+        base = baseline.get(key)
+        if base is not None and seconds > base * (1 + threshold) and seconds - base > minDelta:
+            regressions.append((key, base, seconds, seconds / base))
+    return regressions
+
+def report(results, baseline = None):
+    lines = ["%-40s %12s %12s %8s" % ("case", "s or bytes", "baseline", "ratio")]
+    for key, seconds in results.items():
+        base = baseline.get(key) if baseline is not None else None
+        if base is None:
+            lines.append("%-40s %12.6f" % (key, seconds))
+        else:
+            lines.append("%-40s %12.6f %12.6f %8.2f" % (key, seconds, base, seconds / base))
+    return "\n".join(lines)
+
+def main(argv = None):
+    parser = argparse.ArgumentParser(description = "Time the core entry points on synthetic hierarchies")
+    parser.add_argument("--sizes", type = int, nargs = "+", default = list(SIZES), help = "numbers of components")
+    parser.add_argument("--points", type = int, nargs = "+", default = list(POINTS), help = "sweep resolutions")
+    parser.add_argument("--cases", nargs = "+", choices = list(STARTUP) + list(MEMORY) + list(CASES), default = None)
+    parser.add_argument("--repeats", type = int, default = 3)
+    parser.add_argument("--seed", type = int, default = 0)
+    parser.add_argument("--depth", type = int, default = 4)
+    parser.add_argument("--fan-out", type = int, default = 8)
+    parser.add_argument("--history", default = "benchmark_history.json")
+    parser.add_argument("--baseline", default = "benchmark_baseline.json")
+    parser.add_argument("--save-baseline", action = "store_true", help = "store this run as the baseline")
+    parser.add_argument("--threshold", type = float, default = 0.25, help = "slowdown flagged as a regression, as a fraction")
+    parser.add_argument("--label", default = None, help = "label of the run in the history")
+    args = parser.parse_args(argv)
+
+    results = run(args.sizes, args.points, args.cases, args.repeats, args.seed, depth = args.depth, fanOut = args.fan_out)
+    record(results, args.history, args.label)
+    baseline = loadBaseline(args.baseline)
+    print(report(results, baseline))
+    if args.save_baseline:
+        saveBaseline(results, args.baseline)
+        return 0
+    if baseline is None:
+        return 0
+    regressions = compare(results, baseline, args.threshold)
+    for key, base, seconds, ratio in regressions:
+        print("REGRESSION", key, "%.6f s -> %.6f s (x%.2f)" % (base, seconds, ratio))
+    return 1 if regressions else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
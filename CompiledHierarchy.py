@@ -0,0 +1,594 @@
+# -*- coding: utf-8 -*-
+"""
+Created on 10/16/26
+
+CompiledHierarchy class: Flattens a hierarchy of Component, ComponentGroup, VoltageRegulator (and LogicalGroup) objects into NumPy arrays
+                         so the power of every node can be computed with a handful of vectorized passes instead of a recursive walk
+                         over Python objects. The arithmetic mirrors updateTotalPower()/updateInactivePower() of each class operation by
+                         operation, so the results match updateHierarchy() exactly.
+
+Most Recent Update 10/17/26
+    - Created class
+    - Compiling with variables keeps only the branch that depends on them; other subtrees become constant leaves
+    - resolveBatch() can return the power of any nodes; carryLastPoint() lets a sweep be evaluated as a stream of batches
+    - Messages go through Log; batches count rejected setter values like the setters do
+
+"""
+
+import numpy as np
+from Component import Component
+from ComponentGroup import ComponentGroup
+from VoltageRegulator import VoltageRegulator
+from LogicalGroup import LogicalGroup
+import Log
+
+# Node kind codes
+LEAF_POWER = 0
+LEAF_IV = 1
+GROUP_POWER = 2
+GROUP_IV = 3
+REG_POWER = 4
+REG_IV = 5
+
+class CompiledHierarchy():
+    """ Struct-of-arrays snapshot of a component hierarchy
+        Attributes:
+            - root: the top level component-like object that was compiled
+            - nodes: list of every component-like object in breadth-first (topological) order, root first. When compiled with variables, only
+                     the components using them and their ancestors are kept; the other children become constant leaves with node None
+            - constTotal, constInactive: (float arrays) TotalPower/InactivePower of constant leaves (nan otherwise)
+            - kind: (int array) node kind code per node (LEAF_POWER, LEAF_IV, GROUP_POWER, GROUP_IV, REG_POWER, REG_IV)
+            - parent: (int array) index of the parent node, -1 for the root
+            - depth: (int array) number of levels below the root
+            - order: (int array) node indices from the deepest level to the root, the order in which nodes are resolved
+            - ActiveVal, InactiveVal: (float arrays) per-leaf active/inactive power (POWER) or current (IV)
+            - VDD: (float array) leaf and ComponentGroup VDD
+            - DutyCycle: (float array) per-leaf duty cycle
+            - Efficiency, VIN, VOUT, RegCurrent, RegPower: (float arrays) per-regulator settings
+            - FixedTotal, FixedInactive: (float arrays) power of leaves whose CurrentModel assigns TotalPower/TotalCurrent directly (nan otherwise)
+            - TotalPower, InactivePower, LoadPower, InactiveLoadPower, EffLossPower: (float arrays) results of the last evaluate()
+        Methods:
+            readLeaves() - reload the per-node parameters from the objects
+            runModels() - run the CurrentModel of every model-driven leaf and reload those leaves
+            evaluate() - recompute the power of every node with vectorized passes
+            evaluateBatch() - TotalPower of the root for a batch of Variable values, without touching the objects
+            affectedLeaves(), runModelsBatch(), applyBatch(), resolveBatch() - the stages of evaluateBatch(), e.g. to spread them over processes
+            applyLastPoint() - store the swept leaf attributes of the last batch point in the objects
+            carryLastPoint() - start the next batch from the last point of this one, as a point-by-point sweep would
+            writeBack() - push the results of the last evaluate() back into the objects
+            getIndex() - return the node index of a component-like object
+            getTotalPower() - return TotalPower of the root
+            getInactivePower() - return InactivePower of the root
+    """
+
+    def __init__(self, root, variables = None):
+        self.root = root
+        self.nodes = []
+        parents = []
+        depths = []
+        kinds = []
+        constTotal = []
+        constInactive = []
+        active = None if variables is None else self._activeSet(variables)
+        queue = [(root, -1, 0)]
+        head = 0
+        while head < len(queue):   # breadth-first, so every level is contiguous and siblings stay in order
+            node, parentIndex, depth = queue[head]
+            head += 1
+            index = len(self.nodes)
+            parents.append(parentIndex)
+            depths.append(depth)
+            if isinstance(node, tuple):   # constant leaf standing in for children that don't depend on variables
+                self.nodes.append(None)
+                kinds.append(LEAF_POWER)
+                constTotal.append(node[0])
+                constInactive.append(node[1])
+                continue
+            self.nodes.append(node)
+            kinds.append(self._kindOf(node))
+            constTotal.append(np.nan)
+            constInactive.append(np.nan)
+            if isinstance(node, Component):
+                continue
+            children = list(node.components) + list(node.componentGroups) + list(node.voltageRegulators)
+            if active is None:
+                for child in children:
+                    queue.append((child, index, depth + 1))
+                continue
+            # Children in front of the first affected one are merged into their running sum, which is exactly the partial sum
+            # updateTotalPower() reaches at that point; later unaffected children are kept one by one to preserve the summation order
+            k = 0
+            prefixTotal = 0.0
+            prefixInactive = 0.0
+            while k < len(children) and id(children[k]) not in active:
+                prefixTotal = prefixTotal + children[k].getTotalPower()
+                prefixInactive = prefixInactive + children[k].getInactivePower()
+                k += 1
+            if k > 0:
+                queue.append(((prefixTotal, prefixInactive), index, depth + 1))
+            for child in children[k:]:
+                if id(child) in active:
+                    queue.append((child, index, depth + 1))
+                else:
+                    queue.append(((child.getTotalPower(), child.getInactivePower()), index, depth + 1))
+        self.constTotal = np.array(constTotal)
+        self.constInactive = np.array(constInactive)
+
+        self.index = {id(node): i for i, node in enumerate(self.nodes) if node is not None}
+        self.kind = np.array(kinds, dtype=np.int8)
+        self.parent = np.array(parents, dtype=np.int64)
+        self.depth = np.array(depths, dtype=np.int64)
+        self.order = np.argsort(-self.depth, kind="stable")
+        self.leafPower = np.flatnonzero(self.kind == LEAF_POWER)
+        self.leafIV = np.flatnonzero(self.kind == LEAF_IV)
+        self.leaves = np.flatnonzero(self.kind <= LEAF_IV)
+        self.modelLeaves = [i for i in self.leaves if self.nodes[i] is not None and self.nodes[i].hasCurrentModel()]
+
+        # Per level, the internal nodes of every kind and the slice of nodes to accumulate into their parents
+        maxDepth = int(self.depth.max())
+        self.levels = []
+        for d in range(maxDepth, -1, -1):
+            members = np.flatnonzero(self.depth == d)
+            # rank of every member among its siblings; members of equal rank have distinct parents
+            rank = np.zeros(len(members), dtype=np.int64)
+            if d > 0:
+                first = np.ones(len(members), dtype=bool)
+                first[1:] = self.parent[members[1:]] != self.parent[members[:-1]]
+                starts = np.flatnonzero(first)
+                rank = np.arange(len(members)) - np.repeat(starts, np.diff(np.append(starts, len(members))))
+            self.levels.append(dict(
+                members = members,
+                ranks = [members[rank == r] for r in range(int(rank.max()) + 1)] if rank.max() < 64 else None,
+                groupPower = members[self.kind[members] == GROUP_POWER],
+                groupIV = members[self.kind[members] == GROUP_IV],
+                regPower = members[self.kind[members] == REG_POWER],
+                regIV = members[self.kind[members] == REG_IV]
+            ))
+
+        # (child, parent) pairs that the object model passes through checkVDD()
+        checkChild = []
+        checkParent = []
+        for i in range(1, len(self.nodes)):
+            p = self.parent[i]
+            if self.nodes[i] is None: continue
+            if (self.kind[p] == GROUP_IV and self.nodes[p].checkVDDFlag) or self.kind[p] == REG_IV:
+                checkChild.append(i)
+                checkParent.append(p)
+        self.checkChild = np.array(checkChild, dtype=np.int64)
+        self.checkParent = np.array(checkParent, dtype=np.int64)
+
+        self.readLeaves()
+        self.TotalPower = np.zeros(len(self.nodes))
+        self.InactivePower = np.zeros(len(self.nodes))
+        self.LoadPower = np.zeros(len(self.nodes))
+        self.InactiveLoadPower = np.zeros(len(self.nodes))
+        self.EffLossPower = np.zeros(len(self.nodes))
+
+    @staticmethod
+    def _activeSet(variables):
+        """
+        _activeSet: ids of the components whose CurrentModel uses one of the variables and of everything above them, following the
+                    Variable -> Model -> Component links and the parent pointers
+        """
+        active = set()
+        stack = [comp for var in variables for comp in var.getDependents()]
+        while stack:
+            node = stack.pop()
+            if id(node) in active: continue
+            active.add(id(node))
+            stack.extend(node.getParents())
+        return active
+
+    @staticmethod
+    def _kindOf(node):
+        if isinstance(node, Component):
+            if node.Type == "POWER": return LEAF_POWER
+            elif node.Type == "IV": return LEAF_IV
+        elif isinstance(node, VoltageRegulator):
+            if node.Type == "POWER": return REG_POWER
+            elif node.Type == "IV": return REG_IV
+        elif isinstance(node, ComponentGroup):
+            if node.Type == "POWER": return GROUP_POWER
+            elif node.Type == "IV": return GROUP_IV
+        elif isinstance(node, LogicalGroup):
+            return GROUP_POWER
+        raise ValueError("CompiledHierarchy: " + str(node.getName()) + " has no valid Type")
+
+    @staticmethod
+    def _float(value):
+        if value is None: return np.nan
+        return value
+
+    def readLeaves(self):
+        """
+        readLeaves: reload every per-node parameter from the objects, e.g. after calling setters on them
+        """
+        n = len(self.nodes)
+        self.ActiveVal = np.full(n, np.nan)
+        self.InactiveVal = np.full(n, np.nan)
+        self.VDD = np.full(n, np.nan)
+        self.DutyCycle = np.full(n, np.nan)
+        self.FixedTotal = np.full(n, np.nan)
+        self.FixedInactive = np.full(n, np.nan)
+        self.Efficiency = np.full(n, np.nan)
+        self.VIN = np.full(n, np.nan)
+        self.VOUT = np.full(n, np.nan)
+        self.RegCurrent = np.full(n, np.nan)
+        self.RegPower = np.full(n, np.nan)
+        for i, node in enumerate(self.nodes):
+            k = self.kind[i]
+            if node is None:
+                self.FixedTotal[i] = self.constTotal[i]
+                self.FixedInactive[i] = self.constInactive[i]
+            elif k <= LEAF_IV:
+                self._readLeaf(i)
+            elif k <= GROUP_IV:
+                if not isinstance(node, LogicalGroup):
+                    self.VDD[i] = self._float(node.getVDD())
+            else:
+                self.Efficiency[i] = self._float(node.Efficiency)
+                self.VIN[i] = self._float(node.VIN)
+                self.VOUT[i] = self._float(node.VOUT)
+                self.RegCurrent[i] = self._float(node.RegCurrent)
+                self.RegPower[i] = self._float(node.RegPower)
+
+    def _readLeaf(self, i):
+        comp = self.nodes[i]
+        if self.kind[i] == LEAF_POWER:
+            self.ActiveVal[i] = comp.ActivePower
+            self.InactiveVal[i] = comp.InactivePower
+        else:
+            self.ActiveVal[i] = comp.ActiveCurrent
+            self.InactiveVal[i] = comp.InactiveCurrent
+        self.VDD[i] = self._float(comp.VDD)
+        self.DutyCycle[i] = comp.DutyCycle
+        if self._isFixed(i):
+            self.FixedTotal[i] = comp.TotalPower
+            self.FixedInactive[i] = comp.InactivePower
+        else:
+            self.FixedTotal[i] = np.nan
+            self.FixedInactive[i] = np.nan
+
+    def _isFixed(self, i):
+        # True when the leaf's CurrentModel assigns TotalPower (POWER) or TotalCurrent (IV) directly, see Component.updateTotalPower()
+        comp = self.nodes[i]
+        if not comp.hasCurrentModel(): return False
+        if self.kind[i] == LEAF_POWER: return "TotalPower" in comp.CurrentModel.getAttrs()
+        return "TotalCurrent" in comp.CurrentModel.getAttrs()
+
+    def runModels(self, skip = ()):
+        """
+        runModels: run the CurrentModel of every model-driven leaf (except the indices in skip), the same way updateTotalPower() does, and reload those leaves
+        """
+        for i in self.modelLeaves:
+            if i in skip: continue
+            self.nodes[i].runModel()
+            self._readLeaf(i)
+
+    def checkVDD(self):
+        """
+        checkVDD: vectorized version of the checkVDD() methods of ComponentGroup (IV, checkVDDFlag set) and VoltageRegulator (IV)
+        """
+        if len(self.checkChild) == 0: return
+        childV = np.where(self.kind[self.checkChild] >= REG_POWER, self.VIN[self.checkChild], self.VDD[self.checkChild])
+        parentV = np.where(self.kind[self.checkParent] >= REG_POWER, self.VOUT[self.checkParent], self.VDD[self.checkParent])
+        bad = np.flatnonzero(childV != parentV)
+        if len(bad) > 0:
+            child = self.nodes[self.checkChild[bad[0]]]
+            parent = self.nodes[self.checkParent[bad[0]]]
+            Log.error(child.getName(), "VDD/VIN,", childV[bad[0]], ", doesn't match", parent.getName(), "VDD/VOUT,", parentV[bad[0]])
+            assert (False)
+
+    @staticmethod
+    def _leafPower(kind, A, I, V, D):
+        # Same operations as Component.updateTotalPower(), returns (TotalPower, InactivePower)
+        if kind == LEAF_POWER:
+            return I + (A - I) * D, I
+        return V * (I + (A - I) * D), I * V
+
+    def _column(self, name):
+        return getattr(self, name)[:, None]
+
+    def _fillLeaves(self, total, inactive):
+        for kind, idx in ((LEAF_POWER, self.leafPower), (LEAF_IV, self.leafIV)):
+            total[idx], inactive[idx] = self._leafPower(kind, self.ActiveVal[idx, None], self.InactiveVal[idx, None],
+                                                        self.VDD[idx, None], self.DutyCycle[idx, None])
+        fixed = np.flatnonzero(~np.isnan(self.FixedTotal))
+        total[fixed] = self.FixedTotal[fixed, None]
+        inactive[fixed] = self.FixedInactive[fixed, None]
+
+    def _resolve(self, total, inactive):
+        """
+        _resolve: fill in the internal nodes of (nodes, width) arrays whose leaf rows are set. Levels are resolved from the deepest up; siblings are
+                  contiguous and in child order, so np.add.at accumulates them in the same order as the loops in updateTotalPower().
+        """
+        childTotal = np.zeros(total.shape)
+        childInactive = np.zeros(total.shape)
+        load = np.zeros(total.shape)
+        inactiveLoad = np.zeros(total.shape)
+        effLoss = np.zeros(total.shape)
+        eff = self._column("Efficiency")
+        for level in self.levels:
+            g = np.concatenate((level["groupPower"], level["groupIV"]))
+            total[g] = childTotal[g]
+            inactive[g] = childInactive[g]
+            r = level["regPower"]
+            if len(r) > 0:
+                load[r] = childTotal[r]
+                inactiveLoad[r] = childInactive[r]
+                effLoss[r] = load[r] / eff[r] - load[r]
+                total[r] = self.RegPower[r, None] + load[r] / eff[r]
+                inactive[r] = self.RegPower[r, None] + inactiveLoad[r] / eff[r]
+            r = level["regIV"]
+            if len(r) > 0:
+                vin = self.VIN[r, None]
+                vout = self.VOUT[r, None]
+                regCurrent = self.RegCurrent[r, None]
+                load[r] = childTotal[r]
+                inactiveLoad[r] = childInactive[r]
+                effLoss[r] = load[r] / eff[r] - load[r]
+                total[r] = regCurrent * vin + (load[r] / vout) * vout / eff[r]
+                inactive[r] = regCurrent * vin + (inactiveLoad[r] / vout) * vout / eff[r]
+            members = level["members"]
+            if members[0] == 0:
+                continue
+            if level["ranks"] is not None:   # one fancy-indexed add per sibling rank, in child order
+                for m in level["ranks"]:
+                    childTotal[self.parent[m]] += total[m]
+                    childInactive[self.parent[m]] += inactive[m]
+            else:
+                np.add.at(childTotal, self.parent[members], total[members])
+                np.add.at(childInactive, self.parent[members], inactive[members])
+        return load, inactiveLoad, effLoss
+
+    def evaluate(self, runModels = True):
+        """
+        evaluate: recompute TotalPower/InactivePower for every node (and LoadPower/EffLossPower for regulators). Leaves are computed in one
+                  pass, then each level of internal nodes is resolved from the deepest up with one segment-sum into the parents. Returns TotalPower
+                  of the root.
+        """
+        if runModels:
+            self.runModels()
+        self.checkVDD()
+        n = len(self.nodes)
+        total = np.zeros((n, 1))
+        inactive = np.zeros((n, 1))
+        self._fillLeaves(total, inactive)
+        load, inactiveLoad, effLoss = self._resolve(total, inactive)
+        self.TotalPower = total[:, 0]
+        self.InactivePower = inactive[:, 0]
+        self.LoadPower = load[:, 0]
+        self.InactiveLoadPower = inactiveLoad[:, 0]
+        self.EffLossPower = effLoss[:, 0]
+        return self.TotalPower[0]
+
+    @staticmethod
+    def _hold(newVals, accepted, initial):
+        # Sequential setter semantics: a rejected value leaves the previously accepted one in place
+        newVals = np.concatenate(([initial], newVals))
+        accepted = np.concatenate(([True], accepted))
+        idx = np.where(accepted, np.arange(len(newVals)), 0)
+        np.maximum.accumulate(idx, out=idx)
+        return newVals[idx][1:]
+
+    def _applyAttr(self, i, attr, v, params, later = None, report = True):
+        """
+        _applyAttr: vectorized Component.setAttr() for leaf i over an array of model outputs, including the validation of each setter. params holds
+                    the per-point leaf parameters set by earlier attributes of the same model and is updated in place; later holds the parameters
+                    the model sets after attr, which attr sees with the value of the previous point. Rejected values are counted (see
+                    Log.countRejections()) and negative ActivePowers get the warning of setActivePower() unless report is False.
+        """
+        def hold(v, accepted, initial):
+            if report and Log.counting:
+                Log.countRejected(self.nodes[i], attr, int(np.count_nonzero(~accepted)))
+            return self._hold(v, accepted, initial)
+        def get(name):
+            if name in params: return params[name]
+            if later and name in later: return np.concatenate(([getattr(self, name)[i]], later[name][:-1]))
+            return getattr(self, name)[i]
+        if self.kind[i] == LEAF_POWER:
+            if attr == "TotalPower":
+                params["FixedTotal"] = v
+                return
+            elif attr == "ActivePower":
+                if report and Log.level <= Log.WARNING:
+                    name = self.nodes[i].getName()
+                    for value in v[v < 0].tolist():
+                        Log.warning(name + ":", "ActivePower", value, "is less than 0 - applied anyway.", component = name, attr = "ActivePower", value = value)
+                params["ActiveVal"] = hold(v, ~((v >= 0) & (v < get("InactiveVal"))), self.ActiveVal[i])   # setActivePower() keeps negative values
+                return
+            elif attr == "InactivePower":
+                params["InactiveVal"] = hold(v, v >= 0, self.InactiveVal[i])
+                return
+        else:
+            if attr == "TotalCurrent":
+                params["FixedTotal"] = v * get("VDD")
+                return
+            elif attr == "ActiveCurrent":
+                params["ActiveVal"] = hold(v, v >= 0, self.ActiveVal[i])
+                return
+            elif attr == "InactiveCurrent":   # Component.setInactiveCurrent() assigns ActiveCurrent
+                params["ActiveVal"] = hold(v, v >= 0, self.ActiveVal[i])
+                return
+            elif attr == "VDD":
+                params["VDD"] = hold(v, v >= 0, self.VDD[i])
+                return
+        if attr == "DutyCycle":
+            params["DutyCycle"] = hold(v, (v <= 1) & (v >= 0), self.DutyCycle[i])
+            return
+        Log.error("Component class: AttrKey not valid")
+
+    def evaluateBatch(self, values, chunkSize = None):
+        """
+        evaluateBatch: TotalPower of the root for a batch of points without touching the objects. values maps Variable objects to arrays that
+                       broadcast against each other (e.g. the outputs of np.ix_ for a grid); the result has the broadcast shape. Models whose
+                       Variables are swept (found through Variable.getModels() and Model.getComponents()) are evaluated once on the arrays, the
+                       other models run once, and the hierarchy is resolved for chunks of points with (nodes, chunk) arrays. Compile with the swept
+                       variables to resolve only the affected branch. Results match running updateHierarchy() at every point in C order, including
+                       setters that reject a value.
+        """
+        values = {var: np.asarray(vals, dtype=float) for var, vals in values.items()}
+        shape = np.broadcast_shapes(*[vals.shape for vals in values.values()])
+        size = int(np.prod(shape))
+        affected = self.affectedLeaves(values)
+        self.runModels(skip = affected)
+        overrides = self.applyBatch(self.runModelsBatch(affected, values, shape))
+        if chunkSize is None:
+            chunkSize = max(1, 4000000 // len(self.nodes))
+        result = np.empty(size)
+        for start in range(0, size, chunkSize):
+            stop = min(start + chunkSize, size)
+            result[start:stop] = self.resolveBatch(overrides, start, stop)
+        return result.reshape(shape)
+
+    def affectedLeaves(self, values):
+        """
+        affectedLeaves: sorted indices of the leaves whose CurrentModel uses one of the Variables in values, from the Variable -> Model -> Component links
+        """
+        return sorted({self.index[id(comp)] for var in values for model in var.getModels() for comp in model.getComponents()
+                       if id(comp) in self.index and comp.CurrentModel is model})
+
+    def runModelsBatch(self, affected, values, shape):
+        """
+        runModelsBatch: evaluate the CurrentModel of every affected leaf once on values with Model.runFunctionArray() (see evaluateBatch()). Returns a
+                        dict of flattened model outputs (a dict of them per attribute for multi-output models) per leaf index; leaves sharing a model
+                        share the arrays.
+        """
+        outputs = {}
+        byModel = {}
+        for i in affected:
+            model = self.nodes[i].CurrentModel
+            if id(model) not in byModel:
+                byModel[id(model)] = model.runFunctionArray(values, shape)
+            outputs[i] = byModel[id(model)]
+        return outputs
+
+    def applyBatch(self, outputs):
+        """
+        applyBatch: turn the model outputs of runModelsBatch() into the per-point leaf parameters they set, with the validation of every setter
+                    applied in point order, and check swept VDDs against their rails. Also records the last point for applyLastPoint().
+                    Returns a dict of {parameter name: array} per leaf index.
+        """
+        overrides = {}
+        for i, v in outputs.items():
+            model = self.nodes[i].CurrentModel
+            overrides[i] = {}
+            attrs = model.getAttrs()
+            for k, attr in enumerate(attrs):   # in the order Component.runModel() applies them
+                later = {}
+                for laterAttr in attrs[k + 1:]:
+                    if laterAttr == ("InactivePower" if self.kind[i] == LEAF_POWER else "VDD"):   # the setter other setters read
+                        self._applyAttr(i, laterAttr, v[laterAttr], later, report = False)
+                self._applyAttr(i, attr, v[attr] if model.isMultiOutput() else v, overrides[i], later)
+        self.checkVDD()
+        for i in overrides:   # per-point check of swept VDDs against the parent rail
+            if "VDD" in overrides[i] and i in self.checkChild:
+                p = self.checkParent[np.flatnonzero(self.checkChild == i)[0]]
+                rail = self.VOUT[p] if self.kind[p] >= REG_POWER else self.VDD[p]
+                if np.any(overrides[i]["VDD"] != rail):
+                    Log.error(self.nodes[i].getName(), "VDD doesn't match", self.nodes[p].getName(), "VDD/VOUT,", rail)
+                    assert (False)
+        self.lastPoint = {i: {name: vals[-1] for name, vals in params.items() if len(vals) > 0} for i, params in overrides.items()}
+        return overrides
+
+    def resolveBatch(self, overrides, start, stop, rows = None):
+        """
+        resolveBatch: TotalPower of the root for points start to stop, with the leaf parameters of applyBatch() and every other leaf as last read.
+                      With rows (node indices), returns a (len(rows), points) array of the TotalPower of those nodes instead.
+        """
+        n = len(self.nodes)
+        baseTotal = np.zeros((n, 1))
+        baseInactive = np.zeros((n, 1))
+        self._fillLeaves(baseTotal, baseInactive)
+        total = np.repeat(baseTotal, stop - start, axis=1)
+        inactive = np.repeat(baseInactive, stop - start, axis=1)
+        for i, params in overrides.items():
+            if len(params) == 0: continue
+            chunk = {name: vals[start:stop] for name, vals in params.items()}
+            if "FixedTotal" in chunk:
+                total[i] = chunk["FixedTotal"]
+            else:
+                total[i], inactive[i] = self._leafPower(self.kind[i], chunk.get("ActiveVal", self.ActiveVal[i]), chunk.get("InactiveVal", self.InactiveVal[i]),
+                                                        chunk.get("VDD", self.VDD[i]), chunk.get("DutyCycle", self.DutyCycle[i]))
+        self._resolve(total, inactive)
+        if rows is not None:
+            return total[rows]
+        return total[0]
+
+    def applyLastPoint(self):
+        """
+        applyLastPoint: after evaluateBatch(), store the swept leaf attributes of the last point in the objects, which is the state a point-by-point
+                        sweep leaves behind (it matters when a setter rejects a value)
+        """
+        for i, params in self.lastPoint.items():
+            comp = self.nodes[i]
+            for name, val in params.items():
+                if name == "ActiveVal":
+                    if self.kind[i] == LEAF_POWER: comp.ActivePower = val
+                    else: comp.ActiveCurrent = val
+                elif name == "InactiveVal":
+                    comp.InactivePower = val
+                elif name == "VDD":
+                    comp.VDD = val
+                elif name == "DutyCycle":
+                    comp.DutyCycle = val
+
+    def carryLastPoint(self):
+        """
+        carryLastPoint: after applyBatch(), make the swept leaf parameters of its last point the starting state of the next applyBatch(), so a sweep
+                        split into consecutive batches holds rejected values across them exactly like one batch
+        """
+        for i, params in self.lastPoint.items():
+            for name, val in params.items():
+                if name != "FixedTotal":
+                    getattr(self, name)[i] = val
+
+    def writeBack(self):
+        """
+        writeBack: push the results of the last evaluate() into the objects so their getters report the same values updateHierarchy() would give,
+                   and clear their dirty flags
+        """
+        for i, node in enumerate(self.nodes):
+            k = self.kind[i]
+            if node is None:
+                continue
+            elif k == LEAF_POWER:
+                node.TotalPower = self.TotalPower[i]
+            elif k == LEAF_IV:
+                if np.isnan(self.FixedTotal[i]):
+                    node.TotalCurrent = self.InactiveVal[i] + (self.ActiveVal[i] - self.InactiveVal[i]) * self.DutyCycle[i]
+                    node.ActivePower = self.ActiveVal[i] * self.VDD[i]
+                    node.InactivePower = self.InactiveVal[i] * self.VDD[i]
+                node.TotalPower = self.TotalPower[i]
+            elif k <= GROUP_IV:
+                node.TotalPower = self.TotalPower[i]
+                node.InactivePower = self.InactivePower[i]
+                if k == GROUP_IV:
+                    node.TotalCurrent = node.TotalPower / node.VDD
+                    node.InactiveCurrent = node.InactivePower / node.VDD
+            else:
+                node.LoadPower = self.LoadPower[i]
+                node.InactiveLoadPower = self.InactiveLoadPower[i]
+                node.EffLossPower = self.EffLossPower[i]
+                node.EffLossInactivePower = node.InactiveLoadPower / node.Efficiency - node.InactiveLoadPower
+                if k == REG_IV:
+                    node.LoadCurrent = node.LoadPower / node.VOUT
+                    node.InactiveLoadCurrent = node.InactiveLoadPower / node.VOUT
+                    node.EffLossCurrent = node.LoadCurrent / node.Efficiency - node.LoadCurrent
+                    node.EffLossInactiveCurrent = node.InactiveLoadCurrent / node.Efficiency - node.InactiveLoadCurrent
+                    node.RegPower = node.VIN * node.RegCurrent
+                node.TotalPower = self.TotalPower[i]
+                node.InactivePower = self.InactivePower[i]
+                if k == REG_IV:
+                    node.TotalCurrent = node.TotalPower / node.VIN
+                    node.InactiveCurrent = node.InactivePower / node.VIN
+            node.dirty = False
+
+    def getIndex(self, node):
+        return self.index[id(node)]
+
+    def getTotalPower(self):
+        return self.TotalPower[0]
+
+    def getInactivePower(self):
+        return self.InactivePower[0]
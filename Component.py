@@ -3,13 +3,59 @@
 Created on 6/26/20
 @author: Henry Bishop and Katy Flynn
 
-Most Recent Update 7/4/20:
+Most Recent Update 10/17/26:
+- a Component is a handle on a slot of a LeafStore block: its numbers, Type and dirty flag live in shared typed arrays and its Models only
+  exist once it has some, about half the memory per component (the handle and its name remain)
+- markDirty() walks up the containers iteratively (NodeLinks), so hierarchies of any depth work
+- containers are held as weak references, so a thrown away container no longer stays registered
+- messages go through Log: updateTotalPower() traces are debug messages, rejected setter values are warnings that can be counted instead
+- runModel() applies every attribute of a multi-output model
+- setCurrentModel() registers the component with its model, so changing a Variable marks it dirty
+
+Update 10/16/26:
+- setters mark the component dirty, getTotalPower() recomputes it (and its ancestors) lazily
+
+Update 7/4/20:
 - added setAttr and getAttr
 
 ** Mode-related capability is legacy
 """
 # from ComponentMode import ComponentMode
 from Variable import Variable
+import Log
+import NodeLinks
+import LeafStore
+
+class _NewModels(dict):
+    """ Models of a component without models: an empty dictionary that becomes the component's own when a model is stored in it
+    """
+    __slots__ = ("owner",)
+
+    def __init__(self, owner):
+        self.owner = owner
+
+    def _adopt(self):
+        if self.owner is not None and not self.owner.Models:   # unless the component got models another way meanwhile
+            self.owner.Models = self
+            self.owner = None
+
+    def __setitem__(self, key, value):
+        self._adopt()
+        dict.__setitem__(self, key, value)
+
+    def setdefault(self, key, default = None):
+        self._adopt()
+        return dict.setdefault(self, key, default)
+
+    def update(self, *args, **kwargs):
+        self._adopt()
+        dict.update(self, *args, **kwargs)
+
+    def __reduce__(self):
+        return (dict, (), None, None, iter(self.items()))    # pickled and copied as a plain dictionary
+
+_TOTAL_POWER = LeafStore.position("TotalPower")
+_INACTIVE_POWER = LeafStore.position("InactivePower")
 
 class Component:
     """ base class for leaf components in a hierarchical component definition
@@ -26,6 +72,8 @@ class Component:
             Type: (string) either "POWER" or "IV" to denote if Component is defined with only Power or Voltage/Current
             Modes: (dict) a dictionary of ComponentModes (and children) in which the component can operate
             CurrentModeName: (string) the name of the current mode
+            parents: (tuple) weak references to the ComponentGroups, VoltageRegulators and LogicalGroups that contain this component, see getParents()
+            dirty: (bool) True when a setter changed the component since TotalPower was last computed
         Class Methods:
             PDef() - For defining component in terms of power
             IVDef() - For defining component in terms of voltage/current
@@ -57,8 +105,42 @@ class Component:
 
             setAttr() - based on string input with same characters as attribute, call the set function for that attribute
             getAttr() - based on string input with same characters as attribute, call the get function for that attribute
+
+            addParent() - register a container of this component
+            removeParent() - unregister a container of this component
+            getParents() - return the containers of this component
+            markDirty() - flag the component and all of its ancestors for recomputation
+            isDirty() - return dirty flag
     """
-        
+
+    # A handle on a slot of a LeafStore block, which holds the numbers in typed arrays: this matters for systems of millions of components
+    __slots__ = ("name", "parents", "_block", "_slot", "__weakref__")
+
+    ActivePower = LeafStore.number("ActivePower")
+    InactivePower = LeafStore.number("InactivePower")
+    ActiveCurrent = LeafStore.number("ActiveCurrent")
+    InactiveCurrent = LeafStore.number("InactiveCurrent")
+    VDD = LeafStore.number("VDD")
+    DutyCycle = LeafStore.number("DutyCycle")
+    TotalPower = LeafStore.number("TotalPower")
+    TotalCurrent = LeafStore.number("TotalCurrent")
+    Type = LeafStore.Type
+    dirty = LeafStore.dirty
+    Models = LeafStore.attribute(0, _NewModels)
+    CurrentModel = LeafStore.attribute(1)
+    CurrentModelVal = LeafStore.attribute(2)
+
+    def __new__(cls, *args, **kwargs):
+        self = super().__new__(cls)
+        self._block, self._slot = LeafStore.allocate()
+        return self
+
+    def __del__(self):
+        try:
+            LeafStore.release(self._block, self._slot)
+        except (AttributeError, TypeError):     # at interpreter shutdown
+            pass
+
     def __init__(self, name = None, ActivePower = 0.0, InactivePower = 0.0, ActiveCurrent = None, InactiveCurrent = None, VDD = None, DutyCycle = 0.0, Models = []):
         self.name = name
         self.ActivePower = ActivePower
@@ -70,23 +152,24 @@ class Component:
         self.TotalPower = 0.0
         self.TotalCurrent = 0.0
         self.Type = None
-        self.Models = {}
         self.CurrentModel = None
         self.CurrentModelVal = None
+        self.parents = ()
+        self.dirty = False
         self.addModels(Models)
 
     @classmethod
     def PDef(cls, name, ActivePower, InactivePower, DutyCycle, Models = []):
         newComponent = cls(name = name, ActivePower = ActivePower, InactivePower = InactivePower, DutyCycle = DutyCycle, Models = Models)
         newComponent.Type = "POWER"
-        newComponent.updateTotalPower(verbose=True)
+        newComponent.updateTotalPower()
         return newComponent
 
     @classmethod
     def IVDef(cls, name, ActiveCurrent, InactiveCurrent, VDD, DutyCycle, Models = []):
         newComponent = cls(name = name, ActiveCurrent = ActiveCurrent, InactiveCurrent = InactiveCurrent, VDD = VDD, DutyCycle = DutyCycle, Models = Models)
         newComponent.Type = "IV"
-        newComponent.updateTotalPower(verbose=True)
+        newComponent.updateTotalPower()
         return newComponent
         
     def displayName( self ):
@@ -104,7 +187,10 @@ class Component:
         return self.ActivePower
 
     def getInactivePower(self):
-        return self.InactivePower
+        block = self._block     # read directly, the containers call this and getTotalPower() for every child
+        if block.dirty[self._slot]: self.updateTotalPower()
+        at = _INACTIVE_POWER + self._slot
+        return block.values[at] if block.kinds[at] == LeafStore.FLOAT else block.get(at)
 
     def getActiveCurrent(self):
         return self.ActiveCurrent
@@ -119,104 +205,127 @@ class Component:
         return self.DutyCycle
 
     def getTotalPower(self):
-        return self.TotalPower
+        block = self._block
+        if block.dirty[self._slot]: self.updateTotalPower()
+        at = _TOTAL_POWER + self._slot
+        return block.values[at] if block.kinds[at] == LeafStore.FLOAT else block.get(at)
 
     def getTotalCurrent(self):
+        if self.dirty: self.updateTotalPower()
         return self.TotalCurrent
 
     def setName(self, newName):
         self.name = newName
+        NodeLinks.markParentsTopologyChanged(self)
 
     def setActivePower( self, NewActivePower ):
         """ setActivePower - update the ActivePower to a positive value greater than the InactivePower
             update the TotalPower accordingly
         """
-        if ( NewActivePower < 0 ):
-            print( NewActivePower, " is less than 0 - no update.")
+        if ( NewActivePower < 0 ):   # kept, as it always was, but reported
+            Log.warning(self.getName() + ":", "ActivePower", NewActivePower, "is less than 0 - applied anyway.", component = self.getName(), attr = "ActivePower", value = NewActivePower)
         elif ( NewActivePower < self.InactivePower ):
-            print( NewActivePower, " is less than the sleep power (", self.InactivePower, ") - no update.")
+            Log.reject(self, "ActivePower", NewActivePower, "is less than the sleep power (" + str(self.InactivePower) + ") - no update.")
             return
         self.ActivePower = NewActivePower
-        #self.updateTotalPower() 
+        self.markDirty()
 
     def setInactivePower( self, NewInactivePower ):
         """ setInactivePower - update the InactivePower to a positive value
             update the TotalPower accordingly
         """
         if ( NewInactivePower < 0 ):
-            print( NewInactivePower, " is less than 0 - no update.")
+            Log.reject(self, "InactivePower", NewInactivePower, "is less than 0 - no update.")
             return
         self.InactivePower = NewInactivePower
-        #self.updateTotalPower()
+        self.markDirty()
 
     def setActiveCurrent(self, newActiveCurrent):
         """ setActiveCurrent - update the ActiveCurrent to a positive value
             update the TotalCurrent/TotalPower accordingly
         """
         if ( newActiveCurrent < 0 ):
-            print(newActiveCurrent, " is less than 0 - no update.")
+            Log.reject(self, "ActiveCurrent", newActiveCurrent, "is less than 0 - no update.")
             return
         self.ActiveCurrent = newActiveCurrent
-        #self.updateTotalPower()
+        self.markDirty()
 
     def setInactiveCurrent(self, newInactiveCurrent):
         """ setInactiveCurrent - update the InactiveCurrent to a positive value
             update the TotalCurrent/TotalPower accordingly
         """
         if ( newInactiveCurrent < 0 ):
-            print(newInactiveCurrent, " is less than 0 - no update.")
+            Log.reject(self, "InactiveCurrent", newInactiveCurrent, "is less than 0 - no update.")
             return
         self.ActiveCurrent = newInactiveCurrent
-        #self.updateTotalPower()
+        self.markDirty()
 
     def setVDD(self, newVDD):
         if newVDD < 0:
-            print(newVDD, " is less than 0 - no update.")
+            Log.reject(self, "VDD", newVDD, "is less than 0 - no update.")
             return
         self.VDD = newVDD
-        #self.updateTotalPower()
+        self.markDirty()
 
     def setDutyCycle(self, newDutyCycle):
         if(newDutyCycle > 1 or newDutyCycle < 0):
-            print(newDutyCycle, " is out of allowable bounds between 0 and 1.")
+            Log.reject(self, "DutyCycle", newDutyCycle, "is out of allowable bounds between 0 and 1.")
             return
         self.DutyCycle = newDutyCycle
-        #self.updateTotalPower()
+        self.markDirty()
 
     def updateTotalPower(self, verbose = False):
         """
-        updateTotalPower: Depending on if the model should replace the duty cycle model or not, update total power
+        updateTotalPower: Depending on if the model should replace the duty cycle model or not, update total power. Reports which update it
+        makes as a debug message, or an info message with verbose.
         """
-        if (self.CurrentModel == None):
+        trace = Log.INFO if verbose else Log.DEBUG
+        model = self.CurrentModel
+        if (model == None):
             if self.Type == "POWER":
-                if verbose: print("Updating TotalPower with power type and without external model for component:",self.getName())
-                self.TotalPower = self.InactivePower + (self.ActivePower - self.InactivePower) * self.DutyCycle
+                if Log.level <= trace: Log.log(trace, "Updating TotalPower with power type and without external model for component:",self.getName())
             elif self.Type == "IV":
-                if verbose: print("Updating TotalPower with IV type and without external model for component:",self.getName())
-                self.TotalCurrent = self.InactiveCurrent + (self.ActiveCurrent - self.InactiveCurrent) * self.DutyCycle
-                self.ActivePower = self.ActiveCurrent * self.VDD
-                self.InactivePower = self.InactiveCurrent * self.VDD
-                self.TotalPower = self.VDD * self.TotalCurrent                
+                if Log.level <= trace: Log.log(trace, "Updating TotalPower with IV type and without external model for component:",self.getName())
+            self._computeTotalPower()
         else:
             if self.Type == "POWER":
-                if(self.CurrentModel.getAttr() == "TotalPower"):
-                    if verbose: print("Updating TotalPower with power type, with external model assigning to TotalPower for component:",self.getName())
+                if("TotalPower" in model.getAttrs()):
+                    if Log.level <= trace: Log.log(trace, "Updating TotalPower with power type, with external model assigning to TotalPower for component:",self.getName())
                     self.runModel()
                 else:
-                    if verbose: print("Updating TotalPower with power type, with external model assigning to Inactive/Active Power or DutyCycle for component:",self.getName())
+                    if Log.level <= trace: Log.log(trace, "Updating TotalPower with power type, with external model assigning to Inactive/Active Power or DutyCycle for component:",self.getName())
                     self.runModel()
-                    self.TotalPower = self.InactivePower + (self.ActivePower - self.InactivePower) * self.DutyCycle
+                    self._computeTotalPower()
             elif self.Type == "IV":
-                if(self.CurrentModel.getAttr() == "TotalCurrent"):
-                    if verbose: print("Updating TotalPower with IV type, with external model assigning to TotalCurrent for component:",self.getName())
+                if("TotalCurrent" in model.getAttrs()):
+                    if Log.level <= trace: Log.log(trace, "Updating TotalPower with IV type, with external model assigning to TotalCurrent for component:",self.getName())
                     self.runModel()
                 else:
-                    if verbose: print("Updating TotalPower with IV type, with external model assigning to Inactive/Active Current or DutyCycle for component:",self.getName())
+                    if Log.level <= trace: Log.log(trace, "Updating TotalPower with IV type, with external model assigning to Inactive/Active Current or DutyCycle for component:",self.getName())
                     self.runModel()
-                    self.TotalCurrent = self.InactiveCurrent + (self.ActiveCurrent - self.InactiveCurrent) * self.DutyCycle
-                    self.ActivePower = self.ActiveCurrent * self.VDD
-                    self.InactivePower = self.InactiveCurrent * self.VDD
-                    self.TotalPower = self.VDD * self.TotalCurrent
+                    self._computeTotalPower()
+        self.dirty = False
+        NodeLinks.markParentsDirty(self)
+
+    def _computeTotalPower(self):
+        """ _computeTotalPower - TotalPower (and for IV, TotalCurrent and the powers) from the active and inactive values and the duty cycle.
+            Computed on the doubles of the block when they are all floats, otherwise every number is read once.
+        """
+        if LeafStore.computeTotalPower(self._block, self._slot, self.Type):
+            return
+        dutyCycle = self.DutyCycle
+        if self.Type == "POWER":
+            inactive = self.InactivePower
+            self.TotalPower = inactive + (self.ActivePower - inactive) * dutyCycle
+        elif self.Type == "IV":
+            vdd = self.VDD
+            inactive = self.InactiveCurrent
+            active = self.ActiveCurrent
+            total = inactive + (active - inactive) * dutyCycle
+            self.TotalCurrent = total
+            self.ActivePower = active * vdd
+            self.InactivePower = inactive * vdd
+            self.TotalPower = vdd * total
 
     def setTotalPower(self,Total):
         if self.Type == "POWER":
@@ -224,6 +333,7 @@ class Component:
         elif self.Type == "IV":
             self.TotalCurrent = Total
             self.TotalPower = self.TotalCurrent * self.VDD
+        NodeLinks.markParentsDirty(self)
 
     def setAttr(self, attrKey, value):
         if(self.Type == "POWER"):
@@ -236,7 +346,7 @@ class Component:
             if(attrKey in attrDict):
                 attrDict[attrKey](value)
             else:
-                print("Component class: AttrKey not valid")
+                Log.error("Component class: AttrKey not valid")
         elif(self.Type == "IV"):
             attrDict = {    # Dictionary of attributes meant for sweeping
                 "TotalCurrent":self.setTotalPower,  # Actually sets TotalCurrent
@@ -248,7 +358,7 @@ class Component:
             if(attrKey in attrDict):
                 attrDict[attrKey](value)
             else:
-                print("Component class: AttrKey not valid")
+                Log.error("Component class: AttrKey not valid")
 
     def getAttr(self, attrKey):
         attrDict = {    # Dictionary of attributes meant for sweeping
@@ -258,13 +368,17 @@ class Component:
         return attrDict[attrKey]()
 
     def setCurrentModel(self, modelName):
+        if self.CurrentModel is not None:
+            self.CurrentModel.removeComponent(self)
         self.CurrentModel = self.Models[modelName]
-        self.updateTotalPower(verbose=True)
+        self.CurrentModel.addComponent(self)
+        self.updateTotalPower()
 
     def addModels(self,modelList):
         if(len(modelList) > 0):
+            models = self.Models
             for model in modelList:
-                self.Models[model.getName()] = model
+                models[model.getName()] = model
     
     def removeModels(self,modelNames):
         for name in modelNames:
@@ -277,13 +391,42 @@ class Component:
     def getCurrentModelName(self):
         return self.CurrentModel.getName()
 
+    def addParent(self, parent):
+        NodeLinks.addParent(self, parent)
+
+    def removeParent(self, parent):
+        NodeLinks.removeParent(self, parent)
+
+    def getParents(self):
+        return NodeLinks.getParents(self)
+
+    def markDirty(self):
+        NodeLinks.markDirty(self)
+
+    def isDirty(self):
+        return self.dirty
+
+    def __getstate__(self):
+        state = {name: getattr(self, name) for name in ("name",) + LeafStore.FIELDS + ("Type", "dirty", "CurrentModel", "CurrentModelVal")}
+        if self.Models:
+            state["Models"] = self.Models
+        state["parents"] = ()
+        return state
+
+    def __setstate__(self, state):
+        NodeLinks.setState(self, state)
+
     def runModel(self): # Will run the model once and assign the value to the component attribute
         if(self.CurrentModel != None):
             self.CurrentModelVal = self.CurrentModel.runFunction()
-            self.setAttr(self.CurrentModel.getAttr(),self.CurrentModelVal)
+            if(self.CurrentModel.isMultiOutput()):
+                for attr in self.CurrentModel.getAttrs():
+                    self.setAttr(attr,self.CurrentModelVal[attr])
+            else:
+                self.setAttr(self.CurrentModel.getAttr(),self.CurrentModelVal)
             #return self.CurrentModelVal, self.TotalPower
         else:
-            print("runModel failed: no model assigned")
+            Log.error("runModel failed: no model assigned")
 
 # #######TEST#######
 # #m1 = Component(RX,10.0,0.0,None,None,None, .5)
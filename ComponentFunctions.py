@@ -5,8 +5,28 @@ Created on 6/26/20
 
 ComponentFunctions: Module that contains common functions used for computing, sweeping, and plotting
 
-Most Recent Update 7/4/20
-- Created searchName, getHierarchyTotalPower, attrHierarchySweep, modelBasedSweep
+Most Recent Update 10/17/26
+- exchangeVariable can solve every row for a continuous variable2 by bisection or Brent's method; results are computed without growing arrays
+- tuneVariable can solve for a continuous value with Brent's method or bisection, and take a list of targets
+- Added batchEvaluator; sweeps and exchangeVariable take executor="process", workers=N to run on a process pool
+- Sweeps, tuneVariable and exchangeVariable only recompute the branch that depends on the swept variables
+- Sweeps take the float64 sweep values of the Variable's SweepSpec as they are and return ndarrays instead of lists
+- variableSweep and variableSweep2D have an adaptive method that refines a coarse sweep where the power curve bends
+- Added iterSweepND; variableSweepND can report per-node power and stream the grid in chunks to a memory-mapped .npy file
+- variableSweepND, variableSweep2D and exchangeVariable can checkpoint to a results directory and resume after the last completed chunk
+- Added setResultCache; variableSweep, variableSweep2D, sweepLifetime, tuneVariable and exchangeVariable results can be kept in a persistent
+  cache keyed by the fingerprint of the hierarchy
+- Messages go through Log instead of print()
+- updateHierarchy, sunburstPlotRecursion and updateVariableList walk the hierarchy iteratively, so its depth is unbounded
+- The plotting functions moved to ComponentPlots, imported the first time one of them is used, so importing this module doesn't import plotly (nor multiprocessing,
+  until a sweep runs with executor="process")
+
+Update 10/16/26
+- Added compileHierarchy
+- updateHierarchy refreshes in place instead of rebuilding the hierarchy with np.append
+- variableSweep evaluates all sweep values in one batched pass by default
+- Added variableSweepND; variableSweep2D and sweepLifetime2D return full surfaces from one broadcast pass
+- searchName and getHierarchyTotalPower use a cached name index instead of a depth-first search
 
 
 Functions:
@@ -15,29 +35,63 @@ Functions:
         convertNumber()
         updateHierarchy()
         sunburstPlotRecursion()
+        getNameIndex()
         searchName()
+        getRootPath()
         getHierarchyTotalPower()
+        compileHierarchy()
 
     Sweeping:
+        setResultCache()
+        getResultCache()
         attrHierarchySweep()
         modelBasedSweep()
+        batchEvaluator()
+        variableSweep()
+        iterSweepND()
+        variableSweepND()
+        variableSweep2D()
 
-    Plotting:
+    Plotting (ComponentPlots, loaded on first use):
         sunburstPlot()
+        dutyCyclePlot()
+        dutyCyclePlotTable()
+        dutyCycleVariablePlot()
+        contourVariablePlot()
+        contourLifetimePlot()
+        plotXY()
 
 
 """
+import os
+import json
+import inspect
+import functools
 import numpy as np
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
+import Log
 from Component import Component
 from ComponentGroup import ComponentGroup
 from VoltageRegulator import VoltageRegulator
 from Variable import Variable
 from Model import Model
+from CompiledHierarchy import CompiledHierarchy
+from SweepCheckpoint import SweepCheckpoint
+from Fingerprint import fingerprint
+from ResultCache import ResultCache
 
 _prefix = [["p","n","u","m","","k","M","G"],[1e-12,1e-9,1e-6,1e-3,1e0,1e3,1e6,1e9],[1e12,1e9,1e6,1e3,1e0,1e-3,1e-6,1e-9]]
 
+_plots = ("sunburstPlot","dutyCyclePlot","dutyCyclePlotTable","dutyCycleVariablePlot","contourVariablePlot","contourLifetimePlot","plotXY")
+
+def __getattr__(name):
+    """
+    __getattr__: the plotting functions live in ComponentPlots, which imports plotly; it is imported the first time one of them is looked up
+    """
+    if(name in _plots):
+        import ComponentPlots
+        return getattr(ComponentPlots,name)
+    raise AttributeError("module 'ComponentFunctions' has no attribute '" + name + "'")
+
 def convertNumber(number,unit,round_value):
     """
     convertNumber: Return string that represents 'number' with proper SI prefix prepended to 'unit' (ex. W for power) as well as how many decimal places on the number.
@@ -51,153 +105,134 @@ def convertNumber(number,unit,round_value):
         for i in range(length-1):
             if (_prefix[1][i] <= number and number < _prefix[1][i+1]):
                 return str(round(number*_prefix[2][i],round_value))+_prefix[0][i]+unit
-    print("Error in convertNumber()")
+    Log.error("Error in convertNumber()")
     return
 
 def updateHierarchy(thisComp):
     """
-    updateHierarchy: after setting up desired "system architecture", this function merges all component-related objects into a single hierarchy
-                     and updates TotalPower along the way for every component-related object
-    """
-    thisComp.clearHierarchy()   # Need to refresh hierarchy since we are appending things to it. Need to reset it.
-    for comp in thisComp.components:
-        #print(comp.name)
-        comp.updateTotalPower()    # make sure total power is current for component
-        #print(comp.TotalPower)
-        thisComp.hierarchy["comp"] = np.append(thisComp.hierarchy["comp"],comp)
-        #print(thisComp.hierarchy)
-    for comp in thisComp.componentGroups:
-        #print(comp.name)
-        newComp = updateHierarchy(comp)
-        newComp.updateTotalPower()  # update TotalPower based on new hierarchy
-        #print(newComp.TotalPower)
-        thisComp.hierarchy["compGroups"] = np.append(thisComp.hierarchy["compGroups"],newComp)
-        #print(thisComp.hierarchy)
-    for comp in thisComp.voltageRegulators:
-        #print(comp.name)
-        newComp = updateHierarchy(comp)
-        newComp.updateTotalPower()  # update TotalPower based on new hierarchy
-        #print(newComp.TotalPower)
-        thisComp.hierarchy["vReg"] = np.append(thisComp.hierarchy["vReg"],newComp)
-        #print(thisComp.hierarchy)
-    thisComp.updateTotalPower()  # update TotalPower based on new hierarchy
-    #print(thisComp.TotalPower)
+    updateHierarchy: after setting up desired "system architecture", this function refreshes the hierarchy of every component-related object
+                     and updates TotalPower along the way for every component-related object. The hierarchy shares the child containers, so
+                     only the numbers are recomputed; it is re-pointed only if the containers were replaced (see resetHierarchy()). The walk
+                     is iterative (depth-first, every object after everything below it), so hierarchies of any depth work.
+    """
+    stack = [(thisComp, False)]
+    while stack:
+        node, childrenDone = stack.pop()
+        if(childrenDone):
+            node.updateTotalPower()  # update TotalPower based on new hierarchy
+            continue
+        if(node.hierarchy["comp"] is not node.components or node.hierarchy["compGroups"] is not node.componentGroups
+            or node.hierarchy["vReg"] is not node.voltageRegulators):
+            node.resetHierarchy()
+        for comp in node.components:
+            comp.updateTotalPower()    # make sure total power is current for component
+        stack.append((node, True))
+        children = list(node.componentGroups) + list(node.voltageRegulators)
+        stack.extend((comp, False) for comp in reversed(children))   # first child on top, so the order is the one of a recursive walk
     return thisComp
 
+def compileHierarchy(thisComp):
+    """
+    compileHierarchy: flattens the hierarchy below thisComp into a CompiledHierarchy (struct-of-arrays). Calling evaluate() on the result gives the same
+                      TotalPower/InactivePower/LoadPower/EffLossPower for every node as updateHierarchy() with a few vectorized passes, and writeBack()
+                      pushes them into the objects. Recompile after adding or removing children.
+    """
+    compiled = CompiledHierarchy(thisComp)
+    compiled.evaluate()
+    return compiled
+
 def sunburstPlotRecursion(thisComp):
     """
-    sunburstPlotRecursion: First function in step to create starburst plot. Traverses hierarchy of components to grab parent, child, values from tree
+    sunburstPlotRecursion: First function in step to create starburst plot. Traverses hierarchy of components to grab parent, child, values from tree.
+                           The walk is iterative and appends every entry once, in the order of a recursive depth-first walk.
     """
     parents = []
     children = []
     values = []
-    for comp in thisComp.hierarchy["comp"]:
-        parents.append(thisComp.name)
-        children.append(comp.name)
-        values.append(comp.TotalPower)
-    for comp in thisComp.hierarchy["compGroups"]:
-        parents.append(thisComp.name)
-        children.append(comp.name)
-        values.append(comp.TotalPower)
-        newParents, newChildren, newValues = sunburstPlotRecursion(comp)
-        parents.extend(newParents)
-        children.extend(newChildren)
-        values.extend(newValues)
-    for comp in thisComp.hierarchy["vReg"]:
-        parents.append(thisComp.name)
-        children.append(comp.name)
-        values.append(comp.TotalPower)
-        parents.append(comp.name)
-        children.append(comp.name+" Eff. Loss")
-        values.append(comp.EffLossPower)
-        parents.append(comp.name)
-        children.append(comp.name+" Regulator Power")
-        values.append(comp.RegPower)
-        newParents, newChildren, newValues = sunburstPlotRecursion(comp)
-        parents.extend(newParents)
-        children.extend(newChildren)
-        values.extend(newValues)
-    #print("parents for",thisComp.name,":",parents)
-    #print("children for",thisComp.name,":",children)
-    #print("values for",thisComp.name,":",values)
+    stack = [(thisComp, None, False)]     # (object, None, _) lists its children, (object, parent name, regulator) adds its own entries
+    while stack:
+        comp, parentName, regulator = stack.pop()
+        if(parentName != None):
+            parents.append(parentName)
+            children.append(comp.name)
+            values.append(comp.TotalPower)
+            if(regulator):
+                parents.append(comp.name)
+                children.append(comp.name+" Eff. Loss")
+                values.append(comp.EffLossPower)
+                parents.append(comp.name)
+                children.append(comp.name+" Regulator Power")
+                values.append(comp.RegPower)
+            continue
+        for child in comp.hierarchy["comp"]:
+            parents.append(comp.name)
+            children.append(child.name)
+            values.append(child.TotalPower)
+        for child in reversed(comp.hierarchy["vReg"]):
+            stack.append((child, None, True))
+            stack.append((child, comp.name, True))
+        for child in reversed(comp.hierarchy["compGroups"]):
+            stack.append((child, None, False))
+            stack.append((child, comp.name, False))
     return parents, children, values
 
-def sunburstPlot(thisComp=None,save=0,fileName=""):
-    """
-    sunburstPlot: Create Sunburst plot for hierarchical component showing breakdown weighted by TotalPower attributes. Should call updateHierarchy() before use.
-    """
-    parents, children, values = sunburstPlotRecursion(thisComp)
-    parents.append("")
-    children.append(thisComp.name)
-    values.append(thisComp.TotalPower)
-    hoverinfo = []
-    hovertext = []
-    for i in range(len(parents)):
-        hovertext.append("<b>"+children[i]+"</b>"+"<br>"+"Power: "+str(convertNumber(values[i],"W",3)))
-        hoverinfo.append("text")
-
-    fig =go.Figure(go.Sunburst(
-    name="",
-    labels=children,
-    parents=parents,
-    values=values,
-    branchvalues="total",
-    hoverinfo=hoverinfo,
-    hovertext=hovertext
-    ))
-    fig.update_layout(margin = dict(t=0, l=0, r=0, b=0))
-    fig.show()
-    if(save == 1):
-        fig.write_html(fileName+'.html',auto_open=True)
-
 #To-Do: make function that will set an entire voltage rail to the same level since that may be something the user could sweep
 #def setCommonVoltageRail():   
 
+def getNameIndex(thisComp):
+    """
+    getNameIndex: returns a dictionary that maps the name of every component-like object below thisComp to (object, parent within this hierarchy, levels).
+                  levels counts the steps from thisComp, so direct children are at level 1. The index is stored on thisComp and rebuilt only when
+                  the topologyVersion of thisComp changed, i.e. when something below it was added, removed or renamed. Duplicate names raise a ValueError.
+    """
+    if(thisComp.nameIndex is not None and thisComp.nameIndexVersion == thisComp.topologyVersion):
+        return thisComp.nameIndex
+    index = {}
+    stack = [(thisComp, 0)]
+    while stack:
+        parent, levels = stack.pop()
+        for comp in list(parent.hierarchy["comp"]) + list(parent.hierarchy["compGroups"]) + list(parent.hierarchy["vReg"]):
+            name = comp.getName()
+            if name in index:
+                raise ValueError("getNameIndex: duplicate name '" + str(name) + "' in " + str(thisComp.getName()))
+            index[name] = (comp, parent, levels + 1)
+            if not isinstance(comp, Component):
+                stack.append((comp, levels + 1))
+    thisComp.nameIndex = index
+    thisComp.nameIndexVersion = thisComp.topologyVersion
+    return index
+
 def searchName(thisComp,name):
     """
     searchName: searches for component with name within a hierarchy, returns number of levels it takes to get to component not including very top and the component
     """
-    for comp in thisComp.hierarchy["comp"]:
-        if(comp.getName() == name):
-            return 1, comp
-
-    for comp in thisComp.hierarchy["compGroups"]:   # Currently, componentGroups don't have attributes to be swept, so they only call the function to do deeper in the hierarchy
-        subLevels, namedComp = searchName(comp,name)
-        if(subLevels > 0):
-            return (subLevels + 1), namedComp
-        
-    for comp in thisComp.hierarchy["vReg"]: # Regulators can be swept or the actual swept thing can be below it
-        if(comp.getName() == name):
-            return 1, comp
-        else:
-            subLevels, namedComp = searchName(comp,name)
-            if(subLevels > 0):
-                return (subLevels + 1), namedComp
-    return 0, 0    # For the case that nothing is there, needs to return empty
+    entry = getNameIndex(thisComp).get(name)
+    if entry is None:
+        return 0, 0    # For the case that nothing is there, needs to return empty
+    return entry[2], entry[0]
+
+def getRootPath(thisComp,name):
+    """
+    getRootPath: returns the list of component-like objects from the named one up to (not including) thisComp, following the parent pointers of the name index
+    """
+    index = getNameIndex(thisComp)
+    if name not in index:
+        return []
+    comp, parent, levels = index[name]
+    path = [comp]
+    while parent is not thisComp:
+        comp, parent, levels = index[parent.getName()]
+        path.append(comp)
+    return path
 
 def getHierarchyTotalPower(thisComp,name):
     """
     getHierarchyTotalPower: grabs all the TotalPower values from a specific component-like object and everything above it in the "tree"
     """
-    for comp in thisComp.hierarchy["comp"]:
-        if(comp.getName() == name):
-            return True, [comp.getTotalPower()]
-
-    for comp in thisComp.hierarchy["compGroups"]:   # Currently, componentGroups don't have attributes to be swept, so they only call the function to do deeper in the hierarchy
-        valid, TP = getHierarchyTotalPower(comp,name)
-        if valid:
-            TP.append(comp.getTotalPower())
-            return valid, TP
-        
-    for comp in thisComp.hierarchy["vReg"]: # Regulators can be swept or the actual swept thing can be below it
-        if(comp.getName() == name):
-            return True, [comp.getTotalPower()]
-        else:
-            valid, TP = getHierarchyTotalPower(comp,name)
-            if valid :
-                TP.append(comp.getTotalPower())
-                return valid, TP
-    return 0, 0    # For the case that nothing is there, needs to return empty
+    path = getRootPath(thisComp,name)
+    if len(path) == 0:
+        return 0, 0    # For the case that nothing is there, needs to return empty
+    return True, [comp.getTotalPower() for comp in path]
 
 def attrHierarchySweep(name,attrKey,hierarchy,values,levels):
     """
@@ -241,88 +276,448 @@ def updateVariableList(thisComp):
     """
     updateVariableList: Takes a system hierarchy as input, locates all the relevant variables for the hierarchy based on CurrentModel parameter for Components,
                         then outputs a dictionary with keys that are the string variable names and values that are lists of "locations" for components
-                        within the tree structure that use these variables so searching isn't required when updating values.
+                        within the tree structure that use these variables so searching isn't required when updating values. The walk is iterative
+                        and appends every component once, in the order of a recursive depth-first walk.
     """
     variables = {}
-    for comp in thisComp.hierarchy["comp"]:
-        if(comp.hasCurrentModel()):
-            names = comp.CurrentModel.getVariableNames()
-            for name in names:
-                if(variables.get(name)): # If the key exists
-                    variables[name] += [comp]
-                else:
-                    variables[name] = [comp]
-
-    for comp in thisComp.hierarchy["compGroups"]:   # Currently, componentGroups don't have attributes to be swept, so they only call the function to do deeper in the hierarchy
-        returnedVars = updateVariableList(comp) 
-        for var in returnedVars:
-            if var in variables:
-                #merge them
-                variables[var] += returnedVars[var]
-            else:
-                #add it
-                variables[var] = returnedVars[var]
-        
-    for comp in thisComp.hierarchy["vReg"]: # Regulators can be swept or the actual swept thing can be below it
-        returnedVars = updateVariableList(comp) 
-        for var in returnedVars:
-            if var in variables:
-                #merge them
-                variables[var] += returnedVars[var]
-            else:
-                #add it
-                variables[var] = returnedVars[var]
-
+    stack = [thisComp]
+    while stack:
+        node = stack.pop()
+        for comp in node.hierarchy["comp"]:
+            if(comp.hasCurrentModel()):
+                for name in comp.CurrentModel.getVariableNames():
+                    if(name in variables):
+                        variables[name].append(comp)
+                    else:
+                        variables[name] = [comp]
+        # Currently, componentGroups don't have attributes to be swept, only what is below them; regulators can be swept or the swept thing can be below it
+        stack.extend(reversed(list(node.hierarchy["compGroups"]) + list(node.hierarchy["vReg"])))
     return variables
 
-def variableSweep(hierarchy,variable):
+def batchEvaluator(hierarchy,variables,executor=None,workers=None):
+    """
+    batchEvaluator: CompiledHierarchy of the branch of hierarchy that depends on variables, wrapped in a ParallelSweep when executor="process" so its
+                    evaluateBatch() runs on workers processes (all cores by default). executor=None evaluates in this process.
+    """
+    compiled = CompiledHierarchy(hierarchy,variables)
+    if(executor == "process"):
+        from ParallelSweep import ParallelSweep    # multiprocessing is only imported when a pool is used
+        return ParallelSweep(compiled,workers)
+    elif(executor != None):
+        Log.error("batchEvaluator: executor '" + str(executor) + "' invalid, use None or \"process\"")
+        assert (False)
+    return compiled
+
+def _intervalErrors(x, p, axis):
+    """
+    _intervalErrors: relative change across every interval between consecutive grid lines x along axis of p, and the relative distance of either
+                     end of the interval from the straight line through its neighbours (curvature). Both are the largest over the other axes.
+    """
+    p = np.moveaxis(p,axis,-1).reshape(-1,len(x))
+    scale = np.maximum(np.abs(p),np.finfo(float).tiny)
+    change = np.abs(np.diff(p,axis=1))/np.maximum(scale[:,:-1],scale[:,1:])
+    curvature = np.zeros(change.shape)
+    if(len(x) > 2):
+        w = (x[1:-1] - x[:-2])/(x[2:] - x[:-2])
+        dev = np.abs(p[:,1:-1] - (p[:,:-2] + w*(p[:,2:] - p[:,:-2])))/scale[:,1:-1]
+        curvature[:,:-1] = dev
+        curvature[:,1:] = np.maximum(curvature[:,1:],dev)
+    return change.max(axis=0),curvature.max(axis=0)
+
+def _adaptiveSweep(hierarchy, variables, tol, changeTol, maxPoints, executor, workers, coarse=17):
+    """
+    _adaptiveSweep: adaptive version of variableSweepND. Starts from coarse points per variable spread over its sweep values, then repeatedly adds
+                    the sweep value halfway (by index) into every interval whose curvature exceeds tol or whose relative change in total power
+                    exceeds changeTol, worst intervals first, until no interval is flagged, the sweep values are exhausted or the grid would
+                    exceed maxPoints points (default every sweep value, so only the tolerances stop it). Stopping on maxPoints with intervals still
+                    flagged is reported as a warning. The grid stays rectangular, so a new point along one variable adds a line across the others.
+    """
+    axes = []
+    for variable in variables:
+        variable.setSweepVals()
+        axes.append(variable.getSweepVals())
+    sizes = [len(vals) for vals in axes]
+    if(0 in sizes):
+        return axes, np.empty(sizes)
+    if(maxPoints == None):
+        maxPoints = int(np.prod(sizes))
+    compiled = batchEvaluator(hierarchy,variables,executor,workers)
+    evaluate = lambda index: compiled.evaluateBatch(dict(zip(variables,np.ix_(*[vals[i] for vals,i in zip(axes,index)]))))
+    index = [np.unique(np.linspace(0,size-1,min(size,coarse)).round().astype(np.int64)) for size in sizes]
+    power = evaluate(index)
+    old_vals = [variable.getValue() for variable in variables]
+    while True:
+        # intervals that can be split, with how far they are over the tolerances
+        candidates = []
+        for axis,idx in enumerate(index):
+            change,curvature = _intervalErrors(idx.astype(float),power,axis)
+            excess = curvature/tol if tol != None else np.zeros(len(change))
+            if(changeTol != None):
+                excess = np.maximum(excess,change/changeTol)
+            for k in np.nonzero((excess > 1) & (np.diff(idx) > 1))[0]:
+                candidates.append((excess[k],axis,(idx[k] + idx[k + 1])//2))
+        candidates.sort(key=lambda c: -c[0])
+        counts = [len(idx) for idx in index]
+        new = [[] for idx in index]
+        for excess,axis,i in candidates:
+            counts[axis] += 1
+            if(np.prod(counts) > maxPoints):
+                counts[axis] -= 1
+                continue
+            new[axis].append(i)
+        if(not any(new)):
+            if(len(candidates) > 0):
+                Log.warning("Adaptive sweep: stopped at maxPoints =",maxPoints,"with",len(candidates),"intervals over the tolerance")
+            break
+        # evaluate only the new points: block a holds the points whose first new coordinate is on axis a
+        new = [np.array(sorted(i),dtype=np.int64) for i in new]
+        merged = [np.union1d(idx,i) for idx,i in zip(index,new)]
+        grid = np.empty([len(idx) for idx in merged])
+        grid[np.ix_(*[np.searchsorted(m,idx) for m,idx in zip(merged,index)])] = power
+        for axis in range(len(index)):
+            if(len(new[axis]) > 0):
+                block = index[:axis] + [new[axis]] + merged[axis + 1:]
+                grid[np.ix_(*[np.searchsorted(m,idx) for m,idx in zip(merged,block)])] = evaluate(block)
+        index = merged
+        power = grid
+    for variable,vals in zip(variables,axes):
+        variable.setValue(vals[-1])
+    hierarchy.getTotalPower()
+    for variable,old_val in zip(variables,old_vals):
+        variable.setValue(old_val)
+    return [vals[idx] for vals,idx in zip(axes,index)], power
+
+_resultCache = None   # ResultCache set with setResultCache()
+
+def setResultCache(cache, maxBytes=256*2**20):
+    """
+    setResultCache: serve variableSweep, variableSweep2D, sweepLifetime, tuneVariable and exchangeVariable from a persistent ResultCache, given as a
+                    ResultCache or a directory (kept under maxBytes). Results are keyed by the fingerprint of the hierarchy (see Fingerprint.fingerprint())
+                    and the arguments, so a change to any parameter, model or variable computes them again. None turns the cache off.
+    """
+    global _resultCache
+    if(cache != None and not isinstance(cache,ResultCache)):
+        cache = ResultCache(cache,maxBytes)
+    _resultCache = cache
+
+def getResultCache():
+    return _resultCache
+
+def _cachedResult(replay=None):
+    """
+    _cachedResult: decorator that looks the result of a sweep function up in the result cache before computing it. replay(arguments, result) redoes
+                   the changes the function makes to the hierarchy when the result comes from the cache. Runs with a checkpoint aren't cached,
+                   nor hierarchies without a fingerprint.
+    """
+    def decorate(function):
+        signature = inspect.signature(function)
+        @functools.wraps(function)
+        def cached(*args,**kwargs):
+            arguments = signature.bind(*args,**kwargs)
+            arguments.apply_defaults()
+            arguments = arguments.arguments
+            if(_resultCache == None or arguments.get("checkpoint") != None):
+                return function(*args,**kwargs)
+            hierarchy = arguments["hierarchy"]
+            hierarchy.getTotalPower()    # fingerprint the up to date state
+            variables = [value for value in arguments.values() if isinstance(value,Variable)]
+            extra = [function.__name__] + [(name,value.getName() if hasattr(value,"getName") else value) for name,value in arguments.items()
+                                           if name not in ("hierarchy","executor","workers")]
+            key = fingerprint(hierarchy,variables,extra)
+            if(key == None):
+                return function(*args,**kwargs)
+            found,result = _resultCache.lookup(key)
+            if(found):
+                if(replay != None):
+                    replay(arguments,result)
+                return result
+            result = function(*args,**kwargs)
+            _resultCache.store(key,result)
+            return result
+        return cached
+    return decorate
+
+def _replayTune(arguments, result):
+    # a single target leaves the variable at its solution
+    if(result != None and np.ndim(result[0]) == 0):
+        arguments["variable"].setValue(result[0])
+
+@_cachedResult()
+def variableSweep(hierarchy,variable,method="batched",executor=None,workers=None,tol=1e-2,changeTol=None,maxPoints=None):
     """
     variableSweep: Sweep the variable for the given hierarchy and report the resulting total power consumption for the hierarchy. The variable can be applied
                     to any number of independent components/models.
-    """
-    total_power = []
+                    Only the components whose CurrentModel uses the variable and their ancestors are recomputed; every other branch is read once
+                    as a constant. method="batched" evaluates the affected models on the whole sweep vector and pushes it through a CompiledHierarchy
+                    of the affected branch in one pass; method="loop" sets the variable and lets the dirty flags recompute the affected branch once per
+                    sweep value. Both give the same values and leave the hierarchy at the last sweep value. executor="process" spreads the batched
+                    evaluation over workers processes (see batchEvaluator). Returns the sweep values and the total power as ndarrays.
+                    method="adaptive" evaluates a subset of the sweep values: it starts coarse and keeps halving the intervals where the power
+                    curve bends by more than tol (relative distance of a point from the line through its neighbours) or, with changeTol, changes by
+                    more than changeTol relative, until maxPoints points (default the whole sweep). Intervals are halved by index, so a log
+                    sweep is refined evenly on a log axis. The non-uniform values it returns plot directly.
+    """
+    if(method == "adaptive"):
+        (vals,),total_power = _adaptiveSweep(hierarchy,[variable],tol,changeTol,maxPoints,executor,workers)
+        return vals,total_power
     variable.setSweepVals()
     vals = variable.getSweepVals()
+    total_power = np.empty(variable.getSweepSize())
     old_val = variable.getValue()
-    for val in vals:
-        variable.setValue(val)
-        if(not(isinstance(hierarchy,Component))):   # Components dont have updateHierarchy function as its not needed
-            updateHierarchy(hierarchy)
-        else:
-            hierarchy.updateTotalPower()
-        total_power.append(hierarchy.getTotalPower())
+    if(method == "batched"):
+        if(len(vals) > 0):
+            compiled = batchEvaluator(hierarchy,[variable],executor,workers)
+            total_power = compiled.evaluateBatch({variable:vals})
+            compiled.applyLastPoint()   # the state the last sweep value leaves in the swept components
+            variable.setValue(old_val)
+        return vals,total_power
+    for i in range(len(vals)):
+        variable.setValue(vals[i])  # marks the components using the variable and their ancestors dirty
+        total_power[i] = hierarchy.getTotalPower()
     variable.setValue(old_val)
     return vals,total_power
 
-def variableSweep2D(hierarchy, variable1, variable2):
-    """
-    variableSweep2D: 2D sweep for two separate variables. Row is variable 1 and column is variable 2.
-    """
-    i = 0
-    vals1 = 0
+def iterSweepND(hierarchy, variables, nodes=None, chunkSize=65536, method="batched", executor=None, workers=None, checkpoint=None):
+    """
+    iterSweepND: Generator over the grid of variableSweepND in chunks of at most chunkSize consecutive points (C order, the last variable changes
+                 fastest), so a sweep of any size can be reduced on the fly with flat memory. Yields (start, stop, total_power) for grid points
+                 start to stop of the flattened grid (np.unravel_index turns them back into sweep value indices). With nodes, a list of
+                 component-like objects in the hierarchy, yields (start, stop, total_power, node_power) where node_power holds the TotalPower of
+                 every node, shape (len(nodes), stop - start). The chunks give the same values as one variableSweepND pass, including setters
+                 that reject a value. method, executor and workers are as in variableSweepND; executor="process" can't report nodes. The hierarchy
+                 is left at the last grid point once the generator is exhausted. With an opened SweepCheckpoint, the sweep starts after its
+                 completed points and every chunk is recorded as completed once the consumer asks for the next one.
+    """
+    axes = []
+    for variable in variables:
+        variable.setSweepVals()
+        axes.append(variable.getSweepVals())
+    shape = tuple(len(vals) for vals in axes)
+    size = int(np.prod(shape))
+    if(size == 0):
+        return
+    old_vals = [variable.getValue() for variable in variables]
+    if(method == "batched"):
+        if(nodes != None and executor != None):
+            Log.error("iterSweepND: nodes can't be reported with an executor")
+            assert (False)
+        evaluator = batchEvaluator(hierarchy,variables,executor,workers)
+        compiled = evaluator if executor == None else evaluator.compiled
+        if(nodes != None):
+            rows = [compiled.index.get(id(node),0) for node in nodes]
+            inside = np.array([id(node) in compiled.index for node in nodes])
+            const = np.array([0.0 if id(node) in compiled.index else node.getTotalPower() for node in nodes])[:,None]  # nodes that don't depend on the variables
+            affected = compiled.affectedLeaves(variables)
+            compiled.runModels(skip = affected)
+    elif(method != "loop"):
+        Log.error("iterSweepND 'method' invalid")
+        assert (False)
+    first = checkpoint.completed if checkpoint != None else 0
+    if(first > 0 and method == "batched"):
+        compiled.lastPoint = checkpoint.carry    # continue the setter state of the last completed point
+        compiled.carryLastPoint()
+    elif(first > 0):
+        for variable,vals,i in zip(variables,axes,np.unravel_index(first - 1,shape)):
+            variable.setValue(vals[i])
+        hierarchy.getTotalPower()
+    for start in range(first,size,chunkSize):
+        stop = min(start + chunkSize,size)
+        index = np.unravel_index(np.arange(start,stop),shape)
+        values = [vals[i] for vals,i in zip(axes,index)]
+        if(method == "loop"):
+            total_power = np.empty(stop - start)
+            node_power = np.empty((len(nodes) if nodes != None else 0,stop - start))
+            for k in range(stop - start):
+                for variable,vals in zip(variables,values):
+                    variable.setValue(vals[k])
+                total_power[k] = hierarchy.getTotalPower()
+                for n,node in enumerate(nodes if nodes != None else []):
+                    node_power[n,k] = node.getTotalPower()
+        elif(nodes == None):
+            total_power = evaluator.evaluateBatch(dict(zip(variables,values)))   # a process pool is started once and serves every chunk
+            evaluator.carryLastPoint()
+        else:
+            overrides = compiled.applyBatch(compiled.runModelsBatch(affected,dict(zip(variables,values)),(stop - start,)))
+            power = compiled.resolveBatch(overrides,0,stop - start,[0] + rows)
+            compiled.carryLastPoint()
+            total_power = power[0]
+            node_power = np.where(inside[:,None],power[1:],const)
+        if(nodes == None):
+            yield start,stop,total_power
+        else:
+            yield start,stop,total_power,node_power
+        if(checkpoint != None):
+            checkpoint.save(stop,compiled.lastPoint if method == "batched" else None)
+    if(method == "batched" and executor != None):
+        evaluator.close()   # a generator left unfinished releases the pool when it is garbage collected
+    if(method == "batched"):
+        compiled.applyLastPoint()
+    for variable,old_val in zip(variables,old_vals):
+        variable.setValue(old_val)
+
+def variableSweepND(hierarchy, variables, method="batched", executor=None, workers=None, nodes=None, out=None, chunkSize=65536, checkpoint=None):
+    """
+    variableSweepND: Sweep any number of variables over the full grid of their sweep values and report the total power of the hierarchy. Returns the list
+                     of sweep value arrays and an ndarray of total power with one axis per variable (axis i follows variables[i], the last variable
+                     changes fastest). Only the branch that depends on the variables is recomputed. method="batched" broadcasts the value grids
+                     through the models and a CompiledHierarchy of that branch in one pass; method="loop" recomputes it once per grid point through
+                     the dirty flags. The hierarchy is left at the last grid point. executor="process" spreads the batched evaluation over workers
+                     processes (see batchEvaluator).
+                     With nodes (component-like objects in the hierarchy) the result gets a last axis of fields: the total power of the hierarchy,
+                     then the TotalPower of every node. With out, a path to a .npy file, the grid is computed in chunks of chunkSize points with
+                     iterSweepND and written to a memory-mapped file, which is returned opened read-only; a .json file next to it describes the axes
+                     (variable names, units and sweep values) and the fields.
+                     With checkpoint, a results directory (or a SweepCheckpoint), the grid is streamed like with out into the directory and every
+                     chunk is checkpointed. Running the same sweep on the directory again resumes after the last completed chunk, or returns the
+                     stored result when it is complete; it stops if the hierarchy, its models or the sweep differ (see Fingerprint.fingerprint()).
+    """
+    axes = []
+    for variable in variables:
+        variable.setSweepVals()
+        axes.append(variable.getSweepVals())
+    shape = tuple(len(vals) for vals in axes)
+    if(out != None or nodes != None or checkpoint != None):
+        fields = ["TotalPower"] + ([node.getName() for node in nodes] if nodes != None else [])
+        full = shape + ((len(fields),) if nodes != None else ())
+        sidecar = dict(variables=[dict(name=variable.getName(),unit=variable.getUnit(),values=vals.tolist()) for variable,vals in zip(variables,axes)],
+                       fields=fields,shape=list(full))
+        if(checkpoint != None):
+            if(not isinstance(checkpoint,SweepCheckpoint)):
+                checkpoint = SweepCheckpoint(checkpoint)
+            hierarchy.getTotalPower()
+            total_power = checkpoint.open(fingerprint(hierarchy,variables,[method,fields]),full,sidecar)
+            out = checkpoint.getResultPath()
+        elif(out != None):
+            total_power = np.lib.format.open_memmap(out,mode="w+",dtype=float,shape=full)
+            with open(os.path.splitext(out)[0] + ".json","w") as f:
+                json.dump(sidecar,f,indent=1)
+        else:
+            total_power = np.empty(full)
+        flat = total_power.reshape(-1,len(fields))    # a view, chunks are contiguous rows
+        for chunk in iterSweepND(hierarchy,variables,nodes,chunkSize,method,executor,workers,checkpoint):
+            flat[chunk[0]:chunk[1],0] = chunk[2]
+            if(nodes != None):
+                flat[chunk[0]:chunk[1],1:] = chunk[3].T
+        if(out != None):
+            total_power.flush()
+            del flat, total_power
+            total_power = np.load(out,mmap_mode="r")
+        return axes, total_power
+    old_vals = [variable.getValue() for variable in variables]
+    if(0 in shape):
+        return axes, np.empty(shape)
+    if(method == "batched"):
+        compiled = batchEvaluator(hierarchy,variables,executor,workers)
+        total_power = compiled.evaluateBatch(dict(zip(variables,np.ix_(*axes))))
+        compiled.applyLastPoint()
+    else:
+        total_power = np.empty(shape)
+        for index in np.ndindex(*shape):
+            for variable,vals,i in zip(variables,axes,index):
+                variable.setValue(vals[i])
+            total_power[index] = hierarchy.getTotalPower()
+    for variable,old_val in zip(variables,old_vals):
+        variable.setValue(old_val)
+    return axes, total_power
+
+@_cachedResult()
+def variableSweep2D(hierarchy, variable1, variable2, method="batched", executor=None, workers=None, tol=1e-2, changeTol=None, maxPoints=None, checkpoint=None):
+    """
+    variableSweep2D: 2D sweep for two separate variables. Rows follow variable 2 and columns follow variable 1, so total_power has shape
+                     (variable2 sweep size, variable1 sweep size). method="batched" computes the whole surface with variableSweepND;
+                     method="loop" runs variableSweep over variable1 for every value of variable2. executor and workers are passed on to the sweep.
+                     method="adaptive" refines a coarse grid like variableSweep does, adding whole rows and columns where the surface bends by more
+                     than tol or changes by more than changeTol along either variable, until maxPoints grid points (default the full grid).
+                     With checkpoint, a results directory, the batched surface is checkpointed and resumable (see variableSweepND).
+    """
+    if(method == "batched"):
+        (vals2,vals1),total_power = variableSweepND(hierarchy,[variable2,variable1],method,executor,workers,checkpoint=checkpoint)
+        return vals1,vals2,total_power
+    if(checkpoint != None):
+        Log.error("variableSweep2D: checkpoint needs method=\"batched\"")
+        assert (False)
+    if(method == "adaptive"):
+        (vals2,vals1),total_power = _adaptiveSweep(hierarchy,[variable2,variable1],tol,changeTol,maxPoints,executor,workers)
+        return vals1,vals2,total_power
     variable1.setSweepVals()
     variable2.setSweepVals()
-    vals1_size = variable1.getSweepSize()
-    vals2_size = variable2.getSweepSize()
-    total_power = np.zeros((vals2_size,vals1_size))
-
+    vals1 = variable1.getSweepVals()
     vals2 = variable2.getSweepVals()
+    total_power = np.zeros((variable2.getSweepSize(),variable1.getSweepSize()))
+
     old_val = variable2.getValue()
-    for val in vals2:
-        variable2.setValue(val)
-        if(not(isinstance(hierarchy,Component))):   # Components dont have updateHierarchy function as its not needed
-            updateHierarchy(hierarchy)
-        else:
-            hierarchy.updateTotalPower()
-        vals1,vals1_power = variableSweep(hierarchy,variable1)    
-        total_power[i] = np.array(vals1_power)
-        i += 1
+    for i in range(len(vals2)):
+        variable2.setValue(vals2[i])
+        vals1,total_power[i] = variableSweep(hierarchy,variable1,method,executor,workers)
     variable2.setValue(old_val)
-    vals1 = np.array(vals1)
-    vals2 = np.array(vals2)
     return vals1,vals2,total_power
 
-def tuneVariable(hierarchy,component,variable,quantity=1,powerType="Relative"):
+def _bisectTargets(f, a, b, targets, tol, maxIter):
+    """
+    _bisectTargets: bisection on [a,b] for every target at once, f maps an array of variable values (one per target) to powers. Targets outside
+                    the power range converge to the closer end of [a,b].
+    """
+    lo = np.full(len(targets),a,dtype=float)
+    hi = np.full(len(targets),b,dtype=float)
+    increasing = f(hi) >= f(lo)
+    for k in range(maxIter):
+        if(np.all(np.abs(hi - lo) <= tol)):
+            break
+        mid = lo + (hi - lo)/2
+        above = (f(mid) < targets) == increasing    # the target is on the b side of mid
+        lo = np.where(above,mid,lo)
+        hi = np.where(above,hi,mid)
+    return lo + (hi - lo)/2
+
+def _brent(f, a, b, target, tol, maxIter):
+    """
+    _brent: Brent's method (bisection, secant and inverse quadratic interpolation) for f(x) = target on [a,b]. A target that [a,b] doesn't
+            bracket returns the end with the closer power.
+    """
+    fa = f(a) - target
+    fb = f(b) - target
+    if(fa*fb > 0):
+        return a if abs(fa) <= abs(fb) else b
+    c, fc = a, fa
+    d = e = b - a
+    for k in range(maxIter):
+        if(fb*fc > 0):
+            c, fc = a, fa
+            d = e = b - a
+        if(abs(fc) < abs(fb)):
+            a, b, c = b, c, b
+            fa, fb, fc = fb, fc, fb
+        tol1 = 2*np.finfo(float).eps*abs(b) + tol/2
+        m = (c - b)/2
+        if(abs(m) <= tol1 or fb == 0):
+            return b
+        if(abs(e) >= tol1 and abs(fa) > abs(fb)):
+            s = fb/fa
+            if(a == c):     # secant
+                p = 2*m*s
+                q = 1 - s
+            else:           # inverse quadratic interpolation
+                q = fa/fc
+                r = fb/fc
+                p = s*(2*m*q*(q - r) - (b - a)*(r - 1))
+                q = (q - 1)*(r - 1)*(s - 1)
+            if(p > 0):
+                q = -q
+            p = abs(p)
+            if(2*p < min(3*m*q - abs(tol1*q), abs(e*q))):
+                e = d
+                d = p/q
+            else:
+                d = e = m
+        else:
+            d = e = m
+        a, fa = b, fb
+        b = b + (d if abs(d) > tol1 else (tol1 if m > 0 else -tol1))
+        fb = f(b) - target
+    return b
+
+@_cachedResult(_replayTune)
+def tuneVariable(hierarchy,component,variable,quantity=1,powerType="Relative",method="sweep",tol=None,maxIter=100):
     """
     tuneVariable: Given a target power value, either relative to floor power or absolute (W) tune the provided variable such that a component's power consumption
     matches the target quantity. Update hierarchy object with this target value for the variable and return the variable value, component power, system power. This
@@ -330,6 +725,9 @@ def tuneVariable(hierarchy,component,variable,quantity=1,powerType="Relative"):
     the user can adjust a single variable and watch a single component's impact. They can instead achieve a target system power based on a single variable. They could 
     also just take part of a system and make it conform to a certain power value. ***Note: This variable could affect other components as well. This requires a 
     monotonic relationship between the variable and power consumption.
+    method="sweep" picks the closest of the variable's sweep values. method="brent" (Brent's method) or method="bisect" solve for a continuous value
+    between the variable's start and stop instead, to within tol (default 1e-9 of the range) in at most maxIter evaluations of the component's branch.
+    quantity may be a list of targets: then the variable is left unchanged and arrays of values, component powers, system powers and targets are returned.
     """
     minIndex = 0
     diff = 0
@@ -338,217 +736,95 @@ def tuneVariable(hierarchy,component,variable,quantity=1,powerType="Relative"):
         if powerType == "Relative":
             # Determine target power first
             floorPower = hierarchy.getInactivePower()
-            targetPower = quantity*floorPower
+            targetPower = np.multiply(quantity,floorPower)
         elif powerType == "Absolute":
             targetPower = quantity
-        vals,totalPower = variableSweep(component,variable)
-        diff = abs(totalPower[0]-targetPower)
-        for power in totalPower:
-            i += 1
-            if(abs(power-targetPower) < diff):
-                diff = abs(power-targetPower)
-                minIndex = i
-        variable.setValue(vals[minIndex]) # set the value to the variable associated with the targetPower
-        if(not(isinstance(component,Component))):   # Components dont have updateHierarchy function as its not needed
-            updateHierarchy(component)
+        if(method == "sweep" and np.ndim(targetPower) == 0):
+            vals,totalPower = variableSweep(component,variable)
+            diff = abs(totalPower[0]-targetPower)
+            for power in totalPower:
+                i += 1
+                if(abs(power-targetPower) < diff):
+                    diff = abs(power-targetPower)
+                    minIndex = i
+            variable.setValue(vals[minIndex]) # set the value to the variable associated with the targetPower, only the branches using it are recomputed below
+            return vals[minIndex],component.getTotalPower(),hierarchy.getTotalPower(),targetPower
+        targets = np.atleast_1d(np.asarray(targetPower,dtype=float))
+        evaluator = CompiledHierarchy(component,[variable])
+        power = lambda x: evaluator.evaluateBatch({variable:np.atleast_1d(x)})   # component power, without touching the objects
+        if(method == "sweep"):
+            vals,totalPower = variableSweep(component,variable)
+            solution = vals[np.argmin(np.abs(totalPower[np.newaxis,:] - targets[:,np.newaxis]),axis=1)]
+        elif(method == "brent" or method == "bisect"):
+            a = float(variable.getStart())
+            b = float(variable.getStop())
+            if(tol == None):
+                tol = 1e-9*abs(b - a)
+            if(method == "bisect"):
+                solution = _bisectTargets(power,a,b,targets,tol,maxIter)
+            else:
+                solution = np.array([_brent(lambda x: power(x)[0],a,b,target,tol,maxIter) for target in targets])
         else:
-            component.updateTotalPower()
-        updateHierarchy(hierarchy)
-        return vals[minIndex],component.getTotalPower(),hierarchy.getTotalPower(),targetPower
+            Log.error("tuneVariable 'method' invalid")
+            return
+        if(np.ndim(targetPower) == 0):
+            variable.setValue(solution[0])
+            return solution[0],component.getTotalPower(),hierarchy.getTotalPower(),targetPower
+        return solution,power(solution),CompiledHierarchy(hierarchy,[variable]).evaluateBatch({variable:solution}),targets
+    else:
+        Log.error("tuneVariable 'powerType' invalid")
+
+@_cachedResult()
+def exchangeVariable(hierarchy,variable1,variable2,targetPower,delta,method="grid",tol=None,maxIter=100,executor=None,workers=None,checkpoint=None):
+    """
+    exchangeVariable: delta is percentage of power allowable to be different. For every sweep value of variable1, finds the variable2 value that brings the
+                      hierarchy to targetPower and returns the variable1 values where that is possible within delta, the matching variable2 values and the
+                      deviation from targetPower. method="grid" picks the closest variable2 sweep value from one variableSweepND pass (executor="process"
+                      computes the grid on workers processes, see batchEvaluator). method="bisect" solves every row at once for a continuous variable2
+                      between its start and stop, one batched evaluation per step; method="brent" solves row by row with Brent's method. Both stop at tol
+                      (default 1e-9 of the variable2 range) or maxIter and need power to be monotonic in variable2. With checkpoint, a results
+                      directory, the grid is checkpointed and resumable (see variableSweepND).
+    """
+    if(checkpoint != None and method != "grid"):
+        Log.error("exchangeVariable: checkpoint needs method=\"grid\"")
+        assert (False)
+    if(method == "grid"):
+        (var1_vals,vals),grid = variableSweepND(hierarchy,[variable1,variable2],executor=executor,workers=workers,checkpoint=checkpoint)    # row i follows var1_vals[i]
+        rows = np.arange(len(var1_vals))
+        index = np.argmin(np.absolute(grid - targetPower),axis=1)    # first closest variable2 value in every row
+        solution = vals[index]
+        sub = grid[rows,index] - targetPower
+    elif(method == "bisect" or method == "brent"):
+        variable1.setSweepVals()
+        var1_vals = variable1.getSweepVals()
+        a = float(variable2.getStart())
+        b = float(variable2.getStop())
+        if(tol == None):
+            tol = 1e-9*abs(b - a)
+        evaluator = CompiledHierarchy(hierarchy,[variable1,variable2])
+        if(method == "bisect"):
+            solution = _bisectTargets(lambda x: evaluator.evaluateBatch({variable1:var1_vals,variable2:x}),a,b,
+                                      np.full(len(var1_vals),targetPower,dtype=float),tol,maxIter)
+        else:
+            solution = np.empty(len(var1_vals))
+            for k in range(len(var1_vals)):
+                solution[k] = _brent(lambda x: evaluator.evaluateBatch({variable1:var1_vals[k:k+1],variable2:[x]})[0],a,b,targetPower,tol,maxIter)
+        sub = evaluator.evaluateBatch({variable1:var1_vals,variable2:solution}) - targetPower
     else:
-        print("tuneVariable 'powerType' invalid")
+        Log.error("exchangeVariable 'method' invalid")
+        return
+    found = np.absolute(sub) <= delta
+    variable1_result = var1_vals[found]
+    variable2_result = solution[found]
+    deviation = sub[found]
 
-def exchangeVariable(hierarchy,variable1,variable2,targetPower,delta):
-    """
-    exchangeVariable: delta is percentage of power allowable to be different
-    """
-    variable1.setSweepVals()
-    variable2.setSweepVals()
-    var1_vals = variable1.getSweepVals()
-    
-    orig_val1 = variable1.getValue()
-    orig_val2 = variable2.getValue()
-
-    variable1_result = np.array([])
-    variable2_result = np.array([])
-    deviation = np.array([])
-    flag = 0
-
-    for val1 in var1_vals:
-        variable1.setValue(val1)
-        vals,totalPower = variableSweep(hierarchy,variable2)
-        totalPower = np.array(totalPower)
-        sub = np.subtract(totalPower,np.repeat(targetPower,np.size(totalPower,0)))
-        abs_vals = np.absolute(sub) # Absolute value of difference in arrays
-        min_val = np.amin(abs_vals)
-        if(min_val <= delta):
-            if(flag < 2):
-                flag = flag + 1
-            index = np.where(abs_vals == min_val) # Calculates index to minimum power value, returns tuple
-            variable2_result = np.append(variable2_result,vals[index[0][0]])
-            variable1_result = np.append(variable1_result,val1)
-            deviation = np.append(deviation,sub[index[0][0]])
-
-    if(flag == 0):
-        print("exchangeVariable: Target power not achievable.")
-
-    if(flag == 1):
-        print("exchangeVariable: Target power only achievable at one point: (",variable1_result[0],",",variable2_result[0],")")
-
-    variable1.setValue(orig_val1)
-    variable2.setValue(orig_val2)
-    return variable1_result,variable2_result,deviation
+    if(len(variable1_result) == 0):
+        Log.warning("exchangeVariable: Target power not achievable.")
+
+    if(len(variable1_result) == 1):
+        Log.warning("exchangeVariable: Target power only achievable at one point: (",variable1_result[0],",",variable2_result[0],")")
 
-def dutyCyclePlot(hierarchies,DC_Variable,points=[]):
-    """
-    dutyCyclePlot: Takes list of components to plot, the duty cycle variable, and specific duty cycle values to plot as operating points per component.
-    It will plot duty cycle versus power for each component and if points are provided then put them on the curve.
-    """
-    # print(len(hierarchies))
-    # print(type(DC_Variable.getSweepSize()))
-
-    results = np.empty((len(hierarchies),DC_Variable.getSweepSize()))
-    i = 0
-    fig = go.Figure()
-    for comp in hierarchies:
-        results = variableSweep(comp,DC_Variable)
-        fig.add_trace(go.Scatter(x=results[0], y=results[1], mode='lines', name=comp.getName()))
-        if(len(points) == len(hierarchies)):
-            if(points[i] != None):
-                DC_Variable.setValue(points[i])
-                updateHierarchy(comp)
-                temp_power = comp.getTotalPower()
-                fig.add_trace(go.Scatter(x=[points[i]], y=[temp_power], mode='markers', marker={'size':10, 'color':'black'},showlegend=False))
-        i = i + 1
-
-    #fig.add_trace(go.Scatter(x=[0.5], y=[1e-6], mode='markers', name='temp', marker=dict(size=10)))
-    fig.update_layout(title="Duty-Cycle Model",
-                    xaxis_title='Duty-Cycle',
-                    yaxis_title='Average Power (W)',
-                    xaxis=dict(type='log',exponentformat='power',dtick='1'),
-                    yaxis=dict(type='log',exponentformat='SI',dtick='1'))
-    fig.show()
-    #fig.write_html('Figures/system.html',auto_open=True)
-
-def dutyCyclePlotTable(hierarchies,DC_Variable,points=[]):
-    """
-    dutyCyclePlot: Takes list of components to plot, the duty cycle variable, and specific duty cycle values to plot as operating points per component.
-    It will plot duty cycle versus power for each component and generate a separate table for specified points.
-    """
-
-    fig = make_subplots(
-    rows=2, cols=1,
-    specs=[[{"type": "scatter"}],[{"type": "table"}]])
-    results = np.empty((len(hierarchies),DC_Variable.getSweepSize()))
-    table_names = []
-    table_data = []
-    i = 0
-    for comp in hierarchies:
-        results = variableSweep(comp,DC_Variable)
-        fig.append_trace(go.Scatter(x=results[0], y=results[1], mode='lines', name=comp.getName()), row=1, col=1)
-        if(len(points) == len(hierarchies)):
-            if(points[i] != None):
-                DC_Variable.setValue(points[i])
-                updateHierarchy(comp)
-                temp_power = comp.getTotalPower()
-                table_names.append(comp.getName())
-                table_data.append(convertNumber(temp_power,'W',1))
-                fig.append_trace(go.Scatter(x=[points[i]], y=[temp_power], mode='markers', marker={'size':10, 'color':'black'},showlegend=False),row=1, col=1)
-        i = i + 1
-
-    fig.append_trace(go.Table(header=dict(values=['Name', 'Average Power (W)']),
-                                    cells=dict(values=np.array([table_names,table_data]))),row=2, col=1)
-
-    #fig.add_trace(go.Scatter(x=[0.5], y=[1e-6], mode='markers', name='temp', marker=dict(size=10)))
-    fig.update_layout(title="Duty-Cycle Model",
-                    xaxis_title='Duty-Cycle',
-                    yaxis_title='Average Power (W)',
-                    xaxis=dict(type='log',exponentformat='power',dtick='1'),
-                    yaxis=dict(type='log',exponentformat='SI',dtick='1'))
-    fig.show()
-    #fig.write_html('Figures/system.html',auto_open=True)
-
-def dutyCycleVariablePlot(hierarchies,DC_Variable,points=[],variables=[],models=[],variableComponents=[]):
-    """
-    Same as dutyCyclePlot function, but also incorporates ability to plot a color gradient plot relative to the value of another variable per component.
-    Variables to be swept must be in the same order as the components in the hierarchy.
-
-    variableComponents should hold all the components that need setCurrentModel redone for them [[comp1, comp2],[comp_a, comp_b],...] where the dimensions 
-    are X by Y, X = (rows) number of components that need to be reset per variable, Y = (columns) number of variables. There is one variable per hierarchy.
-
-    Models are needed because as we sweep one variable, we need to update the component with the specific model
-
-    """
-    #results = np.empty((len(hierarchies),DC_Variable.getSweepSize()))
-    i = 0
-    pad = 0
-    fig = go.Figure()
-    for comp in hierarchies:
-        results = variableSweep(comp,DC_Variable)
-        fig.add_trace(go.Scatter(x=results[0], y=results[1], mode='lines', name=comp.getName()))
-        if(len(points) == len(hierarchies)):
-            if(points[i] != None):
-                DC_Variable.setValue(points[i])
-                updateHierarchy(comp)
-                temp_power = comp.getTotalPower()
-                fig.add_trace(go.Scatter(x=[points[i]], y=[temp_power], mode='markers', marker={'size':10, 'color':'black'},showlegend=False))
-        if(len(variables) == len(hierarchies) and len(variableComponents[:]) == len(hierarchies) and len(models) == len(hierarchies)):
-            if(variables[i] != None):
-                # need to reset the components to be driven by this variable and not duty cycle
-                j = 0
-                for comps in variableComponents[i]:
-                    comps.setCurrentModel(models[i][j].getName())   # Each component may end up having different models, we will only plot against one variable though
-                    print(models[i][j].getName())
-                    j = j + 1
-                results_custom = variableSweep(comp,variables[i])  # still sweep the hierarchy
-                print(variables[i].getName())
-                print(comp.getName())
-                # The model outupt should be in units of DUTY CYCLE which is why they can be on the same x axis!!!!
-                # The first model will be the one that is presented
-                var_output, model_output = models[i][0].sweepFunction(variables[i])
-                fig.add_trace(go.Scatter(x=model_output, y=results_custom[1],mode='markers', showlegend=False, marker={'color': var_output, 
-                                        'colorscale': 'Plasma', 'size': 10, 'showscale':True, 
-                                        'colorbar':{'ticks':"outside",'ticksuffix':variables[i].getUnit(), 'xpad':pad,
-                                        'title': {'text':variables[i].getName()} }}))
-                pad = pad + 150
-        i = i + 1
-
-    #fig.add_trace(go.Scatter(x=[0.5], y=[1e-6], mode='markers', name='temp', marker=dict(size=10)))
-    fig.update_layout(title="Duty-Cycle Model",
-                    xaxis_title='Duty-Cycle',
-                    yaxis_title='Average Power (W)',
-                    xaxis=dict(type='log',exponentformat='power',dtick='1'),
-                    yaxis=dict(type='log',exponentformat='SI',dtick='1'),
-                    legend=dict(
-                    yanchor="top",
-                    y=0.99,
-                    xanchor="left",
-                    x=0.01
-                ))
-    fig.show()
-    #fig.write_html('Figures/system.html',auto_open=True)
-
-def contourVariablePlot(hierarchy, variable1, variable2):
-    vals1,vals2,power = variableSweep2D(hierarchy, variable1, variable2)
-    fig = go.Figure()
-    fig.add_trace(go.Contour(z=power,x=vals1,y=vals2,
-        colorbar=dict(
-            exponentformat='SI'
-        ),
-        contours=dict(
-                coloring ='heatmap',
-                showlabels = True, # show labels on contours
-                labelfont = dict( # label font properties
-                    size = 12,
-                    color = 'white',
-                ))))
-    title = "Contour Variable Plot: "+hierarchy.getName()
-    fig.update_layout(title=title,
-                    xaxis_title=variable1.getName(),
-                    yaxis_title=variable2.getName()
-                    )
-    fig.show()
-    #fig.write_html('Figures/system.html',auto_open=True)
+    return variable1_result,variable2_result,deviation
 
 def getLifetime(hierarchy,energy,unit):
     """
@@ -565,7 +841,7 @@ def getLifetime(hierarchy,energy,unit):
     }
 
     if(unit not in divider_map):
-        print("getLifetime: unit doesn't have proper name")
+        Log.error("getLifetime: unit doesn't have proper name")
     
     else:
         if(not(isinstance(hierarchy,Component))):   # Components dont have updateHierarchy function as its not needed
@@ -574,6 +850,7 @@ def getLifetime(hierarchy,energy,unit):
             hierarchy.updateTotalPower()
         return energy/(divider_map[unit]*hierarchy.getTotalPower())
 
+@_cachedResult()
 def sweepLifetime(hierarchy,energy,variable,unit):
     """
     sweepLifetime: reports back a sweep of lifetimes in seconds, minutes, hours, days, weeks, months, years given a specific energy budget
@@ -589,17 +866,17 @@ def sweepLifetime(hierarchy,energy,variable,unit):
     }
 
     if(unit not in divider_map):
-        print("sweepLifetime: unit doesn't have proper name")
+        Log.error("sweepLifetime: unit doesn't have proper name")
     
     else:
         vals,totalpower = variableSweep(hierarchy,variable)
-        lifetime = energy/divider_map[unit]*np.divide(np.ones((1,variable.getSweepSize())),totalpower)
-        lifetime = lifetime[0][:]
+        lifetime = energy/divider_map[unit]*np.divide(1.0,totalpower)
         return vals,lifetime
 
 def sweepLifetime2D(hierarchy,energy,variable1,variable2,unit):
     """
-    sweepLifetime2D: reports back a 2D sweep of lifetimes in seconds, minutes, hours, days, weeks, months, years given a specific energy budget
+    sweepLifetime2D: reports back a 2D sweep of lifetimes in seconds, minutes, hours, days, weeks, months, years given a specific energy budget.
+                     The lifetime surface has the same (variable2, variable1) shape as the power surface of variableSweep2D.
     """
     divider_map = {
         'second':1,
@@ -612,41 +889,10 @@ def sweepLifetime2D(hierarchy,energy,variable1,variable2,unit):
     }
 
     if(unit not in divider_map):
-        print("sweepLifetime: unit doesn't have proper name")
+        Log.error("sweepLifetime: unit doesn't have proper name")
     
     else:
         vals1,vals2,totalpower = variableSweep2D(hierarchy,variable1,variable2)
-        lifetime = energy/divider_map[unit]*np.divide(np.ones((variable2.getSweepSize(),variable1.getSweepSize())),totalpower)
-        lifetime = lifetime[0][:]
+        lifetime = energy/divider_map[unit]*np.divide(1.0,totalpower)
         return vals1,vals2,lifetime
 
-def contourLifetimePlot(hierarchy,energy,variable1,variable2,unit):
-    vals1,vals2,lifetime = sweepLifetime2D(hierarchy,energy,variable1,variable2,unit)
-    fig = go.Figure()
-    fig.add_trace(go.Contour(z=lifetime,x=vals1,y=vals2,
-        colorbar=dict(
-            exponentformat='SI'
-        ),
-        contours=dict(
-                coloring ='heatmap',
-                showlabels = True, # show labels on contours
-                labelfont = dict( # label font properties
-                    size = 12,
-                    color = 'white',
-                ))))
-    title = "Contour Lifetime Plot: "+hierarchy.getName()
-    fig.update_layout(title=title,
-                    xaxis_title=variable1.getName(),
-                    yaxis_title=variable2.getName()
-                    )
-    fig.show()
-    #fig.write_html('Figures/system.html',auto_open=True)
-
-def plotXY(X=None,Y=None,Title=None,X_Label=None,Y_Label=None):
-    fig = go.Figure()
-    fig.add_trace(go.Scatter(x=X, y=Y,mode='lines',name=Title))
-    fig.update_layout(title=Title,
-                    xaxis_title=X_Label,
-                    yaxis_title=Y_Label
-                    )
-    fig.show()
\ No newline at end of file
@@ -5,6 +5,8 @@ Created on 6/26/20
 
 """
 import numpy as np
+import Log
+import NodeLinks
 
 class ComponentGroup:
     """ Class that collects Components, Voltage Regulators, and other ComponentGroups
@@ -15,6 +17,9 @@ class ComponentGroup:
             - componentGroups: array of more ComponentGroups inside of this ComponentGroup
             - voltageRegulators: array of voltageRegulator objects inside of this ComponentGroup
             - hierarchy: once updated, provides tree structure of component-type objects of everything beneath this ComponentGroup
+            - topologyVersion: (int) incremented whenever children are added, removed or renamed anywhere below this object
+            - parents: (tuple) weak references to the ComponentGroups, VoltageRegulators and LogicalGroups that contain this object, see getParents()
+            - dirty: (bool) True when something below this object changed since TotalPower was last computed
             - TotalPower: (float) once updated, summation of all average power of component-type objects beneath this ComponentGroup
             - TotalCurrent: (float) once updated, summation of all average current of component-type objects beneath this ComponentGroup
             - Type: (string) "POWER" or "IV", represents that this ComponentGroup is either defined with only power numbers or with voltage/current
@@ -31,14 +36,29 @@ class ComponentGroup:
             addComponents() - add new Component to Components section in hierarchy
             addComponentGroups() - add new ComponentGroups to ComponentGroups section in hierarchy
             addVoltageRegulators() - add new VoltageRegulator to VotlageRegulators section hin hierarchy
+            removeComponents() - remove Components by name
+            removeComponentGroups() - remove ComponentGroups by name
+            removeVoltageRegulators() - remove VoltageRegulators by name
             getName() - return string name
             setName() - set new name
             setVDD() - set VDD
             getVDD() - return VDD
             checkVDD() - check across hierarchy that VDDs match
             clearHierarchy() - empty hierarchy
+            resetHierarchy() - point hierarchy at the current child containers
+            addParent() - register a container of this object
+            removeParent() - unregister a container of this object
+            getParents() - return the containers of this object
+            updateDirty() - update the dirty containers below this object and then this object
+            markDirty() - flag this object and all of its ancestors for recomputation
+            markTopologyChanged() - bump topologyVersion of this object and all of its ancestors
+            isDirty() - return dirty flag
+            registerChildren() - register this object as parent of its children
     """
-    
+
+    __slots__ = ("name", "VDD", "components", "componentGroups", "voltageRegulators", "hierarchy", "topologyVersion", "nameIndex", "nameIndexVersion",
+                 "TotalPower", "TotalCurrent", "InactivePower", "InactiveCurrent", "Type", "checkVDDFlag", "parents", "dirty", "__weakref__")
+
     def __init__(self, name = None, VDD = None, components = np.array([]), componentGroups = np.array([]), voltageRegulators = np.array([]), checkVDDFlag = True):
         """ __init__ - set the voltage for all components
             Compute the various power points as function of the components
@@ -50,13 +70,19 @@ class ComponentGroup:
         self.components = np.array(components)
         self.componentGroups = np.array(componentGroups)
         self.voltageRegulators = np.array(voltageRegulators)
-        self.hierarchy = dict(comp=components,compGroups=componentGroups,vReg=voltageRegulators) # hierarchy is EVERYTHING and is CALCULATED, original inputs are just one level
+        self.hierarchy = dict(comp=self.components,compGroups=self.componentGroups,vReg=self.voltageRegulators) # hierarchy shares the child containers, so refreshing it never copies them
+        self.topologyVersion = 0
+        self.nameIndex = None   # built by ComponentFunctions.getNameIndex()
+        self.nameIndexVersion = -1
         self.TotalPower = 0.0
         self.TotalCurrent = None
         self.InactivePower = 0.0
         self.InactiveCurrent = None
         self.Type = None
         self.checkVDDFlag = checkVDDFlag
+        self.parents = ()
+        self.dirty = False
+        self.registerChildren()
 
     @classmethod
     def PDef(cls, name, components, componentGroups, voltageRegulators, checkVDDFlag = True):
@@ -73,11 +99,16 @@ class ComponentGroup:
         return newComponentGroup
 
     def getTotalPower(self):
+        if self.dirty: self.updateDirty()
         return self.TotalPower
 
     def getInactivePower(self):
+        if self.dirty: self.updateDirty()
         return self.InactivePower
 
+    def updateDirty(self):
+        NodeLinks.updateDirty(self)
+
     def updateTotalPower(self):
         self.updateInactivePower()
         if self.Type == "POWER":
@@ -100,6 +131,8 @@ class ComponentGroup:
                 tempSum = tempSum + comp.getTotalPower()
             self.TotalPower = tempSum
             self.TotalCurrent = self.TotalPower / self.VDD
+        self.dirty = False
+        NodeLinks.markParentsDirty(self)
 
     def updateInactivePower(self):
         if self.Type == "POWER":
@@ -124,22 +157,33 @@ class ComponentGroup:
             self.InactiveCurrent = self.InactivePower / self.VDD
 
     def addComponents(self, newComps):
-        np.append(self.hierarchy["comp"],newComps)
+        NodeLinks.addChildren(self, "components", newComps)
 
     def addComponentGroups(self, newGroups):
-        np.append(self.hierarchy["compGroups"],newGroups)
+        NodeLinks.addChildren(self, "componentGroups", newGroups)
 
     def addVoltageRegulators(self, newVRegs):
-        np.append(self.hierarchy["vReg"],newVRegs)
+        NodeLinks.addChildren(self, "voltageRegulators", newVRegs)
+
+    def removeComponents(self, names):
+        NodeLinks.removeChildren(self, "components", names)
+
+    def removeComponentGroups(self, names):
+        NodeLinks.removeChildren(self, "componentGroups", names)
+
+    def removeVoltageRegulators(self, names):
+        NodeLinks.removeChildren(self, "voltageRegulators", names)
 
     def getName(self):
         return self.name
 
     def setName(self, newName):
         self.name = newName
+        NodeLinks.markParentsTopologyChanged(self)
 
     def setVDD(self, newVDD):
         self.VDD = newVDD
+        self.markDirty()
 
     def getVDD(self):
         return self.VDD
@@ -148,16 +192,51 @@ class ComponentGroup:
         if(self.checkVDDFlag):
             for comp in self.hierarchy["comp"]:
                 if (comp.getVDD() != self.VDD):
-                    print("Component", comp.name,"VDD,", comp.getVDD(),", doesn't match", self.name, "VDD,", self.VDD)
+                    Log.error("Component", comp.name,"VDD,", comp.getVDD(),", doesn't match", self.name, "VDD,", self.VDD)
                     assert (False)
             for comp in self.hierarchy["compGroups"]:
                 if (comp.getVDD() != self.VDD):
-                    print("Component Group", comp.name,"VDD,", comp.getVDD(),", doesn't match", self.name, "VDD", self.VDD)
+                    Log.error("Component Group", comp.name,"VDD,", comp.getVDD(),", doesn't match", self.name, "VDD", self.VDD)
                     assert (False)
             for comp in self.hierarchy["vReg"]:
                 if (comp.getVIN() != self.VDD):
-                    print("Regulator", comp.name,"VIN,", comp.getVIN(),", doesn't match", self.name, "VDD", self.VDD)
+                    Log.error("Regulator", comp.name,"VIN,", comp.getVIN(),", doesn't match", self.name, "VDD", self.VDD)
                     assert (False)
 
     def clearHierarchy(self):
-        self.hierarchy = dict(comp=np.array([]),compGroups=np.array([]),vReg=np.array([]))
\ No newline at end of file
+        self.hierarchy = dict(comp=np.array([]),compGroups=np.array([]),vReg=np.array([]))
+
+    def resetHierarchy(self):
+        """ resetHierarchy - point the hierarchy at the current child containers after the topology changed
+        """
+        self.hierarchy = dict(comp=self.components,compGroups=self.componentGroups,vReg=self.voltageRegulators)
+        self.markTopologyChanged()
+        self.registerChildren()
+        self.markDirty()
+
+    def addParent(self, parent):
+        NodeLinks.addParent(self, parent)
+
+    def removeParent(self, parent):
+        NodeLinks.removeParent(self, parent)
+
+    def getParents(self):
+        return NodeLinks.getParents(self)
+
+    def markDirty(self):
+        NodeLinks.markDirty(self)
+
+    def isDirty(self):
+        return self.dirty
+
+    def markTopologyChanged(self):
+        NodeLinks.markTopologyChanged(self)
+
+    def registerChildren(self):
+        NodeLinks.registerChildren(self)
+
+    def __getstate__(self):
+        return NodeLinks.getState(self)
+
+    def __setstate__(self, state):
+        NodeLinks.setState(self, state)
\ No newline at end of file
@@ -0,0 +1,235 @@
+# -*- coding: utf-8 -*-
+"""
+Created on 10/17/26
+
+ComponentPlots: Plotting functions of ComponentFunctions, the only module that imports plotly. ComponentFunctions imports it the first time
+                one of these functions is used (CF.sunburstPlot(), CF.plotXY(), ...), so computing and sweeping never pay for importing plotly.
+
+Most Recent Update 10/17/26
+    - Moved the plotting functions out of ComponentFunctions
+
+Functions:
+    sunburstPlot()
+    dutyCyclePlot()
+    dutyCyclePlotTable()
+    dutyCycleVariablePlot()
+    contourVariablePlot()
+    contourLifetimePlot()
+    plotXY()
+
+"""
+import numpy as np
+import Log
+import plotly.graph_objects as go
+from plotly.subplots import make_subplots
+import ComponentFunctions as CF
+
+def sunburstPlot(thisComp=None,save=0,fileName=""):
+    """
+    sunburstPlot: Create Sunburst plot for hierarchical component showing breakdown weighted by TotalPower attributes. Should call updateHierarchy() before use.
+    """
+    parents, children, values = CF.sunburstPlotRecursion(thisComp)
+    parents.append("")
+    children.append(thisComp.name)
+    values.append(thisComp.TotalPower)
+    hoverinfo = []
+    hovertext = []
+    for i in range(len(parents)):
+        hovertext.append("<b>"+children[i]+"</b>"+"<br>"+"Power: "+str(CF.convertNumber(values[i],"W",3)))
+        hoverinfo.append("text")
+
+    fig =go.Figure(go.Sunburst(
+    name="",
+    labels=children,
+    parents=parents,
+    values=values,
+    branchvalues="total",
+    hoverinfo=hoverinfo,
+    hovertext=hovertext
+    ))
+    fig.update_layout(margin = dict(t=0, l=0, r=0, b=0))
+    fig.show()
+    if(save == 1):
+        fig.write_html(fileName+'.html',auto_open=True)
+
+def dutyCyclePlot(hierarchies,DC_Variable,points=[]):
+    """
+    dutyCyclePlot: Takes list of components to plot, the duty cycle variable, and specific duty cycle values to plot as operating points per component.
+    It will plot duty cycle versus power for each component and if points are provided then put them on the curve.
+    """
+    # print(len(hierarchies))
+    # print(type(DC_Variable.getSweepSize()))
+
+    results = np.empty((len(hierarchies),DC_Variable.getSweepSize()))
+    i = 0
+    fig = go.Figure()
+    for comp in hierarchies:
+        results = CF.variableSweep(comp,DC_Variable)
+        fig.add_trace(go.Scatter(x=results[0], y=results[1], mode='lines', name=comp.getName()))
+        if(len(points) == len(hierarchies)):
+            if(points[i] != None):
+                DC_Variable.setValue(points[i])
+                CF.updateHierarchy(comp)
+                temp_power = comp.getTotalPower()
+                fig.add_trace(go.Scatter(x=[points[i]], y=[temp_power], mode='markers', marker={'size':10, 'color':'black'},showlegend=False))
+        i = i + 1
+
+    #fig.add_trace(go.Scatter(x=[0.5], y=[1e-6], mode='markers', name='temp', marker=dict(size=10)))
+    fig.update_layout(title="Duty-Cycle Model",
+                    xaxis_title='Duty-Cycle',
+                    yaxis_title='Average Power (W)',
+                    xaxis=dict(type='log',exponentformat='power',dtick='1'),
+                    yaxis=dict(type='log',exponentformat='SI',dtick='1'))
+    fig.show()
+    #fig.write_html('Figures/system.html',auto_open=True)
+
+def dutyCyclePlotTable(hierarchies,DC_Variable,points=[]):
+    """
+    dutyCyclePlot: Takes list of components to plot, the duty cycle variable, and specific duty cycle values to plot as operating points per component.
+    It will plot duty cycle versus power for each component and generate a separate table for specified points.
+    """
+
+    fig = make_subplots(
+    rows=2, cols=1,
+    specs=[[{"type": "scatter"}],[{"type": "table"}]])
+    results = np.empty((len(hierarchies),DC_Variable.getSweepSize()))
+    table_names = []
+    table_data = []
+    i = 0
+    for comp in hierarchies:
+        results = CF.variableSweep(comp,DC_Variable)
+        fig.append_trace(go.Scatter(x=results[0], y=results[1], mode='lines', name=comp.getName()), row=1, col=1)
+        if(len(points) == len(hierarchies)):
+            if(points[i] != None):
+                DC_Variable.setValue(points[i])
+                CF.updateHierarchy(comp)
+                temp_power = comp.getTotalPower()
+                table_names.append(comp.getName())
+                table_data.append(CF.convertNumber(temp_power,'W',1))
+                fig.append_trace(go.Scatter(x=[points[i]], y=[temp_power], mode='markers', marker={'size':10, 'color':'black'},showlegend=False),row=1, col=1)
+        i = i + 1
+
+    fig.append_trace(go.Table(header=dict(values=['Name', 'Average Power (W)']),
+                                    cells=dict(values=np.array([table_names,table_data]))),row=2, col=1)
+
+    #fig.add_trace(go.Scatter(x=[0.5], y=[1e-6], mode='markers', name='temp', marker=dict(size=10)))
+    fig.update_layout(title="Duty-Cycle Model",
+                    xaxis_title='Duty-Cycle',
+                    yaxis_title='Average Power (W)',
+                    xaxis=dict(type='log',exponentformat='power',dtick='1'),
+                    yaxis=dict(type='log',exponentformat='SI',dtick='1'))
+    fig.show()
+    #fig.write_html('Figures/system.html',auto_open=True)
+
+def dutyCycleVariablePlot(hierarchies,DC_Variable,points=[],variables=[],models=[],variableComponents=[]):
+    """
+    Same as dutyCyclePlot function, but also incorporates ability to plot a color gradient plot relative to the value of another variable per component.
+    Variables to be swept must be in the same order as the components in the hierarchy.
+
+    variableComponents should hold all the components that need setCurrentModel redone for them [[comp1, comp2],[comp_a, comp_b],...] where the dimensions 
+    are X by Y, X = (rows) number of components that need to be reset per variable, Y = (columns) number of variables. There is one variable per hierarchy.
+
+    Models are needed because as we sweep one variable, we need to update the component with the specific model
+
+    """
+    #results = np.empty((len(hierarchies),DC_Variable.getSweepSize()))
+    i = 0
+    pad = 0
+    fig = go.Figure()
+    for comp in hierarchies:
+        results = CF.variableSweep(comp,DC_Variable)
+        fig.add_trace(go.Scatter(x=results[0], y=results[1], mode='lines', name=comp.getName()))
+        if(len(points) == len(hierarchies)):
+            if(points[i] != None):
+                DC_Variable.setValue(points[i])
+                CF.updateHierarchy(comp)
+                temp_power = comp.getTotalPower()
+                fig.add_trace(go.Scatter(x=[points[i]], y=[temp_power], mode='markers', marker={'size':10, 'color':'black'},showlegend=False))
+        if(len(variables) == len(hierarchies) and len(variableComponents[:]) == len(hierarchies) and len(models) == len(hierarchies)):
+            if(variables[i] != None):
+                # need to reset the components to be driven by this variable and not duty cycle
+                j = 0
+                for comps in variableComponents[i]:
+                    comps.setCurrentModel(models[i][j].getName())   # Each component may end up having different models, we will only plot against one variable though
+                    Log.debug(models[i][j].getName())
+                    j = j + 1
+                results_custom = CF.variableSweep(comp,variables[i])  # still sweep the hierarchy
+                Log.debug(variables[i].getName())
+                Log.debug(comp.getName())
+                # The model outupt should be in units of DUTY CYCLE which is why they can be on the same x axis!!!!
+                # The first model will be the one that is presented
+                var_output, model_output = models[i][0].sweepFunction(variables[i])
+                fig.add_trace(go.Scatter(x=model_output, y=results_custom[1],mode='markers', showlegend=False, marker={'color': var_output, 
+                                        'colorscale': 'Plasma', 'size': 10, 'showscale':True, 
+                                        'colorbar':{'ticks':"outside",'ticksuffix':variables[i].getUnit(), 'xpad':pad,
+                                        'title': {'text':variables[i].getName()} }}))
+                pad = pad + 150
+        i = i + 1
+
+    #fig.add_trace(go.Scatter(x=[0.5], y=[1e-6], mode='markers', name='temp', marker=dict(size=10)))
+    fig.update_layout(title="Duty-Cycle Model",
+                    xaxis_title='Duty-Cycle',
+                    yaxis_title='Average Power (W)',
+                    xaxis=dict(type='log',exponentformat='power',dtick='1'),
+                    yaxis=dict(type='log',exponentformat='SI',dtick='1'),
+                    legend=dict(
+                    yanchor="top",
+                    y=0.99,
+                    xanchor="left",
+                    x=0.01
+                ))
+    fig.show()
+    #fig.write_html('Figures/system.html',auto_open=True)
+
+def contourVariablePlot(hierarchy, variable1, variable2):
+    vals1,vals2,power = CF.variableSweep2D(hierarchy, variable1, variable2)
+    fig = go.Figure()
+    fig.add_trace(go.Contour(z=power,x=vals1,y=vals2,
+        colorbar=dict(
+            exponentformat='SI'
+        ),
+        contours=dict(
+                coloring ='heatmap',
+                showlabels = True, # show labels on contours
+                labelfont = dict( # label font properties
+                    size = 12,
+                    color = 'white',
+                ))))
+    title = "Contour Variable Plot: "+hierarchy.getName()
+    fig.update_layout(title=title,
+                    xaxis_title=variable1.getName(),
+                    yaxis_title=variable2.getName()
+                    )
+    fig.show()
+    #fig.write_html('Figures/system.html',auto_open=True)
+
+def contourLifetimePlot(hierarchy,energy,variable1,variable2,unit):
+    vals1,vals2,lifetime = CF.sweepLifetime2D(hierarchy,energy,variable1,variable2,unit)
+    fig = go.Figure()
+    fig.add_trace(go.Contour(z=lifetime,x=vals1,y=vals2,
+        colorbar=dict(
+            exponentformat='SI'
+        ),
+        contours=dict(
+                coloring ='heatmap',
+                showlabels = True, # show labels on contours
+                labelfont = dict( # label font properties
+                    size = 12,
+                    color = 'white',
+                ))))
+    title = "Contour Lifetime Plot: "+hierarchy.getName()
+    fig.update_layout(title=title,
+                    xaxis_title=variable1.getName(),
+                    yaxis_title=variable2.getName()
+                    )
+    fig.show()
+    #fig.write_html('Figures/system.html',auto_open=True)
+
+def plotXY(X=None,Y=None,Title=None,X_Label=None,Y_Label=None):
+    fig = go.Figure()
+    fig.add_trace(go.Scatter(x=X, y=Y,mode='lines',name=Title))
+    fig.update_layout(title=Title,
+                    xaxis_title=X_Label,
+                    yaxis_title=Y_Label
+                    )
+    fig.show()
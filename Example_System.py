@@ -75,10 +75,10 @@ def DutyCycle(varDictionary):
     return dutycycle
 
 # Creating several Models objects to represent AFE and TX duty-cycle
-afeDutyCycleModelSimple = Model("afeDutyCycleModelSimple",[DC],DutyCycle,"DutyCycle")
-TXDutyCycleModelSimple = Model("TXDutyCycleModelSimple",[DC],DutyCycle,"DutyCycle")
-afeDutyCycleModel = Model("afeDutyCycleModel",[AFE_On_Time,AFE_Sampling_Rate],AFEDutyCycle,"DutyCycle")
-TXDutyCycleModel = Model("TXDutyCycleModel",[TX_On_Time,TX_Rate],TXDutyCycle,"DutyCycle")
+afeDutyCycleModelSimple = Model("afeDutyCycleModelSimple",[DC],DutyCycle,"DutyCycle",vectorized=True)
+TXDutyCycleModelSimple = Model("TXDutyCycleModelSimple",[DC],DutyCycle,"DutyCycle",vectorized=True)
+afeDutyCycleModel = Model("afeDutyCycleModel",[AFE_On_Time,AFE_Sampling_Rate],AFEDutyCycle,"DutyCycle",vectorized=True)
+TXDutyCycleModel = Model("TXDutyCycleModel",[TX_On_Time,TX_Rate],TXDutyCycle,"DutyCycle",vectorized=True)
 
 # Start of hierarchy definition. Components here are defined with Currents and their VDD (thus IV). Check out Component class for more info.
 NVM = Component.IVDef("NVM",1e-3,150e-9,VDDIO,0)
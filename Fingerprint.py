@@ -0,0 +1,191 @@
+# -*- coding: utf-8 -*-
+"""
+Created on 10/17/26
+
+Fingerprint: Deterministic content hash of a hierarchy, to tell whether a stored sweep result still belongs to the system being modeled. The hash
+             covers the structure and the parameters of every component, group and regulator, the Models of every component and which one is
+             current, and the values and sweep specs of their Variables. Model functions are hashed by their source code with everything they
+             read besides their arguments: the globals named in their code (numbers, strings, arrays, lists, dictionaries, Variables and, through
+             their own source, the helper functions they call), the attributes they use of modules of the project, their closures and default
+             arguments. Functions of the standard library and installed packages are identified by name and package version. It doesn't depend on
+             object identities or on the process, so the same script gives the same hash on every run.
+
+             When a model function reads anything else (an object, a bound method, a class of the project, ...) a change of it couldn't be seen,
+             so fingerprint() returns None and the result isn't cached.
+
+Most Recent Update 10/17/26
+    - Created module
+
+Functions:
+    fingerprint()
+
+"""
+
+import sys
+import types
+import hashlib
+import inspect
+import functools
+import numpy as np
+import Log
+from Component import Component
+from Variable import Variable
+from SweepSpec import ExplicitSweep
+
+_FIELDS = ("Type", "ActivePower", "InactivePower", "ActiveCurrent", "InactiveCurrent", "VDD", "DutyCycle", "Efficiency", "VIN", "VOUT",
+           "RegCurrent", "RegPower", "checkVDDFlag")
+
+class _Unhashable(Exception):
+    # a model function reads a value whose changes the fingerprint can't see
+    pass
+
+def _canon(value):
+    # process independent text for a value; objects without one are represented by their type
+    if value is None or isinstance(value, (bool, str, bytes, complex)):
+        return repr(value)
+    if isinstance(value, (int, np.integer)):
+        return repr(int(value))
+    if isinstance(value, (float, np.floating)):
+        return repr(float(value))
+    if isinstance(value, np.ndarray):
+        return "array" + str(value.dtype) + str(value.shape) + hashlib.sha256(np.ascontiguousarray(value).tobytes()).hexdigest()
+    if isinstance(value, (list, tuple)):
+        return "(" + ",".join(_canon(v) for v in value) + ")"
+    if isinstance(value, dict):
+        return "{" + ",".join(_canon(k) + ":" + _canon(value[k]) for k in sorted(value, key = str)) + "}"
+    return type(value).__name__
+
+def _isLibrary(moduleName):
+    # standard library, installed packages and builtins, which don't change while a study is run
+    if moduleName is None:
+        return False
+    top = moduleName.split(".")[0]
+    if top == "__main__":
+        return False
+    if top in sys.stdlib_module_names:
+        return True
+    path = getattr(sys.modules.get(top), "__file__", None)
+    return path is None or "site-packages" in path or "dist-packages" in path
+
+def _libraryName(value, moduleName):
+    top = sys.modules.get(moduleName.split(".")[0])
+    name = getattr(value, "__qualname__", None) or getattr(value, "__name__", None) or type(value).__name__
+    return moduleName + "." + name + " " + str(getattr(top, "__version__", ""))
+
+def _names(code):
+    # global and attribute names used by code and the code nested in it (lambdas, comprehensions, inner functions)
+    names = set(code.co_names)
+    for const in code.co_consts:
+        if isinstance(const, types.CodeType):
+            names |= _names(const)
+    return names
+
+def _value(value, seen, label):
+    # process independent text for a value read by a model function, raises _Unhashable when a change of it couldn't be seen
+    if id(value) in seen:   # shared or recursive, hashed where it was first seen
+        return "<seen>"
+    if value is None or isinstance(value, (bool, str, bytes, int, float, complex)):
+        return _canon(value)
+    if isinstance(value, np.generic):
+        return str(value.dtype) + _canon(value.item())
+    seen[id(value)] = value   # kept alive so that its id isn't reused during the walk
+    if isinstance(value, np.ndarray):
+        return "array" + str(value.shape) + _value(value.tolist(), seen, label) if value.dtype.hasobject else _canon(value)
+    if isinstance(value, dict):
+        return "{" + ",".join(sorted(_value(k, seen, label) + ":" + _value(v, seen, label) for k, v in value.items())) + "}"
+    if isinstance(value, (set, frozenset)):
+        return type(value).__name__ + "(" + ",".join(sorted(_value(v, seen, label) for v in value)) + ")"
+    if isinstance(value, (list, tuple)):
+        return type(value).__name__ + "(" + ",".join(_value(v, seen, label) for v in value) + ")"
+    if isinstance(value, Variable):
+        return _variable(value)
+    if isinstance(value, types.ModuleType):
+        return "module " + value.__name__ + (" " + str(getattr(value, "__version__", "")) if _isLibrary(value.__name__) else "")
+    if isinstance(value, functools.partial):
+        return "partial" + _value(value.func, seen, label) + _value(value.args, seen, label) + _value(value.keywords, seen, label)
+    if isinstance(value, types.FunctionType):
+        if _isLibrary(value.__module__):
+            return _libraryName(value, value.__module__)
+        return _function(value, seen)
+    moduleName = getattr(value, "__module__", None)
+    owner = getattr(value, "__self__", None)
+    if callable(value) and _isLibrary(moduleName) and (owner is None or isinstance(owner, types.ModuleType)):
+        return _libraryName(value, moduleName)   # builtins, numpy ufuncs, library classes
+    raise _Unhashable(label + " (" + type(value).__name__ + ")")
+
+def _function(function, seen):
+    seen[id(function)] = function
+    code = function.__code__
+    try:
+        source = inspect.getsource(function)
+    except (OSError, TypeError):
+        source = _canon((code.co_code.hex(), [c for c in code.co_consts if not isinstance(c, types.CodeType)], list(code.co_names)))
+    label = function.__module__ + "." + function.__qualname__
+    names = sorted(_names(code))
+    scope = function.__globals__
+    reads = {}
+    for name in names:
+        if name in scope:
+            reads[name] = _value(scope[name], seen, label + " reads " + name)
+    for moduleName in names:    # module.attribute of the modules of the project
+        module = scope.get(moduleName)
+        if isinstance(module, types.ModuleType) and not _isLibrary(module.__name__):
+            for name in names:
+                if hasattr(module, name):
+                    reads[moduleName + "." + name] = _value(getattr(module, name), seen, label + " reads " + moduleName + "." + name)
+    cells = []
+    for cell in function.__closure__ or ():
+        try:
+            cells.append(_value(cell.cell_contents, seen, label + " closure"))
+        except ValueError:   # not assigned yet
+            cells.append("<empty>")
+    defaults = _value((function.__defaults__, function.__kwdefaults__), seen, label + " defaults")
+    return source + _canon(reads) + _canon(cells) + defaults
+
+def _variable(var):
+    sweep = var.getSweep()
+    if sweep is None:
+        spec = "None"
+    elif isinstance(sweep, ExplicitSweep):
+        spec = _canon(sweep.values())
+    else:
+        spec = _canon({key: val for key, val in vars(sweep).items() if key != "cache"})
+    return _canon((var.getName(), var.getValue(), var.getUnit(), var.getStart(), var.getStop(), var.getStep(), type(sweep).__name__)) + spec
+
+def _model(model, seen):
+    names = sorted(model.variables)
+    return _canon((model.getName(), model.getAttrs(), model.vectorized)) + _value(model.function, seen, model.getName() + " function") + \
+           "".join(_variable(model.variables[name]) for name in names)
+
+def fingerprint(hierarchy, variables = (), extra = None):
+    """
+    fingerprint: sha256 hex digest of hierarchy (see module description), the Variables in variables (e.g. swept ones that no model uses) and extra,
+                 any combination of numbers, strings, arrays, lists and dictionaries describing what is computed from the hierarchy. None when a
+                 model function reads something the hash can't cover.
+    """
+    parts = []
+    seen = {}
+    queue = [hierarchy]
+    head = 0
+    try:
+        while head < len(queue):   # breadth-first, children in order
+            node = queue[head]
+            head += 1
+            parts.append(_canon((type(node).__name__, node.getName())))
+            parts.append(_canon({field: getattr(node, field) for field in _FIELDS if hasattr(node, field)}))
+            if isinstance(node, Component):
+                current = node.CurrentModel.getName() if node.hasCurrentModel() else None
+                parts.append(_canon(current))
+                for name in sorted(node.Models):
+                    parts.append(_model(node.Models[name], seen))
+            else:
+                parts.append(str(len(queue)))
+                queue.extend(list(node.components) + list(node.componentGroups) + list(node.voltageRegulators))
+                parts.append(str(len(queue)))
+    except _Unhashable as error:
+        Log.info("Fingerprint:", str(error), "can't be hashed, the hierarchy has no fingerprint")
+        return None
+    for var in variables:
+        parts.append(_variable(var))
+    parts.append(_canon(extra))
+    return hashlib.sha256("\n".join(parts).encode()).hexdigest()
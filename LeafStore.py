@@ -0,0 +1,233 @@
+# -*- coding: utf-8 -*-
+"""
+Created on 10/17/26
+
+LeafStore: Shared typed storage of the numbers of leaf Components. A Component is a small handle on a slot of a LeafBlock; a block holds
+           BLOCK_SIZE leaves with one double per number (array.array), so a value costs 8 bytes instead of a float object and the pointer to
+           it. A kind byte next to every value keeps what was assigned: floats, ints, numpy float64 and None come back as they went in, any
+           other value is kept as it is in a side dictionary of the block. Models are only stored for the leaves that have some. The slots of
+           deleted Components are reused.
+
+Most Recent Update 10/17/26
+    - Created module
+
+Functions:
+    allocate()
+    release()
+    position()
+    position()
+    number()
+    computeTotalPower()
+    attribute()
+
+Classes:
+    LeafBlock
+
+"""
+
+import array
+import numpy as np
+
+BLOCK_SIZE = 1024
+FIELDS = ("ActivePower", "InactivePower", "ActiveCurrent", "InactiveCurrent", "VDD", "DutyCycle", "TotalPower", "TotalCurrent")
+
+_NONE, FLOAT, _INT, _NUMPY, _OTHER = range(5)     # kinds of values, FLOAT for a float stored as it is
+_SLOTS = tuple(range(BLOCK_SIZE))  # shared int objects, so a handle doesn't own the number of its slot
+_TYPES = [None, "POWER", "IV"]      # Type values, stored as their index
+_TYPE_CODES = {value: code for code, value in enumerate(_TYPES)}
+
+class LeafBlock():
+    """ Storage of BLOCK_SIZE leaves
+        Attributes:
+            - values: array.array of doubles, number i of FIELDS of slot s at i * BLOCK_SIZE + s
+            - kinds: bytearray of the kind of every value, same layout
+            - others: dictionary of position -> value of the values stored as they are
+            - types: bytearray of the Type of every slot, as an index of _TYPES
+            - dirty: bytearray of the dirty flag of every slot
+            - models: dictionary of slot -> [Models, CurrentModel, CurrentModelVal] of the leaves with models
+            - used: (int) number of slots handed out
+        Methods:
+            get() - value at a position
+            set() - store a value at a position
+            clear() - reset a slot for reuse
+    """
+
+    __slots__ = ("values", "kinds", "others", "types", "dirty", "models", "used")
+
+    def __init__(self):
+        self.values = array.array("d", bytes(8 * BLOCK_SIZE * len(FIELDS)))
+        self.kinds = bytearray(BLOCK_SIZE * len(FIELDS))
+        self.others = {}
+        self.types = bytearray(BLOCK_SIZE)
+        self.dirty = bytearray(BLOCK_SIZE)
+        self.models = {}
+        self.used = 0
+
+    def get(self, at):
+        kind = self.kinds[at]
+        if kind == FLOAT:
+            return self.values[at]
+        if kind == _NONE:
+            return None
+        if kind == _INT:
+            return int(self.values[at])
+        if kind == _NUMPY:
+            return np.float64(self.values[at])
+        return self.others[at]
+
+    def set(self, at, value):
+        if self.kinds[at] == _OTHER:
+            del self.others[at]
+        kind = type(value)
+        if kind is float:
+            self.values[at] = value
+            self.kinds[at] = FLOAT
+        elif value is None:
+            self.kinds[at] = _NONE
+        elif kind is int and -2**53 <= value <= 2**53:  # exact as a double
+            self.values[at] = value
+            self.kinds[at] = _INT
+        elif kind is np.float64:
+            self.values[at] = value
+            self.kinds[at] = _NUMPY
+        else:
+            self.others[at] = value
+            self.kinds[at] = _OTHER
+
+    def clear(self, slot):
+        if self.others:
+            for at in range(slot, len(self.kinds), BLOCK_SIZE):
+                self.others.pop(at, None)
+        self.kinds[slot::BLOCK_SIZE] = bytes(len(FIELDS))     # _NONE
+        self.types[slot] = 0
+        self.dirty[slot] = 0
+        self.models.pop(slot, None)
+
+_current = LeafBlock()
+_free = []      # (block, slot) of deleted Components, handed out first
+
+_ACTIVE_POWER, _INACTIVE_POWER, _ACTIVE_CURRENT, _INACTIVE_CURRENT, _VDD, _DUTY_CYCLE, _TOTAL_POWER, _TOTAL_CURRENT = \
+    (index * BLOCK_SIZE for index in range(len(FIELDS)))
+
+def allocate():
+    """
+    allocate: (block, slot) for a new Component
+    """
+    global _current
+    if _free:
+        return _free.pop()
+    if _current.used == BLOCK_SIZE:
+        _current = LeafBlock()
+    slot = _SLOTS[_current.used]
+    _current.used += 1
+    return _current, slot
+
+def release(block, slot):
+    """
+    release: reset the slot of a deleted Component and hand it out again
+    """
+    block.clear(slot)
+    _free.append((block, slot))
+
+def position(name):
+    """
+    position: offset of the number name of FIELDS in a block, the value of slot s is at position(name) + s
+    """
+    return FIELDS.index(name) * BLOCK_SIZE
+
+def number(name):
+    """
+    number: property of a Component storing the number name of FIELDS in its block
+    """
+    offset = position(name)
+
+    def get(self):
+        block = self._block
+        at = offset + self._slot
+        if block.kinds[at] == FLOAT:   # the common case, without a call
+            return block.values[at]
+        return block.get(at)
+
+    def set(self, value):
+        block = self._block
+        at = offset + self._slot
+        if type(value) is float and block.kinds[at] != _OTHER:
+            block.values[at] = value
+            block.kinds[at] = FLOAT
+        else:
+            block.set(at, value)
+
+    return property(get, set)
+
+def computeTotalPower(block, slot, kind):
+    """
+    computeTotalPower: Component._computeTotalPower() of the leaf in slot of block with Type kind, on the doubles of the block, when its
+                       inputs are floats and its outputs aren't stored as they are. Returns False and changes nothing otherwise.
+    """
+    kinds = block.kinds
+    values = block.values
+    if kind == "POWER":
+        if kinds[_INACTIVE_POWER + slot] != FLOAT or kinds[_ACTIVE_POWER + slot] != FLOAT or kinds[_DUTY_CYCLE + slot] != FLOAT or \
+           kinds[_TOTAL_POWER + slot] == _OTHER:
+            return False
+        inactive = values[_INACTIVE_POWER + slot]
+        values[_TOTAL_POWER + slot] = inactive + (values[_ACTIVE_POWER + slot] - inactive) * values[_DUTY_CYCLE + slot]
+        kinds[_TOTAL_POWER + slot] = FLOAT
+        return True
+    if kind == "IV":
+        if kinds[_INACTIVE_CURRENT + slot] != FLOAT or kinds[_ACTIVE_CURRENT + slot] != FLOAT or kinds[_DUTY_CYCLE + slot] != FLOAT or \
+           kinds[_VDD + slot] != FLOAT or _OTHER in (kinds[_TOTAL_CURRENT + slot], kinds[_ACTIVE_POWER + slot], kinds[_INACTIVE_POWER + slot],
+                                                     kinds[_TOTAL_POWER + slot]):
+            return False
+        vdd = values[_VDD + slot]
+        inactive = values[_INACTIVE_CURRENT + slot]
+        active = values[_ACTIVE_CURRENT + slot]
+        total = inactive + (active - inactive) * values[_DUTY_CYCLE + slot]
+        values[_TOTAL_CURRENT + slot] = total
+        values[_ACTIVE_POWER + slot] = active * vdd
+        values[_INACTIVE_POWER + slot] = inactive * vdd
+        values[_TOTAL_POWER + slot] = vdd * total
+        kinds[_TOTAL_CURRENT + slot] = kinds[_ACTIVE_POWER + slot] = kinds[_INACTIVE_POWER + slot] = kinds[_TOTAL_POWER + slot] = FLOAT
+        return True
+    return False
+
+def attribute(index, empty = None):
+    """
+    attribute: property of a Component storing its Models (index 0), CurrentModel (1) or CurrentModelVal (2), kept only for the components
+               with models. An absent value reads as empty(component) when empty is given, None otherwise.
+    """
+    def get(self):
+        entry = self._block.models.get(self._slot)
+        value = None if entry is None else entry[index]
+        if value is None and empty is not None:
+            return empty(self)
+        return value
+
+    def set(self, value):
+        entry = self._block.models.get(self._slot)
+        if entry is None:
+            if value is None:
+                return
+            entry = self._block.models[self._slot] = [None, None, None]
+        entry[index] = value
+
+    return property(get, set)
+
+def _getType(self):
+    return _TYPES[self._block.types[self._slot]]
+
+def _setType(self, value):
+    code = _TYPE_CODES.get(value)
+    if code is None:
+        code = _TYPE_CODES[value] = len(_TYPES)
+        _TYPES.append(value)
+    self._block.types[self._slot] = code
+
+def _getDirty(self):
+    return self._block.dirty[self._slot] == 1
+
+def _setDirty(self, value):
+    self._block.dirty[self._slot] = 1 if value else 0
+
+Type = property(_getType, _setType)
+dirty = property(_getDirty, _setDirty)
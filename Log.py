@@ -0,0 +1,130 @@
+# -*- coding: utf-8 -*-
+"""
+Created on 10/17/26
+
+Log: Library-wide messages with levels, on top of the standard logging module (logger "sps"). Every message of the library goes through this
+     module instead of print(). The current level is kept in Log.level, so hot paths skip a disabled message with one integer comparison,
+     before any formatting:
+
+         if Log.level <= Log.DEBUG: Log.debug("Updating", comp.getName())
+
+     By default messages go to stdout like print() did, from INFO up in an interactive session, and nothing is logged when stdout isn't a
+     terminal (batch runs; errors still stop the run). The environment variable SPS_LOG_LEVEL (debug, info, warning, error or off) or
+     setVerbosity() override that.
+     Values rejected by component setters are warnings. While countRejections() is on they are counted per component and attribute instead,
+     without a message, so a batch run can report a summary rather than one line per event.
+
+Most Recent Update 10/17/26
+    - Created module
+
+Functions:
+    setVerbosity()
+    getVerbosity()
+    setHandler()
+    log(), debug(), info(), warning(), error()
+    reject()
+    countRejected()
+    countRejections()
+    getRejections()
+    resetRejections()
+
+"""
+
+import os
+import sys
+import logging
+
+DEBUG = logging.DEBUG
+INFO = logging.INFO
+WARNING = logging.WARNING
+ERROR = logging.ERROR
+OFF = logging.CRITICAL + 10
+
+_names = {"debug": DEBUG, "info": INFO, "warning": WARNING, "error": ERROR, "off": OFF}
+
+logger = logging.getLogger("sps")
+logger.propagate = False
+_handler = logging.StreamHandler(sys.stdout)
+_handler.setFormatter(logging.Formatter("%(message)s"))
+logger.addHandler(_handler)
+
+level = OFF         # current level, read directly by hot paths
+counting = False    # True while rejected setter values are counted
+rejections = {}     # (component name, attribute) -> number of rejected values
+
+def setVerbosity(newLevel):
+    """
+    setVerbosity: show messages from newLevel up, a level constant or one of "debug", "info", "warning", "error", "off"
+    """
+    global level
+    if isinstance(newLevel, str):
+        newLevel = _names[newLevel.lower()]
+    level = newLevel
+    logger.setLevel(newLevel)
+
+def getVerbosity():
+    return level
+
+def setHandler(handler):
+    """
+    setHandler: send messages to a logging.Handler instead of stdout, e.g. a FileHandler for batch logs. None hands them to the root logger.
+    """
+    logger.removeHandler(_handler)
+    for old in list(logger.handlers):
+        logger.removeHandler(old)
+    if handler is None:
+        logger.propagate = True
+    else:
+        logger.propagate = False
+        logger.addHandler(handler)
+
+def log(msgLevel, *args, **fields):
+    """
+    log: message made of args like print(), with fields as structured extra attributes of the log record
+    """
+    if level <= msgLevel:
+        logger.log(msgLevel, " ".join(str(arg) for arg in args), extra = fields or None)
+
+def debug(*args, **fields):
+    log(DEBUG, *args, **fields)
+
+def info(*args, **fields):
+    log(INFO, *args, **fields)
+
+def warning(*args, **fields):
+    log(WARNING, *args, **fields)
+
+def error(*args, **fields):
+    log(ERROR, *args, **fields)
+
+def reject(node, attr, value, reason):
+    """
+    reject: a setter of node refused value for attr, counted when counting and logged as a warning otherwise
+    """
+    if counting:
+        countRejected(node, attr, 1)
+    elif level <= WARNING:
+        log(WARNING, node.getName() + ":", attr, value, reason, component = node.getName(), attr = attr, value = value)
+
+def countRejected(node, attr, n):
+    key = (node.getName(), attr)
+    rejections[key] = rejections.get(key, 0) + n
+
+def countRejections(enable = True):
+    """
+    countRejections: start (or stop) counting rejected setter values, see getRejections()
+    """
+    global counting
+    counting = enable
+
+def getRejections():
+    """
+    getRejections: dictionary of (component name, attribute) -> number of values rejected since counting started or the last reset
+    """
+    return dict(rejections)
+
+def resetRejections():
+    rejections.clear()
+
+_env = os.environ.get("SPS_LOG_LEVEL")
+setVerbosity(_env if _env else (INFO if sys.stdout.isatty() else OFF))
@@ -3,10 +3,15 @@
 Created on 11/18/20
 @author: Henry Bishop
 
-Most Recent Update 11/18/20:
+Most Recent Update 10/17/26:
+- reading a dirty power updates the dirty containers below deepest first (updateDirty()), markDirty() and markTopologyChanged() are
+  iterative, so hierarchies of any depth work
+
+Update 11/18/20:
 - Created LogicalGroup class
 """
 import numpy as np
+import NodeLinks
 
 class LogicalGroup:
 
@@ -24,9 +29,20 @@ class LogicalGroup:
         - voltageRegulators: array of voltageRegulator objects inside of this ComponentGroup
         - hierarchy: once updated, provides tree structure of component-type objects of everything beneath this ComponentGroup
         - TotalPower: (float) once updated, summation of all average power of component-type objects beneath this ComponentGroup
+        - parents: (tuple) weak references to the containers of this LogicalGroup, see getParents()
+        - dirty: (bool) True when a member changed since TotalPower was last computed
     Methods:
         getTotalPower() - return TotalPower value
-        clearHierarchy() - 
+        clearHierarchy() - empty hierarchy
+        resetHierarchy() - point hierarchy at the current child containers
+        addParent() - register a container of this object
+        removeParent() - unregister a container of this object
+        getParents() - return the containers of this object
+        updateDirty() - update the dirty containers below this object and then this object
+        markDirty() - flag this object and all of its ancestors for recomputation
+        markTopologyChanged() - bump topologyVersion of this object and all of its ancestors
+        isDirty() - return dirty flag
+        registerChildren() - register this object as parent of its children
 
     """
 
@@ -35,24 +51,36 @@ class LogicalGroup:
         self.components = np.array(components)
         self.componentGroups = np.array(componentGroups)
         self.voltageRegulators = np.array(voltageRegulators)
-        self.hierarchy = dict(comp=components,compGroups=componentGroups,vReg=voltageRegulators)
+        self.hierarchy = dict(comp=self.components,compGroups=self.componentGroups,vReg=self.voltageRegulators)
+        self.topologyVersion = 0
+        self.nameIndex = None   # built by ComponentFunctions.getNameIndex()
+        self.nameIndexVersion = -1
         self.TotalPower = 0.0
         self.InactivePower = 0.0
+        self.parents = ()
+        self.dirty = False
+        self.registerChildren()
         self.updateTotalPower()
         self.getTotalPower()
 
     def setName(self,name):
         self.name = name
+        NodeLinks.markParentsTopologyChanged(self)
 
     def getTotalPower(self):
+        if self.dirty: self.updateDirty()
         return self.TotalPower
 
     def getInactivePower(self):
+        if self.dirty: self.updateDirty()
         return self.InactivePower
 
     def getName(self):
         return self.name
 
+    def updateDirty(self):
+        NodeLinks.updateDirty(self)
+
     def updateTotalPower(self):
         self.updateInactivePower()
         tempSum = 0.0
@@ -63,6 +91,8 @@ class LogicalGroup:
         for comp in self.hierarchy["vReg"]:
             tempSum = tempSum + comp.getTotalPower()
         self.TotalPower = tempSum
+        self.dirty = False
+        NodeLinks.markParentsDirty(self)
 
     def updateInactivePower(self):
         tempSum = 0.0
@@ -77,4 +107,37 @@ class LogicalGroup:
     def clearHierarchy(self):
         self.hierarchy = dict(comp=np.array([]),compGroups=np.array([]),vReg=np.array([]))
 
+    def resetHierarchy(self):
+        self.hierarchy = dict(comp=self.components,compGroups=self.componentGroups,vReg=self.voltageRegulators)
+        self.markTopologyChanged()
+        self.registerChildren()
+        self.markDirty()
+
+    def addParent(self, parent):
+        NodeLinks.addParent(self, parent)
+
+    def removeParent(self, parent):
+        NodeLinks.removeParent(self, parent)
+
+    def getParents(self):
+        return NodeLinks.getParents(self)
+
+    def markDirty(self):
+        NodeLinks.markDirty(self)
+
+    def isDirty(self):
+        return self.dirty
+
+    def markTopologyChanged(self):
+        NodeLinks.markTopologyChanged(self)
+
+    def registerChildren(self):
+        NodeLinks.registerChildren(self)
+
+    def __getstate__(self):
+        return NodeLinks.getState(self)
+
+    def __setstate__(self, state):
+        NodeLinks.setState(self, state)
+
 
@@ -3,7 +3,11 @@
 Created on 3/12/21
 @author: Henry Bishop
 
+Most Recent Update 10/17/26
+- useMode() reports through Log instead of printing
+
 """
+import Log
 from Model import Model
 from Component import Component
 import ComponentFunctions as CF
@@ -43,8 +47,8 @@ class Mode:
             self.components[i].setCurrentModel(self.modelNames[i])
         CF.updateHierarchy(self.system)
         self.TotalPower = self.system.getTotalPower()
-        print("Mode",self.name,"applied to",self.system.getName(),".")
-        print("Mode power is",self.TotalPower)
+        Log.info("Mode",self.name,"applied to",self.system.getName(),".")
+        Log.info("Mode power is",self.TotalPower)
         return self.TotalPower
 
     def averageModes(self):
@@ -6,25 +6,38 @@ Created on 7/4/20
 Model class: The Model class is used to group a custom function/model written by the user and variables that are used in those functions and perform single calculations
             or sweeps with the custom model.
 
-Most Recent Update 7/4/20
+Most Recent Update 10/17/26
+    - Multi-output models: functionAttr may list several attributes, the function then returns a dictionary of attribute values
+    - Models that don't declare vectorized are traced once into a NumPy expression graph (ModelTracer), cached as traced. Functions that read
+      globals or closures besides numpy and math aren't traced, since the trace would freeze their values, and run point by point
+    - Array-capable models: runFunctionArray() evaluates a whole sweep in one call, sweepFunction() uses it and returns ndarrays
+    - Opt-in LRU memoization of runFunction() through a ModelCache that several models can share. function is a property: assigning it like
+      setFunction() drops the cached results and the trace of the old function
+    - Models register with their Variables and keep the components that use them as CurrentModel
+
+Update 7/4/20
     - Created class
 
-To Do: 
-    - Incorporate ability to allow for more than one output from custom function
-
 """
 
 import numpy as np
 from Variable import Variable
+from ModelCache import ModelCache
+from ModelTracer import trace
+import Log
 
 class Model():
 
-    def __init__(self, name = "", variables = {}, function = None, functionAttr = ""):
+    def __init__(self, name = "", variables = {}, function = None, functionAttr = "", vectorized = None):
         self.name = name
         self.variables = {}
+        self.components = []    # components that use this model as CurrentModel, registered by Component.setCurrentModel()
+        self.cache = None       # ModelCache set by enableCache(), None runs the function every time
         self.addVariables(variables)
         self.function = function
         self.functionAttr = functionAttr
+        self.vectorized = vectorized    # True: function takes ndarray variable values, False: scalars only, None: trace the function
+        self.traced = None      # TracedFunction of function, False if it can't be traced, None until getTrace() runs
 
     def getName(self):
         return self.name
@@ -38,27 +51,158 @@ class Model():
     def setAttr(self,attr):
         self.functionAttr = attr
 
+    def getAttrs(self):
+        # attributes the model assigns, in the order Component.runModel() applies them
+        if self.isMultiOutput(): return list(self.functionAttr)
+        return [self.functionAttr]
+
+    def isMultiOutput(self):
+        return not isinstance(self.functionAttr, str)
+
+    def getFunction(self):
+        return self._function
+
+    def setFunction(self, function):
+        if "_function" in self.__dict__:
+            self.invalidateCache()
+        self._function = function
+        self.traced = None
+        self.markDirty()
+
+    function = property(getFunction, setFunction)
+
     def addVariables(self, variables):
         #self.variables.update(variables)
         #self.variables.append(variables)
         for var in variables:
             self.variables[var.getName()] = var
+            var.addModel(self)
+        self.traced = None
+        self.invalidateCache()
+        self.markDirty()
+
+    def removeVariables(self, names):
+        for name in names:
+            self.variables.pop(name).removeModel(self)
+        self.traced = None
+        self.invalidateCache()
+        self.markDirty()
+
+    def isVectorized(self):
+        return self.vectorized
+
+    def setVectorized(self, vectorized):
+        self.vectorized = vectorized
+
+    def getTrace(self):
+        """
+        getTrace: TracedFunction of the model function (see ModelTracer.trace()), traced on first use and kept until the function or variables change.
+                  Returns False for functions that can't be traced, or that read state besides their Variables which the trace would freeze.
+        """
+        if self.traced is None:
+            self.traced = trace(self.function, self.getVariableNames()) or False
+        return self.traced
+
+    def enableCache(self, cache = None, maxSize = 1024):
+        """
+        enableCache: memoize runFunction() in cache, or in a new ModelCache of maxSize entries. Pass the same cache to several models to share it.
+        """
+        self.cache = cache if cache is not None else ModelCache(maxSize)
+        return self.cache
+
+    def disableCache(self):
+        self.cache = None
+
+    def getCache(self):
+        return self.cache
+
+    def getCacheStats(self):
+        if self.cache is None: return None
+        return self.cache.getStats()
+
+    def invalidateCache(self):
+        # entries of the current function, e.g. after the function or the variable set changed
+        if self.cache is not None:
+            self.cache.invalidate(self.function)
+
+    def addComponent(self, comp):
+        if not any(c is comp for c in self.components):
+            self.components.append(comp)
+
+    def removeComponent(self, comp):
+        self.components = [c for c in self.components if c is not comp]
+
+    def getComponents(self):
+        return self.components
+
+    def markDirty(self):
+        # A variable of this model changed, so every component using it must rerun the model on its next read
+        for comp in self.components:
+            comp.markDirty()
 
     def getVariableNames(self):
         return list(self.variables.keys())
 
     def runFunction(self):
-        return self.function(self.variables)
+        if self.cache is None:
+            return self.function(self.variables)
+        key = ModelCache.makeKey(self.function, self.variables)
+        if key is None:
+            return self.function(self.variables)
+        found, result = self.cache.lookup(key)
+        if not found:
+            result = self.function(self.variables)
+            self.cache.store(key, result)
+        return result
+
+    def runFunctionArray(self, values, shape = None):
+        """
+        runFunctionArray: evaluate the function for many points at once. values maps some of the model's Variables to arrays that broadcast against each
+                          other to shape (their broadcast shape by default). Array-capable models are called once with ndarray-valued copies of those
+                          Variables (see Variable.arrayCopy()); scalar-only models run once per point. With vectorized None, the traced expression graph
+                          of the function (see getTrace()) is evaluated on the arrays instead, and functions that can't be traced run once per point.
+                          Returns the flattened outputs, or a dictionary of flattened outputs per attribute for multi-output models.
+        """
+        values = {var: np.asarray(vals, dtype=float) for var, vals in values.items()}
+        if shape is None:
+            shape = np.broadcast_shapes(*[vals.shape for vals in values.values()])
+        function = self.function if self.vectorized else self.getTrace()
+        if self.vectorized is not False and function:
+            variables = dict(self.variables)
+            for name, var in self.variables.items():
+                if var in values:
+                    variables[name] = var.arrayCopy(values[var])
+            result = function(variables)
+            outputs = {}
+            for attr in self.getAttrs():
+                out = np.asarray(result[attr] if self.isMultiOutput() else result, dtype=float)
+                if np.broadcast_shapes(out.shape, shape) != shape:
+                    Log.error("Model", self.name, "returned shape", out.shape, "for sweep shape", shape)
+                    assert (False)
+                outputs[attr] = np.broadcast_to(out, shape).ravel()
+            return outputs if self.isMultiOutput() else outputs[self.functionAttr]
+        swept = [var for var in self.variables.values() if var in values]
+        flat = [np.broadcast_to(values[var], shape).ravel() for var in swept]
+        oldVals = [var.getValue() for var in swept]
+        size = int(np.prod(shape))
+        outputs = {attr: np.empty(size) for attr in self.getAttrs()}
+        for k in range(size):
+            for var, vals in zip(swept, flat):
+                var.setValue(vals[k])
+            result = self.runFunction()
+            for attr in outputs:
+                outputs[attr][k] = result[attr] if self.isMultiOutput() else result
+        for var, old in zip(swept, oldVals):
+            var.setValue(old)
+        return outputs if self.isMultiOutput() else outputs[self.functionAttr]
 
     def sweepFunction(self, sweepVar):
-        array = []
+        # returns the sweep values and an ndarray of outputs, multi-output models return a dictionary of ndarrays per attribute
         sweepVar.setSweepVals()
-        oldVal = sweepVar.getValue()
-        for val in sweepVar.getSweepVals():
-            sweepVar.setValue(val)
-            array.append(self.runFunction())
-        sweepVar.setValue(oldVal)
-        return sweepVar.getSweepVals(),array
+        vals = sweepVar.getSweepVals()
+        if sweepVar.getSweepSize() == 0:
+            return vals,({attr: np.empty(0) for attr in self.getAttrs()} if self.isMultiOutput() else np.empty(0))
+        return vals,self.runFunctionArray({sweepVar: vals})
 
 
     
\ No newline at end of file
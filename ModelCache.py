@@ -0,0 +1,80 @@
+# -*- coding: utf-8 -*-
+"""
+Created on 10/17/26
+
+ModelCache class: Bounded least-recently-used cache of Model.runFunction() results, keyed on the model function and the current values of its
+                  variables. A cache can be shared by several Models (see Model.enableCache()), so models that run the same function on the same
+                  variables, like the duty cycle models driven by one Duty_Cycle variable, share their entries.
+
+Most Recent Update 10/17/26
+    - Created class
+
+"""
+
+from collections import OrderedDict
+
+class ModelCache():
+    """ LRU cache of model results
+        Attributes:
+            - maxSize: (int) number of entries kept, the least recently used entry is evicted beyond that
+            - entries: OrderedDict of key -> result, least recently used first
+            - hits, misses, evictions: (int) counters since creation or the last clear()
+        Methods:
+            lookup() - return (True, result) for a cached key, (False, None) otherwise
+            store() - add a result, evicting the least recently used entry when full
+            invalidate() - drop the entries of one model function, or every entry
+            clear() - drop every entry and reset the counters
+            getStats() - return a dictionary of hits, misses, evictions, size and hit rate
+    """
+
+    def __init__(self, maxSize = 1024):
+        self.maxSize = maxSize
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def makeKey(function, variables):
+        """
+        makeKey: key for function evaluated on a dictionary of Variables, or None when a value can't be hashed (e.g. an ndarray)
+        """
+        key = (function, tuple((name, variables[name].getValue()) for name in sorted(variables)))
+        try:
+            hash(key)
+        except TypeError:
+            return None
+        return key
+
+    def lookup(self, key):
+        if key in self.entries:
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return True, self.entries[key]
+        self.misses += 1
+        return False, None
+
+    def store(self, key, result):
+        self.entries[key] = result
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.maxSize:
+            self.entries.popitem(last = False)
+            self.evictions += 1
+
+    def invalidate(self, function = None):
+        if function is None:
+            self.entries.clear()
+        else:
+            for key in [key for key in self.entries if key[0] is function]:
+                del self.entries[key]
+
+    def clear(self):
+        self.entries.clear()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def getStats(self):
+        calls = self.hits + self.misses
+        return dict(hits = self.hits, misses = self.misses, evictions = self.evictions, size = len(self.entries),
+                    hitRate = self.hits / calls if calls > 0 else 0.0)
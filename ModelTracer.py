@@ -0,0 +1,198 @@
+# -*- coding: utf-8 -*-
+"""
+Created on 10/17/26
+
+ModelTracer: Turns a scalar model function into a vectorized one. trace() runs the function once with symbolic TraceNode values in place of the
+             Variable values, which records every arithmetic operation (and NumPy ufunc) into an expression graph. The returned TracedFunction
+             replays the graph with NumPy arrays. A function that branches on a value, converts it to a Python number (math.exp, float(), int())
+             or fails in any other way while tracing can't be traced, and trace() returns None so the caller can evaluate it point by point.
+             The trace only follows the Variables, anything else the function reads would be frozen into it as a constant. Functions that read
+             global names or closure cells other than builtins and the numpy and math modules and functions are therefore never traced.
+
+Most Recent Update 10/17/26
+    - Created module
+
+Functions:
+    trace()
+
+Classes:
+    TraceError
+    TraceNode
+    TracedFunction
+
+"""
+
+import dis
+import types
+import builtins
+import operator
+import numpy as np
+from Variable import Variable
+
+class TraceError(Exception):
+    """ Raised while tracing when the function does something that depends on the actual value of a variable
+    """
+    pass
+
+def _binary(op):
+    def forward(self, other):
+        return TraceNode(op, (self, other))
+    def reflected(self, other):
+        return TraceNode(op, (other, self))
+    return forward, reflected
+
+def _untraceable(what):
+    def method(self, *args):
+        raise TraceError(what + " of a traced value")
+    return method
+
+class TraceNode():
+    """ Symbolic value recorded while tracing
+        Attributes:
+            - op: "var" for a variable, otherwise the operator or ufunc that computes the node
+            - args: variable name for "var", otherwise the operands (TraceNodes or constants)
+    """
+    __slots__ = ("op", "args")
+
+    def __init__(self, op, args):
+        self.op = op
+        self.args = args
+
+    __add__, __radd__ = _binary(operator.add)
+    __sub__, __rsub__ = _binary(operator.sub)
+    __mul__, __rmul__ = _binary(operator.mul)
+    __truediv__, __rtruediv__ = _binary(operator.truediv)
+    __floordiv__, __rfloordiv__ = _binary(operator.floordiv)
+    __mod__, __rmod__ = _binary(operator.mod)
+    __pow__, __rpow__ = _binary(operator.pow)
+
+    def __neg__(self):
+        return TraceNode(operator.neg, (self,))
+
+    def __pos__(self):
+        return TraceNode(operator.pos, (self,))
+
+    def __abs__(self):
+        return TraceNode(operator.abs, (self,))
+
+    def __array_ufunc__(self, ufunc, method, *inputs, **kwargs):
+        if method != "__call__" or kwargs or ufunc.nout != 1:
+            raise TraceError("np." + ufunc.__name__ + "." + method + " of a traced value")
+        return TraceNode(ufunc, inputs)
+
+    __bool__ = _untraceable("truth value")
+    __lt__ = _untraceable("comparison")
+    __le__ = _untraceable("comparison")
+    __gt__ = _untraceable("comparison")
+    __ge__ = _untraceable("comparison")
+    __eq__ = _untraceable("comparison")
+    __ne__ = _untraceable("comparison")
+    __hash__ = object.__hash__
+    __float__ = _untraceable("float()")
+    __int__ = _untraceable("int()")
+    __index__ = _untraceable("index")
+    __complex__ = _untraceable("complex()")
+    __round__ = _untraceable("round()")
+    __array__ = _untraceable("array conversion")
+    __len__ = _untraceable("len()")
+    __iter__ = _untraceable("iteration")
+
+class TracedFunction():
+    """ Replayable expression graph of a traced model function
+        Attributes:
+            - names: names of the variables the function reads
+            - steps: internal nodes of the graph in evaluation order (operands first)
+            - output: TraceNode or constant returned by the function, or a dictionary of them for multi-output models
+        Methods:
+            __call__() - evaluate the graph on a dictionary of Variables whose values may be ndarrays, like the model function itself
+    """
+
+    def __init__(self, output):
+        self.output = output
+        self.steps = []
+        self.names = []
+        seen = set()
+        roots = list(output.values()) if isinstance(output, dict) else [output]
+        stack = [(root, False) for root in reversed(roots)]
+        while stack:   # iterative post-order walk
+            node, expanded = stack.pop()
+            if not isinstance(node, TraceNode) or (id(node) in seen and not expanded):
+                continue
+            if node.op == "var":
+                seen.add(id(node))
+                if node.args not in self.names:
+                    self.names.append(node.args)
+            elif expanded:
+                self.steps.append(node)
+            else:
+                seen.add(id(node))
+                stack.append((node, True))
+                for arg in reversed(node.args):
+                    stack.append((arg, False))
+
+    def __call__(self, variables):
+        values = {}
+        def value(arg):
+            if not isinstance(arg, TraceNode):
+                return arg
+            if arg.op == "var":
+                return np.asarray(variables[arg.args].getValue(), dtype=float)
+            return values[id(arg)]
+        for node in self.steps:
+            values[id(node)] = node.op(*[value(arg) for arg in node.args])
+        if isinstance(self.output, dict):
+            return {key: value(node) for key, node in self.output.items()}
+        return value(self.output)
+
+_PURE_MODULES = ("numpy", "math")
+
+def _isPure(value):
+    # the numpy and math modules and what they define, which a trace may keep
+    if isinstance(value, types.ModuleType):
+        return value.__name__.split(".")[0] in _PURE_MODULES
+    return callable(value) and str(getattr(value, "__module__", None)).split(".")[0] in _PURE_MODULES
+
+def _readsOnlyVariables(function):
+    """
+    _readsOnlyVariables: True when function reads nothing but its argument, builtins and the numpy and math modules and functions, so that
+                         its trace stays valid whatever else changes
+    """
+    code = getattr(function, "__code__", None)
+    if code is None:
+        return False
+    for cell in function.__closure__ or ():
+        try:
+            if not _isPure(cell.cell_contents):
+                return False
+        except ValueError:     # empty cell
+            return False
+    codes = [code]
+    while codes:
+        code = codes.pop()
+        codes.extend(const for const in code.co_consts if isinstance(const, types.CodeType))
+        for instruction in dis.get_instructions(code):
+            if instruction.opname in ("LOAD_GLOBAL", "LOAD_NAME"):
+                name = instruction.argval
+                if name in function.__globals__:
+                    if not _isPure(function.__globals__[name]):
+                        return False
+                elif not hasattr(builtins, name):
+                    return False
+    return True
+
+def trace(function, names):
+    """
+    trace: trace function, which takes a dictionary of Variables named names, into a TracedFunction. Returns None when the function can't be traced,
+           including when it reads global names or closures that the trace would freeze (see module description).
+    """
+    if not _readsOnlyVariables(function):
+        return None
+    proxies = {name: Variable(name, TraceNode("var", name)) for name in names}
+    try:
+        output = function(proxies)
+    except Exception:
+        return None
+    outputs = output.values() if isinstance(output, dict) else [output]
+    if all(isinstance(out, TraceNode) or np.isscalar(out) for out in outputs):
+        return TracedFunction(output)
+    return None
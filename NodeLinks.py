@@ -0,0 +1,155 @@
+# -*- coding: utf-8 -*-
+"""
+Created on 10/17/26
+
+NodeLinks: Links between the objects of a hierarchy, shared by Component, ComponentGroup, VoltageRegulator and LogicalGroup. Every function
+           takes the object it works on, the classes only forward to them, so the containers expose the same API with one implementation.
+           The walks up and down the hierarchy are iterative, so hierarchies and regulator cascades of any depth work.
+
+           A node holds its containers (parents) as weak references: a container that is thrown away, e.g. a temporary LogicalGroup, is freed
+           and drops out of the parents of its children instead of being kept alive and walked by every later setter. The nodes with a single
+           container share one parents tuple per container. Pickled and copied nodes leave their parents out, every container registers
+           itself with its children again when it is loaded.
+
+Most Recent Update 10/17/26
+    - Created module
+
+Functions:
+    addChildren()
+    removeChildren()
+    addParent()
+    removeParent()
+    getParents()
+    registerChildren()
+    markDirty()
+    markParentsDirty()
+    markTopologyChanged()
+    markParentsTopologyChanged()
+    updateDirty()
+    getState()
+    setState()
+
+"""
+
+import weakref
+import numpy as np
+
+def addChildren(node, key, newChildren):
+    """
+    addChildren: append newChildren to the child array key ("components", "componentGroups" or "voltageRegulators") of node
+    """
+    setattr(node, key, np.append(getattr(node, key), newChildren))
+    node.resetHierarchy()
+
+def removeChildren(node, key, names):
+    """
+    removeChildren: remove the children named in names from the child array key of node and unregister node as their parent
+    """
+    children = getattr(node, key)
+    for comp in children:
+        if comp.getName() in names: comp.removeParent(node)
+    setattr(node, key, np.array([comp for comp in children if comp.getName() not in names], dtype=object))
+    node.resetHierarchy()
+
+_single = weakref.WeakKeyDictionary()   # container -> parents tuple of the nodes it is the only container of
+
+def addParent(node, parent):
+    """
+    addParent: register parent as a container of node, dropping the containers that were freed
+    """
+    ref = weakref.ref(parent)   # one shared reference per parent
+    if not node.parents:
+        parents = _single.get(parent)
+        if parents is None:
+            parents = _single[parent] = (ref,)
+        node.parents = parents
+    elif ref not in node.parents:
+        node.parents = tuple(p for p in node.parents if p() is not None) + (ref,)
+
+def removeParent(node, parent):
+    node.parents = tuple(p for p in node.parents if p() is not None and p() is not parent)
+
+def getParents(node):
+    """
+    getParents: tuple of the containers of node that are still alive
+    """
+    return tuple(parent for parent in (ref() for ref in node.parents) if parent is not None)
+
+def registerChildren(node):
+    """
+    registerChildren: register node as parent of every child, so setters below it can mark it dirty
+    """
+    for children in (node.components, node.componentGroups, node.voltageRegulators):
+        for comp in children:
+            addParent(comp, node)
+
+def markDirty(node):
+    """
+    markDirty: flag node for recomputation on the next read of its power, along with every container above it
+    """
+    if node.dirty: return
+    node.dirty = True
+    markParentsDirty(node)
+
+def markParentsDirty(node):
+    """
+    markParentsDirty: flag every container above node for recomputation, stopping at the ones already dirty since their ancestors are too
+    """
+    stack = list(node.parents)
+    while stack:
+        parent = stack.pop()()
+        if parent is not None and not parent.dirty:
+            parent.dirty = True
+            stack.extend(parent.parents)
+
+def markTopologyChanged(node):
+    """
+    markTopologyChanged: bump topologyVersion of node and of every container above it, so name indexes built on any of them are rebuilt
+    """
+    node.topologyVersion += 1
+    markParentsTopologyChanged(node)
+
+def markParentsTopologyChanged(node):
+    stack = list(node.parents)
+    while stack:
+        parent = stack.pop()()
+        if parent is not None:
+            parent.topologyVersion += 1
+            stack.extend(parent.parents)
+
+def updateDirty(node):
+    """
+    updateDirty: update every dirty container below node, deepest first, and then node, so reading a power never recurses down the hierarchy
+    """
+    order = [node]
+    head = 0
+    while head < len(order):
+        container = order[head]
+        head += 1
+        for comp in container.hierarchy["compGroups"]:
+            if comp.dirty: order.append(comp)
+        for comp in container.hierarchy["vReg"]:
+            if comp.dirty: order.append(comp)
+    for container in reversed(order):   # children come after their parent in breadth-first order
+        if container.dirty: container.updateTotalPower()
+
+def getState(node):
+    """
+    getState: attributes of node for pickle and copy, without its parents
+    """
+    state = dict(getattr(node, "__dict__", {}))
+    for cls in type(node).__mro__:
+        for name in cls.__dict__.get("__slots__", ()):
+            if name not in ("__weakref__", "__dict__") and hasattr(node, name):
+                state[name] = getattr(node, name)
+    state["parents"] = ()
+    return state
+
+def setState(node, state):
+    """
+    setState: restore the attributes of node from getState(), a container registers itself again as parent of its children
+    """
+    for name, value in state.items():
+        setattr(node, name, value)
+    if "components" in state:
+        registerChildren(node)
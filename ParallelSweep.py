@@ -0,0 +1,199 @@
+# -*- coding: utf-8 -*-
+"""
+Created on 10/17/26
+
+ParallelSweep class: Spreads CompiledHierarchy.evaluateBatch() over a pool of worker processes. The compiled hierarchy, with its components and
+                     models, is handed to every worker once when the pool starts; the pool and its shared memory then serve every batch until the
+                     ParallelSweep is closed. The sweep points of a batch are split into chunks. Workers evaluate the swept models and resolve the
+                     hierarchy for their chunks and write into shared memory, so sweep values and results travel in point order without being
+                     pickled. Setter validation runs in this process between the two stages, so the results are identical to evaluateBatch().
+
+Most Recent Update 10/17/26
+    - Created class
+    - carryLastPoint() for sweeps streamed in batches
+    - one pool and one set of shared memory blocks per ParallelSweep, reused by every batch
+
+"""
+
+import os
+import weakref
+import multiprocessing as mp
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+import numpy as np
+
+_worker = {}    # state of a worker process, set by _initWorker()
+
+def _initWorker(compiled):
+    _worker["compiled"] = compiled
+
+def _read(name, size, start, stop):
+    # copy of points start to stop of a shared array; no view may outlive the block
+    shm = shared_memory.SharedMemory(name = name)
+    vals = np.ndarray((size,), dtype = float, buffer = shm.buf)[start:stop].copy()
+    shm.close()
+    return vals
+
+def _write(name, size, start, stop, vals):
+    shm = shared_memory.SharedMemory(name = name)
+    np.ndarray((size,), dtype = float, buffer = shm.buf)[start:stop] = vals
+    shm.close()
+
+def _values(valueNames, shape, start, stop):
+    # sweep values of points start to stop per Variable of the worker's copy of the hierarchy, found through the leaf and name that use it
+    compiled = _worker["compiled"]
+    index = np.unravel_index(np.arange(start, stop), shape)
+    values = {}
+    for (i, varName), (name, varShape) in valueNames.items():
+        varSize = int(np.prod(varShape))
+        var = compiled.nodes[i].CurrentModel.variables[varName]
+        values[var] = np.broadcast_to(_read(name, varSize, 0, varSize).reshape(varShape), shape)[index]
+    return values
+
+def _modelChunk(valueNames, shape, affected, outNames, size, start, stop):
+    # Stage 1: swept model outputs for points start to stop
+    compiled = _worker["compiled"]
+    outputs = compiled.runModelsBatch(affected, _values(valueNames, shape, start, stop), (stop - start,))
+    for i, names in zip(affected, outNames):
+        for attr, name in names.items():
+            _write(name, size, start, stop, outputs[i][attr] if compiled.nodes[i].CurrentModel.isMultiOutput() else outputs[i])
+
+def _resolveChunk(overrideNames, resultName, size, start, stop):
+    # Stage 2: TotalPower of the root for points start to stop
+    overrides = {i: {param: _read(name, size, start, stop) for param, name in params.items()} for i, params in overrideNames.items()}
+    _write(resultName, size, start, stop, _worker["compiled"].resolveBatch(overrides, 0, stop - start))
+
+def _release(pool, blocks):
+    # stop the workers and free the shared blocks of a ParallelSweep
+    pool.shutdown()
+    for shm in blocks.values():
+        shm.close()
+        shm.unlink()
+    blocks.clear()
+
+class ParallelSweep():
+    """ Process-pool executor for CompiledHierarchy.evaluateBatch()
+        Attributes:
+            - compiled: CompiledHierarchy to evaluate
+            - workers: (int) number of worker processes, defaults to os.cpu_count()
+            - chunks: (int) number of chunks per worker, more chunks balance uneven workers better
+            - pool: ProcessPoolExecutor of the workers, started by the first evaluateBatch() and reused by the next ones
+            - blocks: dictionary of role -> SharedMemory block holding sweep values, model outputs, leaf parameters or results, reused by the
+                      next evaluateBatch() calls and grown when they need more points
+        Methods:
+            evaluateBatch() - TotalPower of the root for a batch of Variable values, same arguments and results as CompiledHierarchy.evaluateBatch()
+            applyLastPoint() - same as CompiledHierarchy.applyLastPoint()
+            carryLastPoint() - same as CompiledHierarchy.carryLastPoint()
+            close() - stop the workers and free the shared memory
+
+        The pool and the shared memory live as long as the ParallelSweep, so a sweep streamed in many batches (see
+        ComponentFunctions.iterSweepND()) or a solver calling evaluateBatch() repeatedly starts the workers once. They are released by close(),
+        at the end of a with block or when the ParallelSweep is garbage collected. Workers keep the hierarchy as it was when they started: close()
+        the ParallelSweep after changing anything other than the swept Variables.
+
+        Workers are forked where the platform supports it, so models may be lambdas or closures. Elsewhere the hierarchy and models are pickled
+        to start the workers, which requires model functions defined at module level.
+    """
+
+    def __init__(self, compiled, workers = None, chunks = 4):
+        self.compiled = compiled
+        self.workers = workers if workers is not None else os.cpu_count()
+        self.chunks = chunks
+        self.pool = None
+        self.blocks = {}
+        self._closer = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        if self._closer is not None:
+            self._closer()
+        self.pool = None
+        self._closer = None
+
+    def _startPool(self):
+        if self.pool is None:
+            context = mp.get_context("fork") if "fork" in mp.get_all_start_methods() else mp.get_context()
+            self.pool = ProcessPoolExecutor(max_workers = self.workers, mp_context = context, initializer = _initWorker, initargs = (self.compiled,))
+            self._closer = weakref.finalize(self, _release, self.pool, self.blocks)
+        return self.pool
+
+    def _share(self, key, vals, size):
+        # shared block of the role key holding vals (or zeros), reused from earlier calls when it is large enough, returns its name
+        shm = self.blocks.get(key)
+        if shm is None or shm.size < size * 8:
+            if shm is not None:
+                shm.close()
+                shm.unlink()
+            shm = self.blocks[key] = shared_memory.SharedMemory(create = True, size = max(1, size) * 8)
+        _write(shm.name, size, 0, size, vals)
+        return shm.name
+
+    def _variableKey(self, var, affected):
+        # (leaf index, name) under which the model of an affected leaf reads var, the same in every process; None if no swept model reads it
+        for i in affected:
+            for name, modelVar in self.compiled.nodes[i].CurrentModel.variables.items():
+                if modelVar is var:
+                    return (i, name)
+        return None
+
+    def evaluateBatch(self, values, chunkSize = None):
+        """
+        evaluateBatch: see CompiledHierarchy.evaluateBatch(). chunkSize defaults to an even split into workers * chunks pieces, capped at the
+                       size evaluateBatch() resolves at once.
+        """
+        compiled = self.compiled
+        values = {var: np.asarray(vals, dtype=float) for var, vals in values.items()}
+        shape = np.broadcast_shapes(*[vals.shape for vals in values.values()])
+        size = int(np.prod(shape))
+        affected = compiled.affectedLeaves(values)
+        compiled.runModels(skip = affected)     # before the pool starts, so every worker sees the same state
+        if chunkSize is None:
+            chunkSize = max(1, min(4000000 // len(compiled.nodes), -(-size // (self.workers * self.chunks))))
+        ranges = [(start, min(start + chunkSize, size)) for start in range(0, size, chunkSize)]
+        try:
+            pool = self._startPool()
+            valueNames = {}
+            for var, vals in values.items():
+                key = self._variableKey(var, affected)
+                if key is not None:
+                    valueNames[key] = (self._share(("values",) + key, vals.ravel(), vals.size), vals.shape)
+
+            # Stage 1: model outputs, one block per model attribute; leaves sharing a model are evaluated once
+            first = {}
+            for i in affected:
+                first.setdefault(id(compiled.nodes[i].CurrentModel), i)
+            first = list(first.values())
+            outNames = [{attr: self._share(("model", i, attr), 0.0, size) for attr in compiled.nodes[i].CurrentModel.getAttrs()} for i in first]
+            for future in [pool.submit(_modelChunk, valueNames, shape, first, outNames, size, start, stop) for start, stop in ranges]:
+                future.result()
+            byModel = {}
+            for i, names in zip(first, outNames):
+                model = compiled.nodes[i].CurrentModel
+                out = {attr: _read(name, size, 0, size) for attr, name in names.items()}
+                byModel[id(model)] = out if model.isMultiOutput() else out[model.getAttr()]
+            outputs = {i: byModel[id(compiled.nodes[i].CurrentModel)] for i in affected}
+
+            # Setter validation needs the points in order, so it runs here
+            overrides = compiled.applyBatch(outputs)
+            overrideNames = {i: {param: self._share(("override", i, param), vals, size) for param, vals in params.items()} for i, params in overrides.items()}
+
+            # Stage 2: resolve the hierarchy
+            resultName = self._share(("result",), 0.0, size)
+            for future in [pool.submit(_resolveChunk, overrideNames, resultName, size, start, stop) for start, stop in ranges]:
+                future.result()
+            result = _read(resultName, size, 0, size)
+        except BaseException:
+            self.close()    # a failed batch may leave the workers unusable
+            raise
+        return result.reshape(shape)
+
+    def applyLastPoint(self):
+        self.compiled.applyLastPoint()
+
+    def carryLastPoint(self):
+        self.compiled.carryLastPoint()
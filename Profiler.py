@@ -0,0 +1,192 @@
+# -*- coding: utf-8 -*-
+"""
+Created on 10/17/26
+
+Profiler: Opt-in instrumentation of a study. While enabled, the power updates of every node (updateTotalPower(), updateInactivePower(),
+          checkVDD()), Model function calls (with ModelCache hits), the CompiledHierarchy passes and every public ComponentFunctions entry point
+          are counted and timed per node, model or function (ComponentPlots functions too once a plot was made). Enabling wraps those methods
+          and functions and disabling restores the originals, so a disabled profiler costs nothing. Total time includes nested calls, self
+          time doesn't. Calls made in ParallelSweep worker processes aren't seen.
+
+              with Profiler.profile() as prof:
+                  CF.variableSweep2D(Top, TX_Rate, AFE_Sampling_Rate)
+              print(prof.report(limit = 20))
+
+Most Recent Update 10/17/26
+    - Created module
+
+Functions:
+    enable()
+    disable()
+    isEnabled()
+    reset()
+    getProfile()
+    profile()
+
+Classes:
+    Profile
+
+"""
+
+import sys
+import json
+import time
+import inspect
+import functools
+import contextlib
+
+enabled = False
+stats = {}          # (category, name) -> dict of calls, total, self and hits
+_stack = []         # time spent in nested calls, per active call
+_originals = []     # (owner, attribute, original) of everything wrapped by enable()
+
+class Profile():
+    """ Collected counters and timings
+        Attributes:
+            - stats: dictionary of (category, name) -> dict(calls, total, self, hits), times in seconds. category is the method or function
+                     ("Component.updateTotalPower", "Model.runFunction", "ComponentFunctions", ...), name the node, model or function name
+        Methods:
+            getRows() - list of one dictionary per (category, name), sorted
+            report() - text table of getRows()
+            toJSON() - getRows() as JSON, written to path when given
+    """
+
+    def __init__(self, stats):
+        self.stats = stats
+
+    def getRows(self, sort = "self"):
+        """
+        getRows: one dictionary per counter, sorted by sort ("self", "total", "calls" or "hits") from the largest
+        """
+        rows = [dict(category = category, name = name, **entry) for (category, name), entry in self.stats.items()]
+        rows.sort(key = lambda row: -row[sort])
+        return rows
+
+    def report(self, sort = "self", limit = None):
+        rows = self.getRows(sort)[:limit]
+        lines = ["%-34s %-28s %10s %12s %12s %8s" % ("category", "name", "calls", "total (s)", "self (s)", "hits")]
+        for row in rows:
+            lines.append("%-34s %-28s %10d %12.6f %12.6f %8d" % (row["category"], str(row["name"])[:28], row["calls"], row["total"], row["self"], row["hits"]))
+        return "\n".join(lines)
+
+    def toJSON(self, path = None, sort = "self"):
+        text = json.dumps(self.getRows(sort), indent = 1)
+        if path is not None:
+            with open(path, "w") as f:
+                f.write(text)
+        return text
+
+def _entry(category, name):
+    entry = stats.get((category, name))
+    if entry is None:
+        entry = stats[(category, name)] = dict(calls = 0, total = 0.0, self = 0.0, hits = 0)
+    return entry
+
+def _timed(category, function, nameOf, hitsOf = None):
+    # wrapper of function that counts and times its calls under (category, nameOf(args))
+    @functools.wraps(function)
+    def wrapper(*args, **kwargs):
+        entry = _entry(category, nameOf(args))
+        entry["calls"] += 1
+        hits = hitsOf(args) if hitsOf is not None else 0
+        _stack.append(0.0)
+        start = time.perf_counter()
+        try:
+            return function(*args, **kwargs)
+        finally:
+            elapsed = time.perf_counter() - start
+            nested = _stack.pop()
+            entry["total"] += elapsed
+            entry["self"] += elapsed - nested
+            if _stack:
+                _stack[-1] += elapsed
+            if hitsOf is not None:
+                entry["hits"] += hitsOf(args) - hits
+    return wrapper
+
+def _wrap(owner, attribute, category, nameOf, hitsOf = None):
+    original = owner.__dict__[attribute] if isinstance(owner, type) else getattr(owner, attribute)
+    _originals.append((owner, attribute, original))
+    setattr(owner, attribute, _timed(category, original, nameOf, hitsOf))
+
+def _wrapModule(module):
+    # every public function defined in module, generators only return their iterator and aren't timed
+    for name, function in list(vars(module).items()):
+        if inspect.isfunction(function) and function.__module__ == module.__name__ and not name.startswith("_") \
+           and not inspect.isgeneratorfunction(inspect.unwrap(function)):
+            _wrap(module, name, module.__name__, lambda args, name = name: name)
+
+def _nodeName(args):
+    return args[0].getName()
+
+def _cacheHits(args):
+    cache = args[0].getCache()
+    return cache.hits if cache is not None else 0
+
+def enable():
+    """
+    enable: start counting and timing (see module description), keeping what was collected so far
+    """
+    global enabled
+    if enabled:
+        return
+    from Component import Component
+    from ComponentGroup import ComponentGroup
+    from VoltageRegulator import VoltageRegulator
+    from LogicalGroup import LogicalGroup
+    from Model import Model
+    from CompiledHierarchy import CompiledHierarchy
+    import ComponentFunctions as CF
+    _wrap(Component, "updateTotalPower", "Component.updateTotalPower", _nodeName)
+    for cls in (ComponentGroup, VoltageRegulator, LogicalGroup):
+        for method in ("updateTotalPower", "updateInactivePower", "checkVDD"):
+            if method in cls.__dict__:
+                _wrap(cls, method, cls.__name__ + "." + method, _nodeName)
+    _wrap(Model, "runFunction", "Model.runFunction", _nodeName, _cacheHits)
+    _wrap(Model, "runFunctionArray", "Model.runFunctionArray", _nodeName)
+    for method in ("evaluate", "evaluateBatch", "runModels", "applyBatch", "resolveBatch"):
+        _wrap(CompiledHierarchy, method, "CompiledHierarchy." + method, lambda args: args[0].root.getName())
+    _wrapModule(CF)
+    if "ComponentPlots" in sys.modules:     # importing it here would import plotly
+        _wrapModule(sys.modules["ComponentPlots"])
+    enabled = True
+
+def disable():
+    """
+    disable: stop counting and timing and restore the original methods and functions, keeping what was collected
+    """
+    global enabled
+    while _originals:
+        owner, attribute, original = _originals.pop()
+        setattr(owner, attribute, original)
+    enabled = False
+
+def isEnabled():
+    return enabled
+
+def reset():
+    stats.clear()
+
+def getProfile():
+    """
+    getProfile: Profile of what was collected since the last reset()
+    """
+    return Profile(stats)
+
+@contextlib.contextmanager
+def profile():
+    """
+    profile: context manager that collects only the calls made inside the with block, into the Profile it returns
+    """
+    global stats
+    outer = stats
+    wasEnabled = enabled
+    stats = {}
+    prof = Profile(stats)
+    enable()
+    try:
+        yield prof
+    finally:
+        if not wasEnabled:
+            disable()
+        stats = outer
@@ -0,0 +1,100 @@
+# -*- coding: utf-8 -*-
+"""
+Created on 10/17/26
+
+ResultCache class: Persistent cache of sweep results in a local directory, one pickle file per result named after its key (a content hash, see
+                   Fingerprint.fingerprint()). Reading a result marks it as recently used; when the directory grows beyond maxBytes the least
+                   recently used results are deleted. Several processes may share a directory, files are replaced atomically.
+
+Most Recent Update 10/17/26
+    - Created class
+
+"""
+
+import os
+import pickle
+
+class ResultCache():
+    """ On-disk LRU cache of results
+        Attributes:
+            - directory: path of the cache directory, created when needed
+            - maxBytes: (int) size the directory is kept under, the least recently used results are evicted beyond that
+            - hits, misses, evictions: (int) counters since creation or the last clear()
+        Methods:
+            lookup() - return (True, result) for a stored key, (False, None) otherwise
+            store() - save a result, evicting the least recently used results when the directory is too large
+            clear() - delete every result and reset the counters
+            getSize() - total size of the stored results in bytes
+            getStats() - return a dictionary of hits, misses, evictions, entries, size and hit rate
+    """
+
+    def __init__(self, directory, maxBytes = 256 * 2**20):
+        self.directory = directory
+        self.maxBytes = maxBytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        os.makedirs(directory, exist_ok = True)
+
+    def _path(self, key):
+        return os.path.join(self.directory, key + ".pkl")
+
+    def _entries(self):
+        # (last use, size, path) of every stored result, least recently used first
+        entries = []
+        for name in os.listdir(self.directory):
+            if name.endswith(".pkl"):
+                path = os.path.join(self.directory, name)
+                try:
+                    stat = os.stat(path)
+                except FileNotFoundError:   # evicted by another process
+                    continue
+                entries.append((stat.st_mtime_ns, stat.st_size, path))
+        entries.sort()
+        return entries
+
+    def lookup(self, key):
+        path = self._path(key)
+        try:
+            with open(path, "rb") as f:
+                result = pickle.load(f)
+        except (FileNotFoundError, EOFError, pickle.UnpicklingError):
+            self.misses += 1
+            return False, None
+        os.utime(path)
+        self.hits += 1
+        return True, result
+
+    def store(self, key, result):
+        path = self._path(key)
+        tmp = path + "." + str(os.getpid()) + ".tmp"
+        with open(tmp, "wb") as f:
+            pickle.dump(result, f, protocol = pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, path)
+        entries = self._entries()
+        size = sum(entry[1] for entry in entries)
+        for mtime, fileSize, oldPath in entries:
+            if size <= self.maxBytes or oldPath == path:
+                break
+            try:
+                os.remove(oldPath)
+            except FileNotFoundError:
+                pass
+            size -= fileSize
+            self.evictions += 1
+
+    def clear(self):
+        for mtime, size, path in self._entries():
+            os.remove(path)
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def getSize(self):
+        return sum(entry[1] for entry in self._entries())
+
+    def getStats(self):
+        entries = self._entries()
+        calls = self.hits + self.misses
+        return dict(hits = self.hits, misses = self.misses, evictions = self.evictions, entries = len(entries),
+                    size = sum(entry[1] for entry in entries), hitRate = self.hits / calls if calls > 0 else 0.0)
@@ -33,9 +33,9 @@ def DutyCycle(varDictionary):
     return dutycycle
 
 # Creating several Models objects to represent AFE and TX duty-cycle
-afeDutyCycleModelSimple = Model("afeDutyCycleModelSimple",[DC],DutyCycle,"DutyCycle")
-TXDutyCycleModelSimple = Model("TXDutyCycleModelSimple",[DC],DutyCycle,"DutyCycle")
-mcuDCModelSimple = Model("mcuDutyCycleModelSimple",[DC],DutyCycle,"DutyCycle")
+afeDutyCycleModelSimple = Model("afeDutyCycleModelSimple",[DC],DutyCycle,"DutyCycle",vectorized=True)
+TXDutyCycleModelSimple = Model("TXDutyCycleModelSimple",[DC],DutyCycle,"DutyCycle",vectorized=True)
+mcuDCModelSimple = Model("mcuDutyCycleModelSimple",[DC],DutyCycle,"DutyCycle",vectorized=True)
 
 # Start of hierarchy definition. Components here are defined with Currents and their VDD (thus IV). Check out Component class for more info.
 NVM = Component.IVDef("NVM",1e-3,150e-9,Vdd1,0)
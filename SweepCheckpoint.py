@@ -0,0 +1,85 @@
+# -*- coding: utf-8 -*-
+"""
+Created on 10/17/26
+
+SweepCheckpoint class: Results directory of a long sweep. The grid is stored in a memory-mapped result.npy (with a result.json describing its
+                       axes), and checkpoint.json records how many points in C order are complete, the fingerprint of the hierarchy the sweep
+                       belongs to and the swept leaf state needed to continue exactly where it stopped. A sweep started again on the same directory
+                       resumes after the last completed chunk, and refuses to when the fingerprint differs.
+
+Most Recent Update 10/17/26
+    - Created class
+
+"""
+
+import os
+import json
+import numpy as np
+import Log
+
+class SweepCheckpoint():
+    """ Resumable storage of a sweep
+        Attributes:
+            - directory: path of the results directory, created when needed
+            - fingerprint: fingerprint of the hierarchy and sweep (see Fingerprint.fingerprint())
+            - completed: (int) number of points of the flattened grid that are stored
+            - carry: swept leaf parameters of the last completed point (see CompiledHierarchy.carryLastPoint()), None before the first chunk
+            - result: memory-mapped ndarray of the results
+        Methods:
+            open() - create the result file, or check the fingerprint and reopen it to resume
+            save() - record that the points up to completed are stored
+            getResultPath() - path of result.npy
+    """
+
+    def __init__(self, directory):
+        self.directory = directory
+        self.fingerprint = None
+        self.completed = 0
+        self.carry = None
+        self.result = None
+
+    def _path(self, name):
+        return os.path.join(self.directory, name)
+
+    def open(self, fingerprint, shape, header):
+        """
+        open: result array of the given shape for the sweep with fingerprint. header (axes and fields, see variableSweepND()) is written to
+              result.json for a new sweep. An existing checkpoint is resumed if its fingerprint matches, otherwise open() stops. Without a
+              fingerprint (None) nothing can be checked and the sweep starts over.
+        """
+        os.makedirs(self.directory, exist_ok = True)
+        self.fingerprint = fingerprint
+        if fingerprint is None:
+            Log.warning("SweepCheckpoint: the hierarchy has no fingerprint (see Fingerprint.fingerprint()), starting the sweep in", self.directory, "over")
+        elif os.path.exists(self._path("checkpoint.json")):
+            with open(self._path("checkpoint.json")) as f:
+                state = json.load(f)
+            if state["fingerprint"] != fingerprint:
+                Log.error("SweepCheckpoint: the hierarchy, its models or the sweep changed since the checkpoint in", self.directory, "was written, not resuming")
+                assert (False)
+            self.completed = state["completed"]
+            self.carry = None if state["carry"] is None else {int(i): params for i, params in state["carry"].items()}
+            self.result = np.lib.format.open_memmap(self._path("result.npy"), mode = "r+")
+            return self.result
+        self.result = np.lib.format.open_memmap(self._path("result.npy"), mode = "w+", dtype = float, shape = shape)
+        with open(self._path("result.json"), "w") as f:
+            json.dump(header, f, indent = 1)
+        self.save(0, None)
+        return self.result
+
+    def save(self, completed, carry):
+        """
+        save: flush the results and record completed points and the carried leaf state. checkpoint.json is replaced atomically, so a run killed
+              at any moment leaves a consistent checkpoint.
+        """
+        self.result.flush()
+        self.completed = completed
+        self.carry = carry
+        state = dict(fingerprint = self.fingerprint, completed = completed,
+                     carry = None if carry is None else {str(i): {name: float(val) for name, val in params.items()} for i, params in carry.items()})
+        with open(self._path("checkpoint.json.tmp"), "w") as f:
+            json.dump(state, f)
+        os.replace(self._path("checkpoint.json.tmp"), self._path("checkpoint.json"))
+
+    def getResultPath(self):
+        return self._path("result.npy")
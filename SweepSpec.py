@@ -0,0 +1,121 @@
+# -*- coding: utf-8 -*-
+"""
+Created on 10/17/26
+
+SweepSpec classes: Lazy descriptions of the values a Variable is swept over. A spec knows its size without building its values, builds them
+                   as a float64 ndarray the first time they are needed, and can hand them out in chunks so a huge range never has to be held at
+                   once. Any slice of a spec is bit-identical to the same slice of its full values.
+
+Most Recent Update 10/17/26
+    - Created classes
+
+Classes:
+    SweepSpec
+    LinearSweep
+    LogSweep
+    ExplicitSweep
+
+"""
+
+import abc
+import math
+import numpy as np
+import Log
+
+class SweepSpec(abc.ABC):
+    """ Abstract base class of the sweep specifications, subclasses implement size() and slice()
+        Attributes:
+            - start: first value of the sweep
+            - stop: end of the sweep range (see the subclasses for whether it is included)
+            - cache: read-only ndarray of the values once values() has built them, otherwise None
+        Methods:
+            size() - number of sweep values, without building them
+            slice() - ndarray of the values with index i to j
+            values() - read-only ndarray of every value, built once and cached
+            chunks() - generator of consecutive ndarrays of at most chunkSize values
+    """
+
+    def __init__(self, start, stop):
+        self.start = start
+        self.stop = stop
+        self.cache = None
+
+    @abc.abstractmethod
+    def size(self):
+        pass
+
+    @abc.abstractmethod
+    def slice(self, i, j):
+        pass
+
+    def values(self):
+        if self.cache is None:
+            self.cache = self.slice(0, self.size())
+            self.cache.flags.writeable = False
+        return self.cache
+
+    def chunks(self, chunkSize):
+        size = self.size()
+        for i in range(0, size, chunkSize):
+            j = min(i + chunkSize, size)
+            yield self.cache[i:j] if self.cache is not None else self.slice(i, j)
+
+    def __len__(self):
+        return self.size()
+
+class LinearSweep(SweepSpec):
+    """ Evenly spaced values from start up to, but not including, stop, the same values as np.arange(start, stop, step)
+        Attributes:
+            - step: spacing of the values
+    """
+
+    def __init__(self, start, stop, step):
+        if step == 0:
+            Log.error("LinearSweep: step can't be 0")
+            assert (False)
+        SweepSpec.__init__(self, start, stop)
+        self.step = step
+
+    def size(self):
+        return max(0, math.ceil((self.stop - self.start) / self.step))
+
+    def slice(self, i, j):
+        # np.arange computes value k as start + k*delta with delta = (start + step) - start
+        start = float(self.start)
+        return start + np.arange(i, j, dtype=float) * ((start + self.step) - start)
+
+class LogSweep(SweepSpec):
+    """ Logarithmically spaced values from start to stop, stop included when it falls on the grid
+        Attributes:
+            - pointsPerDecade: number of values per factor of 10
+    """
+
+    def __init__(self, start, stop, pointsPerDecade):
+        if start <= 0 or stop <= 0 or pointsPerDecade <= 0:
+            Log.error("LogSweep: start, stop and pointsPerDecade must be positive")
+            assert (False)
+        SweepSpec.__init__(self, start, stop)
+        self.pointsPerDecade = pointsPerDecade
+
+    def size(self):
+        steps = (math.log10(self.stop) - math.log10(self.start)) * self.pointsPerDecade
+        return max(0, math.floor(steps + 1e-9) + 1)
+
+    def slice(self, i, j):
+        return float(self.start) * 10.0 ** (np.arange(i, j, dtype=float) / self.pointsPerDecade)
+
+class ExplicitSweep(SweepSpec):
+    """ Sweep over a given array of values, in the given order. start and stop are the smallest and largest value.
+    """
+
+    def __init__(self, values):
+        values = np.array(values, dtype=float).ravel()
+        values.flags.writeable = False
+        SweepSpec.__init__(self, float(values.min()) if len(values) > 0 else None, float(values.max()) if len(values) > 0 else None)
+        self.cache = values
+
+    def size(self):
+        return len(self.cache)
+
+    def slice(self, i, j):
+        return self.cache[i:j]
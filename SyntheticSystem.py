@@ -0,0 +1,129 @@
+# -*- coding: utf-8 -*-
+"""
+Created on 10/17/26
+
+SyntheticSystem: Generator of random but realistic hierarchies of any size, for benchmarks and scaling studies. The tree has depth levels of
+                 ComponentGroups and VoltageRegulators below a top ComponentGroup, fanOut children per node and the leaf Components spread evenly
+                 over the deepest level, so the shape only depends on components, depth and fanOut. Branches of the top are defined in power
+                 (PDef) or in currents and voltages (IVDef), regulators cascade to other rails, and a fraction of the Components is driven by
+                 Models sharing a small pool of Variables. The same arguments always give the same system.
+
+                     Top, variables = SyntheticSystem.generate(components = 10000, depth = 5, fanOut = 8)
+                     CF.variableSweep(Top, variables[0])
+
+Most Recent Update 10/17/26
+    - Created module
+
+Functions:
+    generate()
+
+"""
+
+import math
+import random
+from Component import Component
+from ComponentGroup import ComponentGroup
+from VoltageRegulator import VoltageRegulator
+from Variable import Variable
+from Model import Model
+
+RAILS = (3.3, 1.8, 1.2, 1.0, 0.8, 0.6)
+
+def _dutyCycle(varDictionary):
+    # duty cycle of a model driven component, the product of its variables
+    dutyCycle = 1.0
+    for name in varDictionary:
+        dutyCycle = dutyCycle * varDictionary[name].value
+    return dutyCycle
+
+def _levelSizes(components, depth, fanOut):
+    # number of groups and regulators on every level below the top, the deepest level holding fanOut leaves each
+    sizes = [0] * depth
+    count = max(1, math.ceil(components / fanOut))
+    for level in range(depth - 1, -1, -1):
+        sizes[level] = count
+        count = max(1, math.ceil(count / fanOut))
+    return sizes
+
+def generate(components = 1000, depth = 4, fanOut = 8, regulatorFraction = 0.3, pdefFraction = 0.5, modelFraction = 0.1, variables = 4,
+             variablesPerModel = 2, seed = 0):
+    """
+    generate: Return the top ComponentGroup of a new system with the given number of leaf components and the list of its shared Variables
+              - depth: levels of ComponentGroups/VoltageRegulators between the top and the components, 0 puts every component under the top
+              - fanOut: children per group or regulator (the top takes more when depth is too small for the number of components)
+              - regulatorFraction: fraction of the groups and regulators that are VoltageRegulators, each one converting to another rail
+              - pdefFraction: fraction of the branches of the top that are defined in power, the others are defined in currents and voltages
+              - modelFraction: fraction of the components whose DutyCycle comes from a Model, the product of variablesPerModel of the variables
+              - variables: number of Variables shared by the models, swept from 0.05 to 1 by 0.05 and set to 0.5
+    """
+    rnd = random.Random(seed)
+    pool = [Variable("Var" + str(k), 0.5, 0.05, 1.0, 0.05) for k in range(variables)]
+    sizes = _levelSizes(components, depth, fanOut)
+    rootPower = pdefFraction > 0
+
+    # top-down: kind, definition and rails of every group and regulator, levels[d][j] = [parent index, isRegulator, isPower, rail in, rail out]
+    levels = []
+    parentCount = 1
+    parentStyle = [(rootPower, RAILS[0])]
+    for level in range(depth):
+        nodes = []
+        for j in range(sizes[level]):
+            parent = j * parentCount // sizes[level]
+            power, rail = parentStyle[parent]
+            if level == 0 and rootPower:
+                power = rnd.random() < pdefFraction
+            isRegulator = rnd.random() < regulatorFraction
+            railOut = rnd.choice([r for r in RAILS if r != rail]) if isRegulator else rail
+            nodes.append([parent, isRegulator, power, rail, railOut])
+        levels.append(nodes)
+        parentCount = len(nodes)
+        parentStyle = [(node[2], node[4]) for node in nodes]
+
+    # leaves, under the deepest level
+    children = [[[], [], []] for j in range(parentCount)]   # components, groups, regulators of every node of the deepest level
+    for i in range(components):
+        parent = i * parentCount // components
+        power, rail = parentStyle[parent]
+        if depth == 0 and rootPower:
+            power = rnd.random() < pdefFraction
+        models = []
+        if rnd.random() < modelFraction:
+            models = [Model("C" + str(i) + "_Model", rnd.sample(pool, min(variablesPerModel, variables)), _dutyCycle, "DutyCycle", vectorized = True)]
+        active = 10 ** rnd.uniform(-8, -3)
+        inactive = active * 10 ** rnd.uniform(-4, -1)
+        dutyCycle = rnd.random()
+        if power:
+            comp = Component.PDef("C" + str(i), active, inactive, dutyCycle, models)
+        else:
+            comp = Component.IVDef("C" + str(i), active, inactive, rail, dutyCycle, models)
+        if models:
+            comp.setCurrentModel(models[0].getName())
+        children[parent][0].append(comp)
+
+    # bottom-up construction of the groups and regulators
+    for level in range(depth - 1, -1, -1):
+        nodes = levels[level]
+        above = [[[], [], []] for j in range(len(levels[level - 1]) if level > 0 else 1)]
+        for j, (parent, isRegulator, power, rail, railOut) in enumerate(nodes):
+            comps, groups, regs = children[j]
+            if isRegulator:
+                efficiency = rnd.uniform(0.7, 0.95)
+                if power:
+                    node = VoltageRegulator.PDef("R" + str(level) + "_" + str(j), efficiency, 10 ** rnd.uniform(-8, -6), comps, groups, regs)
+                else:
+                    node = VoltageRegulator.IVDef("R" + str(level) + "_" + str(j), rail, railOut, efficiency, 10 ** rnd.uniform(-8, -6), comps, groups, regs)
+                above[parent][2].append(node)
+            else:
+                if power:
+                    node = ComponentGroup.PDef("G" + str(level) + "_" + str(j), comps, groups, regs)
+                else:
+                    node = ComponentGroup.IVDef("G" + str(level) + "_" + str(j), rail, comps, groups, regs)
+                above[parent][1].append(node)
+        children = above
+
+    comps, groups, regs = children[0]
+    if rootPower:
+        top = ComponentGroup.PDef("Top", comps, groups, regs)
+    else:
+        top = ComponentGroup.IVDef("Top", RAILS[0], comps, groups, regs)
+    return top, pool
@@ -7,25 +7,36 @@ Variable class: Used to define a "variable" in a custom equation-based model bas
                 An instance of the Variable class allows for static and swept values to be a part of its
                 definition.
 
-Most Recent Update 7/4/20
+Most Recent Update 10/17/26
+    - Sweep values come from a lazy SweepSpec (linear, log or explicit values) and are returned as a float64 ndarray; getSweepSize() doesn't
+      build them and iterSweepVals() hands them out in chunks
+    - arrayCopy() for evaluating array-capable models on a whole sweep
+    - Variables keep the list of Models that use them, setValue() marks the dependent components dirty
+
+Update 7/4/20
     - Created class
 
 """
 
 import numpy as np
+from SweepSpec import SweepSpec, LinearSweep, ExplicitSweep
 
 class Variable():
 
-    def __init__(self, name = "", value = 0, start = None, stop = None, step = None, unit = None):
+    def __init__(self, name = "", value = 0, start = None, stop = None, step = None, unit = None, sweep = None):
         self.name = name
         self.value = value
         self.start = start
         self.stop = stop
         self.step = step
-        self.sweepVals = None
+        self.sweep = None   # SweepSpec of the sweep values, built from start, stop and step unless set with setSweep()
+        self.rangeSweep = True
         self.unit = unit    # String representation of applicable unit
         self.sweepValSize = 0   
-        if(start != None and stop != None and step != None):
+        self.models = []    # Models that use this variable, registered by Model.addVariables()
+        if(sweep is not None):
+            self.setSweep(sweep)
+        elif(start != None and stop != None and step != None):
             self.setSweepVals()
 
     def getName(self):
@@ -49,19 +60,75 @@ class Variable():
     def getStep(self):
         return self.step
 
+    def setSweep(self, sweep):
+        """
+        setSweep: sweep over a SweepSpec (LinearSweep, LogSweep, ExplicitSweep) or an array of values. start and stop follow the sweep.
+        """
+        if not isinstance(sweep, SweepSpec):
+            sweep = ExplicitSweep(sweep)
+        self.sweep = sweep
+        self.rangeSweep = isinstance(sweep, LinearSweep)
+        self.start = sweep.start
+        self.stop = sweep.stop
+        self.step = sweep.step if self.rangeSweep else None
+        self.sweepValSize = sweep.size()
+
+    def getSweep(self):
+        return self.sweep
+
     def setSweepVals(self):
-        temp = np.arange(self.getStart(),self.getStop(),self.getStep(),float)
-        self.sweepVals = temp.tolist()
-        self.sweepValSize = len(self.sweepVals)
+        # a linear sweep follows start, stop and step, the spec is only replaced when one of them changed
+        if(self.rangeSweep and self.start != None and self.stop != None and self.step != None):
+            sweep = self.sweep
+            if(sweep is None or (sweep.start, sweep.stop, sweep.step) != (self.start, self.stop, self.step)):
+                self.sweep = LinearSweep(self.start, self.stop, self.step)
+        self.sweepValSize = self.sweep.size() if self.sweep is not None else 0
 
     def getSweepVals(self):
-        return self.sweepVals
+        """
+        getSweepVals: float64 ndarray of the sweep values, None without a sweep
+        """
+        return self.sweep.values() if self.sweep is not None else None
+
+    def iterSweepVals(self, chunkSize = 65536):
+        """
+        iterSweepVals: sweep values in consecutive ndarrays of at most chunkSize values, without building the whole sweep
+        """
+        if self.sweep is not None:
+            yield from self.sweep.chunks(chunkSize)
 
     def getValue(self):
         return self.value
 
     def setValue(self, val):
         self.value = val
+        for model in self.models:
+            model.markDirty()
+
+    def addModel(self, model):
+        if not any(m is model for m in self.models):
+            self.models.append(model)
+
+    def removeModel(self, model):
+        self.models = [m for m in self.models if m is not model]
+
+    def getModels(self):
+        return self.models
+
+    def arrayCopy(self, values):
+        """
+        arrayCopy: copy of this variable whose value is an ndarray of points, for array-capable models. The copy isn't linked to any model.
+        """
+        return Variable(self.name, np.asarray(values, dtype=float), unit = self.unit)
+
+    def getDependents(self):
+        """
+        getDependents: components whose CurrentModel uses this variable
+        """
+        comps = []
+        for model in self.models:
+            comps.extend(model.getComponents())
+        return comps
 
     def getSweepSize(self):
-        return self.sweepValSize
\ No newline at end of file
+        return self.sweep.size() if self.sweep is not None else 0
\ No newline at end of file
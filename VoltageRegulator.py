@@ -3,11 +3,21 @@
 Created on 6/26/20
 @author: Henry Bishop and Katy Flynn
 
-Most Recent Update 7/4/20:
+Most Recent Update 10/17/26:
+- __slots__ instead of a per-instance __dict__, parents kept in a tuple
+- reading a dirty power updates the dirty containers below deepest first (updateDirty()), markDirty() and markTopologyChanged() are
+  iterative, so regulator cascades of any depth work
+- messages go through Log, rejected setter values are warnings that can be counted instead
+- add*() and remove*() of children share one implementation with ComponentGroup (NodeLinks)
+- containers are held as weak references, so a thrown away container no longer stays registered
+
+Update 7/4/20:
 - added setAttr and getAttr
 """
 
 import numpy as np
+import Log
+import NodeLinks
 
 class VoltageRegulator():
     """ Class that collects Components, Voltage Regulators, and other ComponentGroups
@@ -28,6 +38,9 @@ class VoltageRegulator():
             - componentGroups: array of more ComponentGroups inside of this ComponentGroup
             - voltageRegulators: array of voltageRegulator objects inside of this ComponentGroup
             - hierarchy: once updated, provides tree structure of component-type objects of everything beneath this ComponentGroup
+            - topologyVersion: (int) incremented whenever children are added, removed or renamed anywhere below this object
+            - parents: (tuple) weak references to the ComponentGroups, VoltageRegulators and LogicalGroups that contain this object, see getParents()
+            - dirty: (bool) True when something below this object changed since TotalPower was last computed
             - Type: (string) "POWER" or "IV", represents that this ComponentGroup is either defined with only power numbers or with voltage/current
         Class Methods:
             PDef() - For defining component in terms of power
@@ -56,10 +69,30 @@ class VoltageRegulator():
             updateLoadPower() - updates load power from across hierarchy
             updateLoadCurrent() - updates load current and power from across hierarchy
             clearHierarchy() - empty hierarchy
+            resetHierarchy() - point hierarchy at the current child containers
+            addComponents() - add new Components
+            addComponentGroups() - add new ComponentGroups
+            addVoltageRegulators() - add new VoltageRegulators
+            removeComponents() - remove Components by name
+            removeComponentGroups() - remove ComponentGroups by name
+            removeVoltageRegulators() - remove VoltageRegulators by name
+            addParent() - register a container of this object
+            removeParent() - unregister a container of this object
+            getParents() - return the containers of this object
+            updateDirty() - update the dirty containers below this object and then this object
+            markDirty() - flag this object and all of its ancestors for recomputation
+            markTopologyChanged() - bump topologyVersion of this object and all of its ancestors
+            isDirty() - return dirty flag
+            registerChildren() - register this object as parent of its children
             setAttr() - based on string input with same characters as attribute, call the set function for that attribute
             getAttr() - based on string input with same characters as attribute, call the get function for that attribute
     """
-    
+
+    __slots__ = ("name", "VIN", "VOUT", "Efficiency", "TotalPower", "TotalCurrent", "InactivePower", "InactiveCurrent", "RegPower", "RegCurrent",
+                 "EffLossPower", "EffLossCurrent", "EffLossInactivePower", "EffLossInactiveCurrent", "LoadPower", "LoadCurrent", "InactiveLoadPower",
+                 "InactiveLoadCurrent", "components", "componentGroups", "voltageRegulators", "hierarchy", "topologyVersion", "nameIndex",
+                 "nameIndexVersion", "Type", "parents", "dirty", "__weakref__")
+
     def __init__(self, name = None, VIN = None, VOUT = None, Efficiency = 1.0, RegPower = 0.0, RegCurrent = None, components = np.array([]), componentGroups = np.array([]), voltageRegulators = np.array([])):
         self.name = name
         self.VIN = VIN
@@ -73,15 +106,23 @@ class VoltageRegulator():
         self.RegCurrent = RegCurrent
         self.EffLossPower = 0.0     # Power due to voltage drop
         self.EffLossCurrent = None
+        self.EffLossInactivePower = 0.0
+        self.EffLossInactiveCurrent = None
         self.LoadPower = 0.0
         self.LoadCurrent = None
         self.InactiveLoadPower = 0.0
         self.InactiveLoadCurrent = None
-        self.components = components
-        self.componentGroups = componentGroups
-        self.voltageRegulators = voltageRegulators
-        self.hierarchy = dict(comp=components,compGroups=componentGroups,vReg=voltageRegulators) # hierarchy is EVERYTHING and is CALCULATED, original inputs are just one level
+        self.components = np.array(components)
+        self.componentGroups = np.array(componentGroups)
+        self.voltageRegulators = np.array(voltageRegulators)
+        self.hierarchy = dict(comp=self.components,compGroups=self.componentGroups,vReg=self.voltageRegulators) # hierarchy shares the child containers, so refreshing it never copies them
+        self.topologyVersion = 0
+        self.nameIndex = None   # built by ComponentFunctions.getNameIndex()
+        self.nameIndexVersion = -1
         self.Type = None
+        self.parents = ()
+        self.dirty = False
+        self.registerChildren()
 
     @classmethod
     def PDef(cls, name, Efficiency, RegPower, components, componentGroups, voltageRegulators):
@@ -102,53 +143,64 @@ class VoltageRegulator():
 
     def setName(self, newName):
         self.name = newName
+        NodeLinks.markParentsTopologyChanged(self)
 
     def getVIN(self):
         return self.VIN
 
     def setVIN(self,newVIN):
         if(newVIN < 0):
-            print(newVIN, " is less than zero - no update.")
+            Log.reject(self, "VIN", newVIN, "is less than zero - no update.")
             return
         self.VIN = newVIN
+        self.markDirty()
 
     def getVOUT(self):
         return self.VOUT
 
     def setVOUT(self,newVOUT):
         if(newVOUT < 0):
-            print(newVOUT, " is less than zero - no update.")
+            Log.reject(self, "VOUT", newVOUT, "is less than zero - no update.")
             return
         self.VOUT = newVOUT
+        self.markDirty()
 
     def getEfficiency(self):
         return self.Efficiency
 
     def setEfficiency(self, newEff):
         self.Efficiency = newEff
+        self.markDirty()
 
     def setRegCurrent(self, newRegCurrent):
         if(newRegCurrent < 0):
-            print(newRegCurrent, " is less than zero - no update.")
+            Log.reject(self, "RegCurrent", newRegCurrent, "is less than zero - no update.")
             return
         self.RegCurrent = newRegCurrent
+        self.markDirty()
 
     def getTotalPower(self):
+        if self.dirty: self.updateDirty()
         return self.TotalPower
 
     def getTotalCurrent(self):
+        if self.dirty: self.updateDirty()
         return self.TotalCurrent
 
     def getInactivePower(self):
+        if self.dirty: self.updateDirty()
         return self.InactivePower
 
     def getInactiveCurrent(self):
+        if self.dirty: self.updateDirty()
         return self.InactiveCurrent
 
     def getLoadPower(self):
+        if self.dirty: self.updateDirty()
         return self.LoadPower
 
     def getLoadCurrent(self):
+        if self.dirty: self.updateDirty()
         return self.LoadCurrent
 
     def setEffLossCurrent(self):
@@ -164,13 +216,19 @@ class VoltageRegulator():
         self.EffLossInactivePower = self.InactiveLoadPower / self.Efficiency - self.InactiveLoadPower
 
     def getEffLossCurrent(self):
+        if self.dirty: self.updateDirty()
         return self.EffLossCurrent
     
     def getEffLossPower(self):
+        if self.dirty: self.updateDirty()
         return self.EffLossPower
 
     def setRegPower(self,newRegPower):
         self.RegPower = newRegPower
+        self.markDirty()
+
+    def updateDirty(self):
+        NodeLinks.updateDirty(self)
 
     def updateTotalPower(self):
         self.updateInactivePower()
@@ -186,7 +244,10 @@ class VoltageRegulator():
             self.TotalPower = self.RegCurrent * self.VIN + self.LoadCurrent * self.VOUT / self.Efficiency
             self.TotalCurrent = self.TotalPower / self.VIN
         else:
-            print("VoltageRegulator didn't have correct Type - no update. (updateTotalPower)")
+            Log.warning("VoltageRegulator didn't have correct Type - no update. (updateTotalPower)")
+            return
+        self.dirty = False
+        NodeLinks.markParentsDirty(self)
 
     def updateInactivePower(self):
         if self.Type == "POWER":
@@ -201,20 +262,20 @@ class VoltageRegulator():
             self.InactivePower = self.RegCurrent * self.VIN + self.InactiveLoadCurrent * self.VOUT / self.Efficiency
             self.InactiveCurrent = self.InactivePower / self.VIN
         else:
-            print("VoltageRegulator didn't have correct Type - no update. (updateInactivePower)")
+            Log.warning("VoltageRegulator didn't have correct Type - no update. (updateInactivePower)")
 
     def checkVDD(self):
         for comp in self.hierarchy["comp"]:
             if (comp.getVDD() != self.VOUT):
-                print("Component", comp.name,"VDD,", comp.getVDD(),", doesn't match", self.name, "VOUT,", self.VOUT)
+                Log.error("Component", comp.name,"VDD,", comp.getVDD(),", doesn't match", self.name, "VOUT,", self.VOUT)
                 assert (False)
         for comp in self.hierarchy["compGroups"]:
             if (comp.getVDD() != self.VOUT):
-                print("Component Group", comp.name,"VDD,", comp.getVDD(),", doesn't match", self.name, "VOUT", self.VOUT)
+                Log.error("Component Group", comp.name,"VDD,", comp.getVDD(),", doesn't match", self.name, "VOUT", self.VOUT)
                 assert (False)
         for comp in self.hierarchy["vReg"]:
             if (comp.getVIN() != self.VOUT):
-                print("Regulator", comp.name,"VIN,", comp.getVIN(),", doesn't match", self.name, "VOUT", self.VOUT)
+                Log.error("Regulator", comp.name,"VIN,", comp.getVIN(),", doesn't match", self.name, "VOUT", self.VOUT)
                 assert (False)
 
     def updateLoadPower(self):
@@ -264,6 +325,57 @@ class VoltageRegulator():
     def clearHierarchy(self):
         self.hierarchy = dict(comp=np.array([]),compGroups=np.array([]),vReg=np.array([]))
 
+    def resetHierarchy(self):
+        self.hierarchy = dict(comp=self.components,compGroups=self.componentGroups,vReg=self.voltageRegulators)
+        self.markTopologyChanged()
+        self.registerChildren()
+        self.markDirty()
+
+    def addComponents(self, newComps):
+        NodeLinks.addChildren(self, "components", newComps)
+
+    def addComponentGroups(self, newGroups):
+        NodeLinks.addChildren(self, "componentGroups", newGroups)
+
+    def addVoltageRegulators(self, newVRegs):
+        NodeLinks.addChildren(self, "voltageRegulators", newVRegs)
+
+    def removeComponents(self, names):
+        NodeLinks.removeChildren(self, "components", names)
+
+    def removeComponentGroups(self, names):
+        NodeLinks.removeChildren(self, "componentGroups", names)
+
+    def removeVoltageRegulators(self, names):
+        NodeLinks.removeChildren(self, "voltageRegulators", names)
+
+    def addParent(self, parent):
+        NodeLinks.addParent(self, parent)
+
+    def removeParent(self, parent):
+        NodeLinks.removeParent(self, parent)
+
+    def getParents(self):
+        return NodeLinks.getParents(self)
+
+    def markDirty(self):
+        NodeLinks.markDirty(self)
+
+    def isDirty(self):
+        return self.dirty
+
+    def markTopologyChanged(self):
+        NodeLinks.markTopologyChanged(self)
+
+    def registerChildren(self):
+        NodeLinks.registerChildren(self)
+
+    def __getstate__(self):
+        return NodeLinks.getState(self)
+
+    def __setstate__(self, state):
+        NodeLinks.setState(self, state)
+
     def setAttr(self, attrKey, value):
         attrDict = {    # Dictionary of attributes meant for sweeping
             #"VIN":self.setVIN,
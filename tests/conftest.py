@@ -0,0 +1,12 @@
+# -*- coding: utf-8 -*-
+"""
+Created on 10/17/26
+
+conftest: the library is a flat set of modules in the parent directory, importable from the tests without installing it.
+
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
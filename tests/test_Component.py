@@ -0,0 +1,51 @@
+# -*- coding: utf-8 -*-
+"""
+Created on 10/17/26
+
+test_Component: leaf components stored in LeafStore blocks keep what is assigned to them.
+
+"""
+
+import copy
+import pickle
+import numpy as np
+from Component import Component
+from Model import Model
+
+def active(varDictionary):
+    return 2e-3
+
+def test_models_created_on_first_write():
+    comp = Component.PDef("C", 0.0, 0.0, 1.0)
+    other = Component.PDef("D", 0.0, 0.0, 1.0)
+    comp.Models["m"] = Model("m", [], active, "ActivePower")
+    assert list(comp.Models) == ["m"]
+    assert len(other.Models) == 0
+    comp.setCurrentModel("m")
+    comp.runModel()
+    assert comp.ActivePower == 2e-3
+
+def test_values_kept_as_assigned():
+    comp = Component("C", ActivePower = 1, InactivePower = np.float64(0.5), DutyCycle = 0.25)
+    comp.VDD = "1.8"
+    assert type(comp.ActivePower) is int and type(comp.InactivePower) is np.float64 and comp.VDD == "1.8"
+    comp.VDD = 1.8
+    assert comp.VDD == 1.8 and comp.ActiveCurrent is None
+
+def test_pickle_and_copy():
+    comp = Component.PDef("C", 1e-3, 1e-6, 0.5, [Model("m", [], active, "ActivePower")])
+    comp.setCurrentModel("m")
+    power = comp.ActivePower
+    for clone in (pickle.loads(pickle.dumps(comp)), copy.deepcopy(comp)):
+        assert clone.getName() == "C" and clone.Type == comp.Type
+        assert (clone.ActivePower, clone.InactivePower, clone.DutyCycle) == (comp.ActivePower, comp.InactivePower, comp.DutyCycle)
+        assert list(clone.Models) == ["m"] and clone.CurrentModel.getName() == "m"
+        clone.ActivePower = 5.0
+        assert comp.ActivePower == power
+
+def test_slot_reused_clean():
+    comp = Component("C", ActivePower = 3.0)
+    comp.Models["m"] = Model("m", [], active, "ActivePower")
+    del comp
+    fresh = Component("E")
+    assert fresh.ActivePower == 0.0 and len(fresh.Models) == 0 and fresh.CurrentModel is None
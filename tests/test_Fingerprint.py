@@ -0,0 +1,87 @@
+# -*- coding: utf-8 -*-
+"""
+Created on 10/17/26
+
+test_Fingerprint: results served by the persistent ResultCache follow changes of what model functions read besides their Variables.
+
+"""
+
+import numpy as np
+import pytest
+import ComponentFunctions as CF
+from Component import Component
+from ComponentGroup import ComponentGroup
+from Variable import Variable
+from Model import Model
+
+SCALE = [1.0]
+
+class Gain():
+    def __init__(self, gain):
+        self.gain = gain
+
+GAIN = Gain(1.0)
+
+def helper(x):
+    return x * SCALE[0]
+
+def scaled(varDictionary):
+    return helper(varDictionary["x"].value)
+
+def gained(varDictionary):
+    return varDictionary["x"].value * GAIN.gain
+
+def _system(function):
+    x = Variable("x", 0.5, 0.1, 1.0, 0.1)
+    comp = Component.PDef("C", 1e-3, 1e-6, 1, [Model("m", [x], function, "DutyCycle")])
+    comp.setCurrentModel("m")
+    return ComponentGroup.PDef("Top", [comp], [], []), x
+
+@pytest.fixture
+def cache(tmp_path):
+    CF.setResultCache(str(tmp_path))
+    yield CF.getResultCache()
+    CF.setResultCache(None)
+
+def test_helper_global_change(cache):
+    top, x = _system(scaled)
+    first = CF.variableSweep(top, x)[1]
+    SCALE[0] = 0.5
+    try:
+        top, x = _system(scaled)    # as a new run would build it
+        second = CF.variableSweep(top, x)[1]
+        loop = CF.variableSweep(top, x, "loop")[1]
+    finally:
+        SCALE[0] = 1.0
+    assert np.array_equal(second, loop)
+    assert not np.allclose(second, first)
+    assert cache.hits == 0
+
+def test_helper_function_change(cache, monkeypatch):
+    top, x = _system(scaled)
+    first = CF.variableSweep(top, x)[1]
+    monkeypatch.setitem(globals(), "helper", lambda x: 2 * x)
+    top, x = _system(scaled)
+    second = CF.variableSweep(top, x)[1]
+    assert np.array_equal(second, CF.variableSweep(top, x, "loop")[1])
+    assert not np.allclose(second, first)
+
+def test_same_state_is_served_from_cache(cache):
+    top, x = _system(scaled)
+    first = CF.variableSweep(top, x)[1]
+    top, x = _system(scaled)
+    assert np.array_equal(CF.variableSweep(top, x)[1], first)
+    assert cache.hits == 1
+
+def test_unhashable_global_is_not_cached(cache):
+    top, x = _system(gained)
+    first = CF.variableSweep(top, x)[1]
+    GAIN.gain = 0.5
+    try:
+        second = CF.variableSweep(top, x)[1]
+        loop = CF.variableSweep(top, x, "loop")[1]
+    finally:
+        GAIN.gain = 1.0
+    assert np.array_equal(second, loop)
+    assert not np.allclose(second, first)
+    assert cache.getStats()["entries"] == 0
@@ -0,0 +1,29 @@
+# -*- coding: utf-8 -*-
+"""
+Created on 10/17/26
+
+test_Log: default verbosity of a batch run (stdout not a terminal) and its SPS_LOG_LEVEL override.
+
+"""
+
+import os
+import sys
+import subprocess
+import pytest
+import Log
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def _level(env):
+    environ = {key: value for key, value in os.environ.items() if key != "SPS_LOG_LEVEL"}
+    environ.update(env)
+    out = subprocess.run([sys.executable, "-c", "import Log; print(Log.getVerbosity())"], cwd = ROOT, env = environ,
+                         stdout = subprocess.PIPE, check = True).stdout    # piped, so not a terminal
+    return int(out)
+
+def test_off_in_batch_runs():
+    assert _level({}) == Log.OFF
+
+@pytest.mark.parametrize("name, level", [("warning", Log.WARNING), ("error", Log.ERROR), ("DEBUG", Log.DEBUG)])
+def test_environment_override(name, level):
+    assert _level({"SPS_LOG_LEVEL": name}) == level
@@ -0,0 +1,37 @@
+# -*- coding: utf-8 -*-
+"""
+Created on 10/17/26
+
+test_Model: assigning Model.function directly behaves like setFunction().
+
+"""
+
+import numpy as np
+import ComponentFunctions as CF
+from Component import Component
+from ComponentGroup import ComponentGroup
+from Variable import Variable
+from Model import Model
+
+def half(varDictionary):
+    return 0.5 * varDictionary["x"].value
+
+def quarter(varDictionary):
+    return 0.25 * varDictionary["x"].value
+
+def test_function_assignment():
+    x = Variable("x", 1.0, 0.0, 1.0, 0.25)
+    model = Model("m", [x], half, "DutyCycle")
+    cache = model.enableCache()
+    comp = Component.PDef("C", 1e-3, 0.0, 1.0, [model])
+    comp.setCurrentModel("m")
+    top = ComponentGroup.PDef("Top", [comp], [], [])
+    CF.updateHierarchy(top)
+    assert top.getTotalPower() == 0.5e-3
+    assert model.getTrace() is not False
+    model.function = quarter
+    assert model.getFunction() is quarter and model.traced is None
+    assert all(key[0] is not half for key in cache.entries)
+    assert top.getTotalPower() == 0.25e-3    # the component was marked dirty
+    vals, power = CF.variableSweep(top, x)
+    assert np.array_equal(power, 1e-3 * (0.25 * vals))   # batched, through the trace of the new function
@@ -0,0 +1,89 @@
+# -*- coding: utf-8 -*-
+"""
+Created on 10/17/26
+
+test_SweepParity: method="batched" and method="loop" give identical sweeps, including models with several outputs and values the setters refuse
+                  (held at the previous point) or apply with a warning.
+
+"""
+
+import logging
+import numpy as np
+import pytest
+import Log
+import ComponentFunctions as CF
+from Component import Component
+from ComponentGroup import ComponentGroup
+from VoltageRegulator import VoltageRegulator
+from Variable import Variable
+from Model import Model
+
+def radio(varDictionary):
+    x = varDictionary["x"].value
+    return {"ActivePower": 2e-3 * (x - 0.3), "DutyCycle": 1.5 * x}    # negative below 0.3, under the sleep power just above, DutyCycle > 1 past 2/3
+
+def sensor(varDictionary):
+    x = varDictionary["x"].value
+    y = varDictionary["y"].value
+    return {"ActiveCurrent": 1e-3 * (y - 0.2), "InactiveCurrent": 1e-6 * x}    # negative ActiveCurrent below 0.2
+
+def rate(varDictionary):
+    return 0.2 * varDictionary["y"].value + 0.1
+
+def _system(vectorized):
+    x = Variable("x", 0.5, 0.0, 1.0, 0.05)
+    y = Variable("y", 0.5, 0.0, 1.0, 0.1)
+    Radio = Component.PDef("Radio", 1e-3, 1e-4, 0.5, [Model("radio", [x], radio, ["ActivePower", "DutyCycle"], vectorized = vectorized)])
+    Radio.setCurrentModel("radio")
+    Sensor = Component.IVDef("Sensor", 1e-3, 1e-6, 1.2, 0.3, [Model("sensor", [x, y], sensor, ["ActiveCurrent", "InactiveCurrent"], vectorized = vectorized)])
+    Sensor.setCurrentModel("sensor")
+    Core = Component.IVDef("Core", 2e-4, 5e-8, 1.2, 0.5, [Model("rate", [y], rate, "DutyCycle", vectorized = vectorized)])
+    Core.setCurrentModel("rate")
+    Memory = Component.IVDef("Memory", 1e-4, 1e-8, 1.2, 0.1)
+    reg = VoltageRegulator.IVDef("Reg", 3.3, 1.2, 0.85, 1e-7, [Sensor, Core], [ComponentGroup.IVDef("Digital", 1.2, [Memory], [], [])], [])
+    top = ComponentGroup.PDef("Top", [Radio], [], [VoltageRegulator.PDef("Supply", 0.9, 1e-6, [], [], [reg])])
+    CF.updateHierarchy(top)
+    return top, x, y, [Radio, Sensor, Core, reg]
+
+@pytest.mark.parametrize("vectorized", [True, False])
+def test_sweep(vectorized):
+    results = []
+    rejections = []
+    for method in ("loop", "batched"):
+        top, x, y, nodes = _system(vectorized)
+        Log.resetRejections()
+        Log.countRejections()
+        try:
+            results.append(CF.variableSweep(top, x, method = method)[1])
+            results.append(CF.variableSweepND(top, [x, y], method = method, nodes = nodes)[1])
+        finally:
+            Log.countRejections(False)
+        results.append(np.array([top.getTotalPower()] + [node.getTotalPower() for node in nodes]))    # left at the last point
+        rejections.append({key: n for key, n in Log.getRejections().items() if n > 0})
+    for looped, batched in zip(results[:3], results[3:]):
+        assert np.array_equal(looped, batched)
+    assert rejections[0] == rejections[1] and ("Radio", "DutyCycle") in rejections[0] and ("Sensor", "ActiveCurrent") in rejections[0]
+
+class _Messages(logging.Handler):
+    def __init__(self):
+        logging.Handler.__init__(self)
+        self.messages = []
+
+    def emit(self, record):
+        self.messages.append(record.getMessage())
+
+def test_negative_active_power_warnings():
+    warnings = []
+    old = Log.getVerbosity()
+    for method in ("loop", "batched"):
+        top, x, y, nodes = _system(True)
+        handler = _Messages()
+        Log.logger.addHandler(handler)
+        Log.setVerbosity(Log.WARNING)
+        try:
+            CF.variableSweepND(top, [x, y], method = method)
+        finally:
+            Log.logger.removeHandler(handler)
+            Log.setVerbosity(old)
+        warnings.append(sorted(message for message in handler.messages if "applied anyway" in message))
+    assert warnings[0] == warnings[1] and len(warnings[0]) > 0